@@ -0,0 +1,45 @@
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+
+class Benchmark:
+    def __init__(
+        self,
+        group: str,
+        name: str,
+        params: dict[str, Any],
+        setup: Callable[[], Callable[[], Any]],
+    ) -> None:
+        self.group = group
+        self.name = name
+        self.params = params
+        self.setup = setup
+
+    @property
+    def full_name(self) -> str:
+        params = ",".join(f"{key}={value}" for key, value in self.params.items())
+        return f"{self.group}.{self.name}[{params}]"
+
+
+def measure(benchmark: Benchmark, repeat: int = 5, number: int = 1) -> dict:
+    timings = np.zeros(repeat)
+    for i in range(repeat):
+        run = benchmark.setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        timings[i] = (time.perf_counter() - start) / number
+    return {
+        "group": benchmark.group,
+        "name": benchmark.name,
+        "full_name": benchmark.full_name,
+        "params": benchmark.params,
+        "repeat": repeat,
+        "number": number,
+        "min": float(timings.min()),
+        "median": float(np.median(timings)),
+        "mean": float(timings.mean()),
+        "std": float(timings.std()),
+    }
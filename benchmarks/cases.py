@@ -0,0 +1,385 @@
+import itertools
+import os
+from functools import partial
+from typing import Any, Callable
+
+import numpy as np
+from hydra import compose, initialize_config_dir
+from omegaconf import DictConfig
+
+from benchmarks.benchmark import Benchmark
+from tsg.linspace_info import LinspaceInfo
+from tsg.main import get_generation_method, get_process_storage
+from tsg.main import main as run_main
+from tsg.process.ets_process_resources.ets_process_builder import ETSProcessBuilder
+from tsg.process.process_storage import ALL_PROCESSES, ProcessStorage
+from tsg.scheduler.scheduler import Scheduler
+from tsg.scheduler.scheduler_storage import SchedulerStorage
+from tsg.source_data_sampling.point_clustering import cluster_points
+from tsg.time_series_generator import TimeSeriesGenerator
+from tsg.utils.result_writer import (
+    get_parameters_path,
+    get_values_path,
+    save_parameters,
+    save_values,
+)
+from tsg.utils.utils import get_config_path
+
+SEED = 0
+SEASONAL_LAG = 12
+PROCESS_MIXES = {
+    "all": list(ALL_PROCESSES.keys()),
+    "noise": ["white_noise"],
+    "walks": ["random_walk", "simple_random_walk"],
+    "ets": [
+        "simple_exponential_smoothing",
+        "double_exponential_smoothing",
+        "triple_exponential_smoothing",
+    ],
+}
+GENERATION_METHODS = ["random_method", "aggregation_method", "parametrization_method"]
+METADATA_FORMATS = ["json", "ndjson"]
+VALUES_FORMATS = ["csv", "npy", "memmap", "chunked"]
+CLUSTERING_METHODS = ["kmeans", "minibatch", "sample"]
+
+
+def get_sizes(quick: bool) -> dict[str, list[int]]:
+    if quick:
+        return {"num_series": [100], "ts_size": [100], "clusters": [2]}
+    return {"num_series": [100, 1000], "ts_size": [100, 1000], "clusters": [2, 10]}
+
+
+def get_config(overrides: list[str] | None = None) -> DictConfig:
+    with initialize_config_dir(version_base="1.2", config_dir=get_config_path()):
+        return compose(config_name="config", overrides=overrides or [])
+
+
+def get_process_storage_for(
+    process_mix: str, generation_method: str = "random_method"
+) -> tuple[LinspaceInfo, ProcessStorage]:
+    cfg = get_config(
+        [
+            f"scheduler.process_list=[{','.join(PROCESS_MIXES[process_mix])}]",
+            f"generation.generation_method={generation_method}",
+        ]
+    )
+    linspace_info = LinspaceInfo(0.0, 100.0, cfg.linspace_info.linspace_parts)
+    method = get_generation_method(cfg, linspace_info)
+    return linspace_info, get_process_storage(cfg, linspace_info, method)
+
+
+def get_source_points(num_points: int) -> np.ndarray:
+    return np.random.default_rng(SEED).uniform(1.0, 10.0, (num_points, 3))
+
+
+def get_process_benchmarks(sizes: dict[str, list[int]]) -> list[Benchmark]:
+    benchmarks = []
+    linspace_info, process_storage = get_process_storage_for("all")
+    for process_name, ts_size in itertools.product(ALL_PROCESSES, sizes["ts_size"]):
+        process = process_storage.get_processes([process_name])[0]
+
+        def setup_series(process=process, ts_size=ts_size) -> Callable[[], Any]:
+            rng = np.random.default_rng(SEED)
+            data = (ts_size, process.parameters_generator.generate_parameters(rng=rng))
+            return lambda: process.generate_time_series(data, rng=rng)
+
+        benchmarks.append(
+            Benchmark(
+                "process",
+                "generate_time_series",
+                {"process": process_name, "ts_size": ts_size},
+                setup_series,
+            )
+        )
+        for num_series in sizes["num_series"]:
+
+            def setup_batch(
+                process=process, ts_size=ts_size, num_series=num_series
+            ) -> Callable[[], Any]:
+                rng = np.random.default_rng(SEED)
+                parameters = process.parameters_generator.generate_batch_parameters(
+                    num_series, rng=rng
+                )
+                return lambda: process.generate_batch(ts_size, parameters, rng=rng)
+
+            benchmarks.append(
+                Benchmark(
+                    "process",
+                    "generate_batch",
+                    {
+                        "process": process_name,
+                        "ts_size": ts_size,
+                        "num_series": num_series,
+                    },
+                    setup_batch,
+                )
+            )
+    return benchmarks
+
+
+def get_ets_benchmarks(sizes: dict[str, list[int]]) -> list[Benchmark]:
+    benchmarks = []
+    for ts_size, batch_size in itertools.product(
+        sizes["ts_size"], [None, *sizes["num_series"]]
+    ):
+
+        def setup(ts_size=ts_size, batch_size=batch_size) -> Callable[[], Any]:
+            rng = np.random.default_rng(SEED)
+            num_rows = 1 if batch_size is None else batch_size
+            init_shape = (
+                (SEASONAL_LAG,) if batch_size is None else (num_rows, SEASONAL_LAG)
+            )
+
+            def run() -> Any:
+                builder = ETSProcessBuilder(ts_size, batch_size=batch_size, rng=rng)
+                long_term = builder.set_long_term(1.0, 0.1)
+                builder.set_trend(0.0, 0.05)
+                builder.set_seasonal(SEASONAL_LAG, rng.normal(size=init_shape), 0.05)
+                builder.set_long_term(1.0, 0.1, add_component_indexes=[long_term])
+                return builder.generate_values()
+
+            return run
+
+        benchmarks.append(
+            Benchmark(
+                "ets_process_builder",
+                "generate_values",
+                {"ts_size": ts_size, "batch_size": batch_size},
+                setup,
+            )
+        )
+    return benchmarks
+
+
+def get_scheduler_benchmarks(sizes: dict[str, list[int]]) -> list[Benchmark]:
+    benchmarks = []
+    for generation_method, stable_parameters, ts_size, num_series in itertools.product(
+        GENERATION_METHODS, [True, False], sizes["ts_size"], sizes["num_series"]
+    ):
+        params = {
+            "generation_method": generation_method,
+            "stable_parameters": stable_parameters,
+            "ts_size": ts_size,
+            "num_series": num_series,
+        }
+
+        def get_scheduler(
+            generation_method=generation_method,
+            stable_parameters=stable_parameters,
+            ts_size=ts_size,
+        ) -> tuple[Scheduler, np.random.Generator]:
+            linspace_info, process_storage = get_process_storage_for(
+                "all", generation_method
+            )
+            rng = np.random.default_rng(SEED)
+            scheduler = Scheduler(
+                num_steps=ts_size,
+                linspace_info=linspace_info,
+                process_storage=process_storage,
+                stable_parameters=stable_parameters,
+                rng=rng,
+            )
+            return scheduler, rng
+
+        def setup_schedule(
+            get_scheduler=get_scheduler, num_series=num_series
+        ) -> Callable[[], Any]:
+            scheduler, rng = get_scheduler()
+            source_points = get_source_points(num_series)
+            return lambda: [
+                scheduler.generate_schedule(source_data=source_data, rng=rng)
+                for source_data in source_points
+            ]
+
+        def setup_schedule_batch(
+            get_scheduler=get_scheduler, num_series=num_series
+        ) -> Callable[[], Any]:
+            scheduler, rng = get_scheduler()
+            source_points = get_source_points(num_series)
+            return lambda: scheduler.generate_schedule_batch(
+                num_series, source_data=source_points, rng=rng
+            )
+
+        benchmarks.append(
+            Benchmark("scheduler", "generate_schedule", params, setup_schedule)
+        )
+        benchmarks.append(
+            Benchmark(
+                "scheduler", "generate_schedule_batch", params, setup_schedule_batch
+            )
+        )
+    return benchmarks
+
+
+def get_clustering_benchmarks(sizes: dict[str, list[int]]) -> list[Benchmark]:
+    benchmarks = []
+    cfg = get_config()
+    for num_series, clusters in itertools.product(
+        sizes["num_series"], sizes["clusters"]
+    ):
+        params = {"num_series": num_series, "clusters": clusters}
+
+        def setup_clustering(
+            num_series=num_series, clusters=clusters, method="kmeans"
+        ) -> Callable[[], Any]:
+            source_points = get_source_points(num_series)
+            rng = np.random.default_rng(SEED)
+            return lambda: cluster_points(
+                source_points, clusters, rng=rng, method=method
+            )
+
+        def setup_storage(
+            num_series=num_series, clusters=clusters
+        ) -> Callable[[], Any]:
+            linspace_info, process_storage = get_process_storage_for("all")
+            source_points = get_source_points(num_series)
+            labels = np.arange(num_series) % clusters
+            rng = np.random.default_rng(SEED)
+            return lambda: SchedulerStorage(
+                num_steps=cfg.generation.ts_size,
+                cfg_scheduler=cfg.scheduler,
+                linspace_info=linspace_info,
+                process_storage=process_storage,
+                source_points=source_points,
+                clusters=labels,
+                rng=rng,
+            )
+
+        for method in CLUSTERING_METHODS:
+            benchmarks.append(
+                Benchmark(
+                    "clustering",
+                    "cluster_points",
+                    {**params, "method": method},
+                    partial(setup_clustering, method=method),
+                )
+            )
+        benchmarks.append(
+            Benchmark("scheduler_storage", "create_storage", params, setup_storage)
+        )
+    return benchmarks
+
+
+def get_writer_benchmarks(sizes: dict[str, list[int]], folder: str) -> list[Benchmark]:
+    benchmarks = []
+    for num_series, ts_size in itertools.product(sizes["num_series"], sizes["ts_size"]):
+
+        def get_generated(
+            num_series=num_series, ts_size=ts_size
+        ) -> tuple[TimeSeriesGenerator, np.ndarray, list]:
+            cfg = get_config(
+                [
+                    f"generation.ts_number={num_series}",
+                    f"generation.ts_size={ts_size}",
+                    f"generation.seed={SEED}",
+                ]
+            )
+            linspace_info, process_storage = get_process_storage_for("all")
+            generator = TimeSeriesGenerator(cfg, linspace_info, process_storage)
+            ts_array, ts_list = generator.generate_all()
+            return generator, ts_array, ts_list
+
+        for metadata_format in METADATA_FORMATS:
+
+            def setup_parameters(
+                get_generated=get_generated, metadata_format=metadata_format
+            ) -> Callable[[], Any]:
+                generator, _, ts_list = get_generated()
+                path = get_parameters_path(folder, "generation.json", metadata_format)
+                process_names = generator.process_storage.get_process_names()
+                return lambda: save_parameters(
+                    ts_list, path, metadata_format, process_names
+                )
+
+            benchmarks.append(
+                Benchmark(
+                    "result_writer",
+                    "save_parameters",
+                    {
+                        "num_series": num_series,
+                        "ts_size": ts_size,
+                        "metadata_format": metadata_format,
+                    },
+                    setup_parameters,
+                )
+            )
+        for values_format in VALUES_FORMATS:
+
+            def setup_values(
+                get_generated=get_generated, values_format=values_format
+            ) -> Callable[[], Any]:
+                _, ts_array, _ = get_generated()
+                path = get_values_path(folder, "values.csv", values_format)
+                return lambda: save_values(ts_array, path, values_format)
+
+            benchmarks.append(
+                Benchmark(
+                    "result_writer",
+                    "save_values",
+                    {
+                        "num_series": num_series,
+                        "ts_size": ts_size,
+                        "values_format": values_format,
+                    },
+                    setup_values,
+                )
+            )
+    return benchmarks
+
+
+def get_main_benchmarks(sizes: dict[str, list[int]], folder: str) -> list[Benchmark]:
+    benchmarks = []
+    for (
+        num_series,
+        ts_size,
+        sample_points,
+        generation_method,
+        process_mix,
+    ) in itertools.product(
+        sizes["num_series"],
+        sizes["ts_size"],
+        [True, False],
+        GENERATION_METHODS,
+        PROCESS_MIXES,
+    ):
+        overrides = [
+            f"generation.ts_number={num_series}",
+            f"generation.ts_size={ts_size}",
+            f"generation.sample_points={sample_points}",
+            f"generation.generation_method={generation_method}",
+            f"generation.seed={SEED}",
+            f"generation.save_data_folder={os.path.join(folder, 'main')}",
+            f"scheduler.process_list=[{','.join(PROCESS_MIXES[process_mix])}]",
+        ]
+
+        def setup(overrides=overrides) -> Callable[[], Any]:
+            cfg = get_config(overrides)
+            return lambda: run_main(cfg)
+
+        benchmarks.append(
+            Benchmark(
+                "main",
+                "pipeline",
+                {
+                    "num_series": num_series,
+                    "ts_size": ts_size,
+                    "sample_points": sample_points,
+                    "generation_method": generation_method,
+                    "process_mix": process_mix,
+                },
+                setup,
+            )
+        )
+    return benchmarks
+
+
+def get_benchmarks(folder: str, quick: bool = False) -> list[Benchmark]:
+    sizes = get_sizes(quick)
+    return [
+        *get_process_benchmarks(sizes),
+        *get_ets_benchmarks(sizes),
+        *get_scheduler_benchmarks(sizes),
+        *get_clustering_benchmarks(sizes),
+        *get_writer_benchmarks(sizes, folder),
+        *get_main_benchmarks(sizes, folder),
+    ]
@@ -0,0 +1,113 @@
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.benchmark import measure
+from benchmarks.cases import get_benchmarks
+from tsg.utils.utils import get_project_path
+
+DEFAULT_RESULTS_FOLDER = os.path.join(get_project_path(), "benchmarks", "results")
+REGRESSION_THRESHOLD = 1.1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run tsg benchmarks")
+    parser.add_argument("--output", default=None, help="path of the result json")
+    parser.add_argument("--filter", default="*", help="glob over benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=1)
+    parser.add_argument("--quick", action="store_true", help="run the smallest sizes")
+    parser.add_argument("--compare", default=None, help="baseline result json")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    return parser.parse_args()
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=get_project_path(),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_metadata(args: argparse.Namespace) -> dict:
+    return {
+        "commit": get_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "number": args.number,
+        "quick": args.quick,
+    }
+
+
+def compare_results(
+    results: list[dict], baseline_path: str, threshold: float
+) -> list[dict]:
+    with open(baseline_path) as baseline_file:
+        baseline = {
+            result["full_name"]: result
+            for result in json.load(baseline_file)["results"]
+        }
+    regressions = []
+    for result in results:
+        if result["full_name"] not in baseline:
+            continue
+        ratio = result["median"] / baseline[result["full_name"]]["median"]
+        marker = " REGRESSION" if ratio > threshold else ""
+        print(f"{result['full_name']}: {ratio:.2f}x{marker}")
+        if ratio > threshold:
+            regressions.append({"full_name": result["full_name"], "ratio": ratio})
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="tsg_bench_") as folder:
+        benchmarks = [
+            benchmark
+            for benchmark in get_benchmarks(folder, quick=args.quick)
+            if fnmatch.fnmatch(benchmark.full_name, args.filter)
+        ]
+        for i, benchmark in enumerate(benchmarks):
+            result = measure(benchmark, repeat=args.repeat, number=args.number)
+            print(
+                f"[{i + 1}/{len(benchmarks)}] {benchmark.full_name}: "
+                f"median {result['median'] * 1e3:.3f} ms"
+            )
+            results.append(result)
+    output = args.output
+    if output is None:
+        os.makedirs(DEFAULT_RESULTS_FOLDER, exist_ok=True)
+        name = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(DEFAULT_RESULTS_FOLDER, f"{name}.json")
+    report = {"metadata": get_metadata(args), "results": results}
+    if args.compare is not None:
+        report["regressions"] = compare_results(results, args.compare, args.threshold)
+    with open(output, "w") as output_file:
+        output_file.write(json.dumps(report, indent=4))
+    print(f"Results saved to {output}")
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from hydra import compose, initialize
+
+from tsg.main import main
+from tsg.time_series_generator import TimeSeriesGenerator
+from tsg.utils.result_writer import (
+    get_parameters_path,
+    get_values_path,
+    load_parameters,
+    load_values,
+)
+
+
+class Interrupt(Exception):
+    pass
+
+
+def get_interrupting_generate_range(num_calls):
+    generate_range = TimeSeriesGenerator.generate_range
+    calls = []
+
+    def interrupting_generate_range(self, *args, **kwargs):
+        calls.append(None)
+        if len(calls) > num_calls:
+            raise Interrupt
+        return generate_range(self, *args, **kwargs)
+
+    return interrupting_generate_range
+
+
+@pytest.mark.parametrize(
+    "parallel, metadata_format, values_format, write_queue_size",
+    [
+        (False, "json", "csv", 0),
+        (False, "ndjson", "npy", 2),
+        (True, "ndjson", "memmap", 2),
+        (False, "json", "chunked", 1),
+    ],
+)
+def test_resume_from_checkpoint(
+    tmp_path, monkeypatch, parallel, metadata_format, values_format, write_queue_size
+):
+    overrides = [
+        "generation.ts_number=11",
+        "generation.ts_size=20",
+        "generation.shard_size=2",
+        "generation.num_workers=1",
+        f"generation.parallel={parallel}",
+        f"generation.metadata_format={metadata_format}",
+        f"generation.values_format={values_format}",
+        f"generation.write_queue_size={write_queue_size}",
+        "clustering.clusters=3",
+    ]
+    resumed_folder = str(tmp_path / "resumed")
+    checkpoint_path = os.path.join(resumed_folder, "checkpoint.json")
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(
+            config_name="config",
+            overrides=overrides
+            + [
+                f"generation.save_data_folder={resumed_folder}",
+                "generation.chunk_size=3",
+                "generation.checkpoint=True",
+            ],
+        )
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                TimeSeriesGenerator,
+                "generate_range",
+                get_interrupting_generate_range(3),
+            )
+            with pytest.raises(Interrupt):
+                main(cfg)
+        with open(checkpoint_path) as state_file:
+            state = json.load(state_file)
+        assert 0 < state["start_index"] < 11
+        main(cfg)
+        assert not os.path.exists(checkpoint_path)
+
+        full_folder = str(tmp_path / "full")
+        main(
+            compose(
+                config_name="config",
+                overrides=overrides
+                + [
+                    f"generation.save_data_folder={full_folder}",
+                    f"generation.seed={state['seed']}",
+                ],
+            )
+        )
+    parameters_name = os.path.basename(
+        get_parameters_path("", "generation.json", metadata_format)
+    )
+    values_name = os.path.basename(get_values_path("", "values.csv", values_format))
+    assert load_parameters(
+        os.path.join(resumed_folder, parameters_name), metadata_format
+    ) == load_parameters(os.path.join(full_folder, parameters_name), metadata_format)
+    np.testing.assert_array_equal(
+        load_values(
+            os.path.join(resumed_folder, values_name),
+            values_format,
+            concatenate=True,
+        ),
+        load_values(
+            os.path.join(full_folder, values_name), values_format, concatenate=True
+        ),
+    )
+
+
+def test_resume_with_different_execution_settings(tmp_path, monkeypatch):
+    overrides = [
+        "generation.ts_number=11",
+        "generation.ts_size=20",
+        "generation.shard_size=2",
+        "generation.checkpoint=True",
+        "generation.metadata_format=ndjson",
+        "generation.values_format=npy",
+        f"generation.save_data_folder={tmp_path}",
+    ]
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                TimeSeriesGenerator,
+                "generate_range",
+                get_interrupting_generate_range(2),
+            )
+            with pytest.raises(Interrupt):
+                main(
+                    compose(
+                        config_name="config",
+                        overrides=overrides
+                        + [
+                            "generation.parallel=False",
+                            "generation.num_workers=1",
+                            "generation.chunk_size=2",
+                            "generation.write_queue_size=0",
+                        ],
+                    )
+                )
+        main(
+            compose(
+                config_name="config",
+                overrides=overrides
+                + [
+                    "generation.parallel=True",
+                    "generation.num_workers=2",
+                    "generation.chunk_size=3",
+                    "generation.write_queue_size=2",
+                    "generation.profile=True",
+                ],
+            )
+        )
+    assert not os.path.exists(os.path.join(tmp_path, "checkpoint.json"))
+    assert len(load_parameters(str(tmp_path / "generation.ndjson"), "ndjson")) == 11
+    assert load_values(str(tmp_path / "values.npy"), "npy").shape == (11, 20)
+
+
+def test_checkpoint_config_mismatch(tmp_path, monkeypatch):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        overrides = [
+            "generation.chunk_size=2",
+            "generation.shard_size=2",
+            "generation.checkpoint=True",
+            f"generation.save_data_folder={tmp_path}",
+        ]
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                TimeSeriesGenerator,
+                "generate_range",
+                get_interrupting_generate_range(1),
+            )
+            with pytest.raises(Interrupt):
+                main(compose(config_name="config", overrides=overrides))
+        with pytest.raises(ValueError):
+            main(
+                compose(
+                    config_name="config",
+                    overrides=overrides + ["generation.ts_size=50"],
+                )
+            )
+
+
+if __name__ == "__main__":
+    pytest.main()
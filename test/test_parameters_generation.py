@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from tsg.linspace_info import LinspaceInfo
+from tsg.parameters_generation import ALL_GENERATION_METHODS
+from tsg.parameters_generation.parameter_types import (
+    CoefficientType,
+    MeanType,
+    StdType,
+    get_parameter_specs,
+)
+
+GENERATOR_LINSPACE = LinspaceInfo(0.0, 100.0, 100)
+PARAMETER_SPECS = get_parameter_specs(
+    [MeanType(), StdType(), CoefficientType(constraints=np.array([0.0, 0.3]))]
+)
+
+
+@pytest.mark.parametrize("method_name", list(ALL_GENERATION_METHODS.keys()))
+def test_generate_batch_parameters(method_name):
+    method = ALL_GENERATION_METHODS[method_name](GENERATOR_LINSPACE)
+    source_data = np.random.default_rng(0).uniform(1.0, 10.0, (6, 3))
+    parameters = method.generate_batch_parameters(
+        PARAMETER_SPECS, 6, source_data, np.random.default_rng(1)
+    )
+    assert parameters.shape == (6, 3)
+    assert np.all(parameters[:, 1] > 0)
+    if method_name == "random_method":
+        assert np.all((parameters[:, 2] >= 0.0) & (parameters[:, 2] <= 0.3))
+        return
+    expected = np.array(
+        [
+            method.generate_all_parameters(PARAMETER_SPECS, source_data[i])
+            for i in range(6)
+        ]
+    )
+    np.testing.assert_allclose(parameters[:, [0, 2]], expected[:, [0, 2]])
+
+
+def test_generate_batch_std():
+    std = GENERATOR_LINSPACE.generate_batch_std(
+        1000, source_values=np.full(1000, 0.5), rng=np.random.default_rng(0)
+    )
+    assert std.shape == (1000,)
+    assert np.all(std > 0)
+    assert abs(std.mean() - 1.5 * GENERATOR_LINSPACE.step) < 0.1
+
+
+def test_parameter_specs():
+    assert PARAMETER_SPECS["kind"].tolist() == [
+        MeanType.kind,
+        StdType.kind,
+        CoefficientType.kind,
+    ]
+    assert PARAMETER_SPECS["high"][2] == 0.3
+    with pytest.raises(ValueError):
+        PARAMETER_SPECS["low"][0] = 1.0
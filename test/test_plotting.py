@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from tsg.utils.plotting import load_plot_data, save_plot, save_plot_data
+
+
+def test_plot_data(tmp_path):
+    rng = np.random.default_rng(0)
+    coordinates = rng.uniform(0.0, 2.0, (20, 3))
+    clusters = rng.integers(0, 3, 20)
+    ts_array = rng.normal(size=(20, 30))
+    plot_data_path = str(tmp_path / "plot_data.npz")
+    save_plot_data(plot_data_path, coordinates, clusters, (0.0, 2.0), 1.0, ts_array)
+    plot_data = load_plot_data(plot_data_path)
+    np.testing.assert_array_equal(plot_data[0], coordinates[:5])
+    np.testing.assert_array_equal(plot_data[1], clusters[:5])
+    assert plot_data[2:4] == ((0.0, 2.0), 1.0)
+    np.testing.assert_array_equal(plot_data[4], ts_array[:5])
+    pytest.importorskip("matplotlib").use("Agg")
+    save_plot(*plot_data, str(tmp_path / "plot.png"))
+    assert (tmp_path / "plot.png").stat().st_size > 0
+
+
+def test_generation_does_not_import_plotting():
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, tsg.main; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    for module in ("matplotlib", "mpl_toolkits", "networkx"):
+        assert module not in modules
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+
+from tsg.source_data_sampling.point_clustering import assign_points, cluster_points
+
+
+@pytest.mark.parametrize("method", ["kmeans", "minibatch", "sample"])
+def test_cluster_points(method):
+    rng = np.random.default_rng(0)
+    points = np.vstack(
+        [rng.normal(center, 0.1, (200, 3)) for center in (1.0, 5.0, 9.0)]
+    )
+    clusters = cluster_points(
+        points, 3, rng=rng, method=method, sample_size=100, batch_size=64
+    )
+    assert clusters.shape == (600,)
+    assert len(np.unique(clusters)) == 3
+    for i in range(3):
+        assert len(np.unique(clusters[i * 200 : (i + 1) * 200])) == 1
+
+
+def test_cluster_points_unknown_method():
+    with pytest.raises(ValueError):
+        cluster_points(np.zeros((10, 3)), 2, method="unknown")
+
+
+def test_assign_points():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(1.0, 10.0, (1000, 3))
+    model = KMeans(n_clusters=4, n_init="auto", random_state=0).fit(points)
+    np.testing.assert_array_equal(
+        assign_points(points, model.cluster_centers_, chunk_size=128),
+        model.predict(points),
+    )
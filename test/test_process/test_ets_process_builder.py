@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from tsg.process.ets_process_resources.ets_component import ETSComponent, lag_filter
+from tsg.process.ets_process_resources.ets_process_builder import ETSProcessBuilder
+
+
+def recurrence(increments, init_values, lag):
+    values = np.concatenate([init_values[:lag], np.zeros(len(increments))])
+    for i in range(len(increments)):
+        values[lag + i] = values[i] + increments[i]
+    return values[lag:]
+
+
+@pytest.mark.parametrize("lag", [1, 5, 12])
+@pytest.mark.parametrize("num_samples", [1, 7, 100])
+def test_lag_filter(lag, num_samples):
+    increments = np.random.normal(0.0, 1.0, size=(3, num_samples))
+    init_values = np.random.normal(0.0, 1.0, size=(3, lag))
+    values = lag_filter(increments, init_values, lag)
+    assert values.shape == (3, num_samples)
+    for i in range(3):
+        assert_allclose(values[i], recurrence(increments[i], init_values[i], lag))
+
+
+def test_ets_component_additional_values():
+    error = np.random.normal(0.0, 1.0, 50)
+    trend = ETSComponent(lag=1, init_values=np.array([0.5]), parameter=0.1, error=error)
+    long_term = ETSComponent(
+        lag=1,
+        init_values=np.array([2.0]),
+        parameter=0.3,
+        error=error,
+        additional_values=trend.values[None],
+    )
+    assert_allclose(
+        long_term.values, recurrence(0.3 * error + trend.values, np.array([2.0]), 1)
+    )
+
+
+def test_batch_builder():
+    ets_values = ETSProcessBuilder(30, batch_size=4)
+    ets_values.set_normal_error(mean=0.0, std=np.array([0.0, 1.0, 2.0, 3.0]))
+    assert_allclose(ets_values.components[0][0], np.zeros(30))
+    seasonal_index = ets_values.set_seasonal(
+        lag=12, init_values=np.ones((4, 12)), parameter=np.full(4, 0.5)
+    )
+    trend_index = ets_values.set_trend(init_value=np.zeros(4), parameter=0.1)
+    ets_values.set_long_term(
+        init_value=np.arange(4.0),
+        parameter=np.full(4, 0.2),
+        add_component_indexes=[trend_index],
+    )
+    assert seasonal_index == 1
+    values = ets_values.generate_values()
+    assert values.shape == (4, 30)
+    assert_allclose(values[0], np.ones(30))
+
+
+def test_builder_preallocation():
+    ets_values = ETSProcessBuilder(20, num_components=2)
+    ets_values.set_normal_error(mean=0.0, std=0.0)
+    first_index = ets_values.set_trend(init_value=1.0, parameter=0.1)
+    second_index = ets_values.set_trend(init_value=2.0, parameter=0.1)
+    assert (first_index, second_index) == (1, 2)
+    assert ets_values.components.shape[0] >= 3
+    out = np.zeros(40)
+    values = ets_values.generate_values(out=out[10:30])
+    assert values.base is out
+    assert_allclose(out[10:30], np.full(20, 3.0))
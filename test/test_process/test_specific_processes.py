@@ -8,8 +8,10 @@ from numpy import isclose
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.random_method import RandomMethod
 from tsg.process.process_storage import ProcessStorage
+from tsg.process.random_walk import RandomWalk
 from tsg.process.simple_random_walk import SimpleRandomWalk
 from tsg.time_series import TimeSeries
+from tsg.utils.rng import create_rng
 
 GENERATOR_LINSPACE = LinspaceInfo(0.0, 100.0, 100)
 
@@ -38,6 +40,44 @@ def test_generate_ts(process_list):
         assert len(time_series.values) == 100
 
 
+def test_parameters_cached(process_list):
+    for process in process_list.processes.values():
+        assert process.parameters is process.parameters
+        assert [
+            (parameter.kind, *parameter.constraints) for parameter in process.parameters
+        ] == process.parameter_specs.tolist()
+
+
+def test_fill_values_from_state_tail(process_list):
+    previous_values = np.random.default_rng(0).uniform(1, 2, 30)
+    for process in process_list.processes.values():
+        parameters = process.parameters_generator.generate_parameters(
+            rng=np.random.default_rng(1)
+        )
+        full_values = np.empty(20)
+        tail_values = np.empty(20)
+        process.fill_values(
+            full_values, parameters, previous_values, rng=np.random.default_rng(2)
+        )
+        process.fill_values(
+            tail_values,
+            parameters,
+            previous_values[-process.state_size :],
+            rng=np.random.default_rng(2),
+        )
+        np.testing.assert_array_equal(full_values, tail_values)
+
+
+def test_generate_ts_global_seed(process_list):
+    for process in process_list.processes.values():
+        results = []
+        for _ in range(2):
+            np.random.seed(0)
+            data = (50, process.parameters_generator.generate_parameters())
+            results.append(process.generate_time_series(data)[0].get_values())
+        np.testing.assert_array_equal(results[0], results[1])
+
+
 def test_generate_ts_with_values(process_list):
     for process in process_list.processes.values():
         previous_values = np.random.uniform(0, 1, 10)
@@ -48,6 +88,64 @@ def test_generate_ts_with_values(process_list):
         assert len(time_series.values) == 100
 
 
+def test_generate_batch(process_list):
+    for process in process_list.processes.values():
+        parameters = np.vstack(
+            [process.parameters_generator.generate_parameters() for _ in range(4)]
+        )
+        batch_values = process.generate_batch(50, parameters)
+        assert batch_values.shape == (4, 50)
+        previous_values = np.random.uniform(1, 2, size=(4, 20))
+        batch_values = process.generate_batch(50, parameters, previous_values)
+        assert batch_values.shape == (4, 50)
+        for dtype in (np.float32, np.float64):
+            batch_values = process.generate_batch(50, parameters, dtype=dtype)
+            assert batch_values.dtype == dtype
+
+
+def test_generate_ts_reproducible(process_list):
+    for process in process_list.processes.values():
+        results = []
+        for _ in range(2):
+            rng = create_rng(seed=7, bit_generator="Philox")
+            data = (50, process.parameters_generator.generate_parameters(rng=rng))
+            time_series, _ = process.generate_time_series(data, rng=rng)
+            results.append(time_series.get_values())
+        np.testing.assert_array_equal(results[0], results[1])
+
+
+def test_fill_values(process_list):
+    for process in process_list.processes.values():
+        parameters = process.parameters_generator.generate_parameters()
+        previous_values = np.random.uniform(1, 2, 20)
+        out = np.zeros(shape=(2, 60))
+        process.fill_values(
+            out[1, 10:], parameters, previous_values, rng=create_rng(seed=3)
+        )
+        time_series, _ = process.generate_time_series(
+            (50, parameters), previous_values, rng=create_rng(seed=3)
+        )
+        np.testing.assert_array_equal(out[1, 10:], time_series.get_values())
+        assert not out[0].any() and not out[1, :10].any()
+
+
+def test_generate_batch_init_values(process_list):
+    source_data = np.random.default_rng(0).uniform(1.0, 10.0, (6, 3))
+    for process in process_list.processes.values():
+        generator = process.parameters_generator
+        batch_init_values = generator.generate_batch_init_values(
+            6, source_data=source_data, rng=create_rng(seed=3)
+        )
+        rng = create_rng(seed=3)
+        init_values = np.array(
+            [
+                generator.generate_init_values(source_data=point, rng=rng)
+                for point in source_data
+            ]
+        )
+        np.testing.assert_allclose(batch_init_values, init_values)
+
+
 def test_random_walk():
     with hydra.initialize(
         version_base="1.2", config_path=os.path.join("..", "..", "config")
@@ -69,5 +167,27 @@ def test_random_walk():
             assert isclose(diff, 1.0)  # Assuming fixed_walk is set to 1.0
 
 
+def test_random_walk_batch():
+    start_values = np.array([0.0, 10.0, -5.0])
+    values = SimpleRandomWalk.walk(
+        start_values=start_values,
+        up_probability=np.array([0.0, 1.0, 0.5]),
+        walk=np.array([1.0, 2.0, 0.5]),
+        num_steps=20,
+    )
+    assert values.shape == (3, 20)
+    np.testing.assert_array_equal(values[:, 0], start_values)
+    np.testing.assert_allclose(values[0], -np.arange(20))
+    np.testing.assert_allclose(values[1], 10.0 + 2 * np.arange(20))
+    assert np.allclose(np.abs(np.diff(values[2])), 0.5)
+    values = RandomWalk.walk(
+        start_values=start_values,
+        std=np.zeros(3),
+        num_steps=20,
+        include_start=False,
+    )
+    np.testing.assert_array_equal(values, np.repeat(start_values[:, None], 20, axis=1))
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+from hydra import compose, initialize
+
+from tsg.main import main
+from tsg.utils.profiling import (
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    profile_process,
+    profile_stage,
+)
+
+
+def test_profiler():
+    profiler = enable_profiling()
+    try:
+        for _ in range(3):
+            with profile_stage("generation", items=10):
+                with profile_process("white_noise", items=10):
+                    pass
+        profiler.add_bytes("generation", 100)
+        report = profiler.get_report()
+    finally:
+        disable_profiling()
+    assert report["stages"]["generation"]["calls"] == 3
+    assert report["stages"]["generation"]["items"] == 30
+    assert report["stages"]["generation"]["bytes"] == 100
+    assert report["processes"]["white_noise"]["calls"] == 3
+    assert get_profiler() is None
+    with profile_stage("generation"):
+        pass
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_profile_parallel_main(tmp_path, batched):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(
+            config_name="config",
+            overrides=[
+                "generation.ts_number=10",
+                "generation.shard_size=3",
+                "generation.parallel=True",
+                "generation.num_workers=2",
+                f"generation.batched={batched}",
+                "generation.profile=True",
+                f"generation.save_data_folder={tmp_path}",
+            ],
+        )
+        main(cfg)
+    with open(os.path.join(tmp_path, cfg.generation.profile_name)) as report_file:
+        report = json.load(report_file)
+    assert report["stages"]["generation"]["wall_time"] > 0
+    assert report["stages"]["generation"]["calls"] == 4
+    assert report["stages"]["generation"]["items"] == 10
+    assert report["stages"]["schedule"]["items"] == 10
+    assert len(report["processes"]) > 0
+    assert get_profiler() is None
+
+
+if __name__ == "__main__":
+    pytest.main()
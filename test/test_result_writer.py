@@ -0,0 +1,324 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from hydra import compose, initialize
+
+from tsg.linspace_info import LinspaceInfo
+from tsg.main import main
+from tsg.parameters_generation.random_method import RandomMethod
+from tsg.process.process_storage import ProcessStorage
+from tsg.time_series_generator import TimeSeriesGenerator, get_mp_context
+from tsg.utils.result_writer import (
+    OFFSETS_SUFFIX,
+    AsyncChunkWriter,
+    ChunkWriter,
+    CsvValuesWriter,
+    JsonParametersWriter,
+    NdjsonParametersWriter,
+    NpyValuesWriter,
+    get_parameters_path,
+    get_parameters_writer,
+    get_values_path,
+    get_values_writer,
+    load_parameters,
+    load_parameters_record,
+    load_values,
+    load_values_head,
+    save_parameters,
+    save_values,
+)
+
+GENERATOR_LINSPACE = LinspaceInfo(0.0, 100.0, 100)
+
+
+@pytest.fixture
+def ts_generator():
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.ts_number = 7
+        cfg.generation.chunk_size = 3
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        return TimeSeriesGenerator(
+            cfg=cfg, linspace_info=GENERATOR_LINSPACE, process_storage=process_list
+        )
+
+
+def test_chunk_writer(ts_generator, tmp_path):
+    chunks = list(ts_generator.generate_chunks())
+    assert [start for start, _, _ in chunks] == [0, 3, 6]
+    ts_array = np.vstack([chunk_array for _, chunk_array, _ in chunks])
+    ts_list = [
+        schedule_batch.get_time_series(i, chunk_array[i])
+        for _, chunk_array, schedule_batch in chunks
+        for i in range(schedule_batch.num_series)
+    ]
+    save_parameters(ts_list, str(tmp_path / "full.json"))
+    save_values(ts_array, str(tmp_path / "full.csv"))
+    with ChunkWriter(
+        JsonParametersWriter(str(tmp_path / "chunked.json")),
+        CsvValuesWriter(str(tmp_path / "chunked.csv")),
+    ) as writer:
+        for start, chunk_array, schedule_batch in chunks:
+            writer.write(chunk_array, schedule_batch, start)
+    assert (tmp_path / "full.json").read_text() == (
+        tmp_path / "chunked.json"
+    ).read_text()
+    assert len(load_parameters(str(tmp_path / "chunked.json"))) == 7
+    np.testing.assert_array_equal(
+        load_values(str(tmp_path / "full.csv")),
+        load_values(str(tmp_path / "chunked.csv")),
+    )
+
+
+def test_async_chunk_writer(ts_generator, tmp_path):
+    chunks = list(ts_generator.generate_chunks())
+    with ChunkWriter(
+        NdjsonParametersWriter(
+            str(tmp_path / "sync.ndjson"),
+            ts_generator.process_storage.get_process_names(),
+        ),
+        NpyValuesWriter(str(tmp_path / "sync.npy"), (7, ts_generator.ts_size)),
+    ) as writer:
+        for start, chunk_array, schedule_batch in chunks:
+            writer.write(chunk_array, schedule_batch, start)
+    with AsyncChunkWriter(
+        NdjsonParametersWriter(
+            str(tmp_path / "async.ndjson"),
+            ts_generator.process_storage.get_process_names(),
+        ),
+        NpyValuesWriter(str(tmp_path / "async.npy"), (7, ts_generator.ts_size)),
+        queue_size=1,
+    ) as writer:
+        for start, chunk_array, schedule_batch in chunks:
+            writer.write(chunk_array, schedule_batch, start)
+    for suffix in (".ndjson", ".npy"):
+        assert (tmp_path / f"sync{suffix}").read_bytes() == (
+            tmp_path / f"async{suffix}"
+        ).read_bytes()
+
+
+def test_async_chunk_writer_error(ts_generator, tmp_path):
+    chunks = list(ts_generator.generate_chunks())
+    with pytest.raises(ValueError):
+        with AsyncChunkWriter(
+            JsonParametersWriter(str(tmp_path / "generation.json")),
+            CsvValuesWriter(str(tmp_path / "values.csv")),
+        ) as writer:
+            for start, chunk_array, schedule_batch in reversed(chunks):
+                writer.write(chunk_array, schedule_batch, start)
+
+
+@pytest.mark.parametrize("writer_class", [ChunkWriter, AsyncChunkWriter])
+def test_chunk_writer_not_finalized_on_error(ts_generator, tmp_path, writer_class):
+    parameters_path = str(tmp_path / "generation.json")
+    with pytest.raises(RuntimeError):
+        with writer_class(
+            JsonParametersWriter(parameters_path),
+            CsvValuesWriter(str(tmp_path / "values.csv")),
+        ) as writer:
+            for start, chunk_array, schedule_batch in ts_generator.generate_chunks():
+                writer.write(chunk_array, schedule_batch, start)
+                raise RuntimeError
+    with open(parameters_path) as parameters_file:
+        content = parameters_file.read()
+    assert content.startswith("{") and not content.endswith("}")
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(content)
+
+
+@pytest.mark.filterwarnings("error:.*use of fork.*:DeprecationWarning")
+def test_async_chunk_writer_parallel(tmp_path):
+    assert get_mp_context().get_start_method() != "fork"
+    overrides = [
+        "generation.ts_number=10",
+        "generation.seed=42",
+        "generation.shard_size=2",
+        "generation.chunk_size=3",
+        "generation.metadata_format=ndjson",
+        "generation.values_format=npy",
+    ]
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        for name, parallel, write_queue_size in [
+            ("serial", False, 0),
+            ("parallel", True, 2),
+        ]:
+            main(
+                compose(
+                    config_name="config",
+                    overrides=overrides
+                    + [
+                        f"generation.parallel={parallel}",
+                        "generation.num_workers=2",
+                        f"generation.write_queue_size={write_queue_size}",
+                        f"generation.save_data_folder={tmp_path / name}",
+                    ],
+                )
+            )
+    for file_name in ("generation.ndjson", "values.npy"):
+        assert (tmp_path / "serial" / file_name).read_bytes() == (
+            tmp_path / "parallel" / file_name
+        ).read_bytes()
+
+
+@pytest.mark.parametrize("values_format", ["csv", "npy", "memmap", "chunked"])
+def test_values_formats(ts_generator, tmp_path, values_format):
+    values_path = get_values_path(str(tmp_path), "values.csv", values_format)
+    chunks = list(ts_generator.generate_chunks())
+    shape = (ts_generator.get_iterations(), ts_generator.ts_size)
+    with get_values_writer(values_path, values_format, shape) as values_writer:
+        for _, chunk_array, _ in chunks:
+            values_writer.write(chunk_array)
+    values = load_values(values_path, values_format, concatenate=True)
+    ts_array = np.vstack([chunk_array for _, chunk_array, _ in chunks])
+    assert values.shape == shape
+    if values_format == "csv":
+        np.testing.assert_allclose(values, ts_array)
+    else:
+        np.testing.assert_array_equal(values, ts_array)
+    if values_format == "chunked":
+        chunks = load_values(values_path, values_format)
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert all(isinstance(chunk, np.memmap) for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "metadata_format, values_format",
+    [("json", "csv"), ("ndjson", "npy"), ("json", "memmap"), ("ndjson", "chunked")],
+)
+def test_resume_writers(ts_generator, tmp_path, metadata_format, values_format):
+    chunks = list(ts_generator.generate_chunks())
+    shape = (ts_generator.get_iterations(), ts_generator.ts_size)
+    process_names = ts_generator.process_storage.get_process_names()
+    paths = {}
+    for name in ("full", "resumed"):
+        paths[name] = (
+            get_parameters_path(str(tmp_path), f"{name}.json", metadata_format),
+            get_values_path(str(tmp_path), f"{name}.csv", values_format),
+        )
+    with ChunkWriter(
+        get_parameters_writer(paths["full"][0], metadata_format, process_names),
+        get_values_writer(paths["full"][1], values_format, shape),
+    ) as writer:
+        for start, chunk_array, schedule_batch in chunks:
+            writer.write(chunk_array, schedule_batch, start)
+    positions = []
+    with ChunkWriter(
+        get_parameters_writer(paths["resumed"][0], metadata_format, process_names),
+        get_values_writer(paths["resumed"][1], values_format, shape),
+        on_written=lambda stop, position: positions.append(position),
+    ) as writer:
+        for start, chunk_array, schedule_batch in chunks[:2]:
+            writer.write(chunk_array, schedule_batch, start)
+    with ChunkWriter(
+        get_parameters_writer(
+            paths["resumed"][0],
+            metadata_format,
+            process_names,
+            positions[0]["parameters"],
+        ),
+        get_values_writer(
+            paths["resumed"][1], values_format, shape, position=positions[0]["values"]
+        ),
+    ) as writer:
+        for start, chunk_array, schedule_batch in chunks[1:]:
+            writer.write(chunk_array, schedule_batch, start)
+    assert load_parameters(paths["resumed"][0], metadata_format) == load_parameters(
+        paths["full"][0], metadata_format
+    )
+    np.testing.assert_array_equal(
+        load_values(paths["resumed"][1], values_format, concatenate=True),
+        load_values(paths["full"][1], values_format, concatenate=True),
+    )
+    np.testing.assert_array_equal(
+        load_values_head(paths["resumed"][1], values_format, 4),
+        load_values(paths["full"][1], values_format, concatenate=True)[:4],
+    )
+    byte_paths = {name: [paths[name][0]] for name in paths}
+    if metadata_format == "ndjson":
+        for name in paths:
+            byte_paths[name].append(paths[name][0] + OFFSETS_SUFFIX)
+    if values_format != "chunked":
+        for name in paths:
+            byte_paths[name].append(paths[name][1])
+    for full_path, resumed_path in zip(byte_paths["full"], byte_paths["resumed"]):
+        with open(full_path, "rb") as full_file, open(
+            resumed_path, "rb"
+        ) as resumed_file:
+            assert full_file.read() == resumed_file.read()
+
+
+def test_memmap_header_written_on_close(tmp_path):
+    values_path = str(tmp_path / "values.dat")
+    ts_array = np.random.default_rng(0).normal(size=(6, 4))
+    with get_values_writer(values_path, "memmap", ts_array.shape) as values_writer:
+        for start in range(0, 6, 2):
+            values_writer.write(ts_array[start : start + 2])
+            values_writer.get_position()
+            assert not os.path.exists(values_path + ".json")
+    np.testing.assert_array_equal(load_values(values_path, "memmap"), ts_array)
+
+
+def test_resume_chunked_values_removes_stale_chunks(tmp_path):
+    values_path = str(tmp_path / "values")
+    ts_array = np.random.default_rng(0).normal(size=(10, 4))
+    positions = []
+    with get_values_writer(values_path, "chunked", ts_array.shape) as values_writer:
+        for start in range(0, 10, 2):
+            values_writer.write(ts_array[start : start + 2])
+            positions.append(values_writer.get_position())
+    with get_values_writer(
+        values_path, "chunked", ts_array.shape, position=positions[0]
+    ) as values_writer:
+        values_writer.write(ts_array[2:6])
+        values_writer.write(ts_array[6:])
+    chunks = load_values(values_path, "chunked")
+    assert [len(chunk) for chunk in chunks] == [2, 4, 4]
+    assert sorted(os.listdir(values_path)) == [
+        "chunk_000000.npy",
+        "chunk_000001.npy",
+        "chunk_000002.npy",
+        "index.json",
+    ]
+    np.testing.assert_array_equal(np.concatenate(chunks), ts_array)
+
+
+@pytest.mark.parametrize("values_format", ["csv", "npy", "memmap", "chunked"])
+def test_float32_values(tmp_path, values_format):
+    values_path = get_values_path(str(tmp_path), "values.csv", values_format)
+    ts_array = np.random.default_rng(0).normal(size=(4, 10)).astype(np.float32)
+    save_values(ts_array, values_path, values_format)
+    values = load_values(values_path, values_format, concatenate=True)
+    if values_format != "csv":
+        assert values.dtype == np.float32
+    np.testing.assert_array_equal(values.astype(np.float32), ts_array)
+
+
+def test_ndjson_parameters(ts_generator, tmp_path):
+    chunks = list(ts_generator.generate_chunks())
+    ts_list = [
+        schedule_batch.get_time_series(i, chunk_array[i])
+        for _, chunk_array, schedule_batch in chunks
+        for i in range(schedule_batch.num_series)
+    ]
+    process_names = ts_generator.process_storage.get_process_names()
+    parameters_path = str(tmp_path / "generation.ndjson")
+    with NdjsonParametersWriter(parameters_path, process_names) as parameters_writer:
+        for start, _, schedule_batch in chunks:
+            parameters_writer.write(schedule_batch, start)
+    save_parameters(ts_list, str(tmp_path / "generation.json"))
+    json_data = load_parameters(str(tmp_path / "generation.json"))
+    assert load_parameters(parameters_path, "ndjson") == json_data
+    record = load_parameters_record(parameters_path, 5)
+    assert record["id"] == 5
+    assert record["segments"] == json_data["ts_6"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,12 +1,15 @@
 import os
 
+import numpy as np
 import pytest
 from hydra import compose, initialize
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.random_method import RandomMethod
 from tsg.process.process_storage import ProcessStorage
+from tsg.scheduler.schedule_batch import ScheduleBatch
 from tsg.scheduler.scheduler import Scheduler
+from tsg.scheduler.scheduler_storage import SchedulerStorage, group_clusters
 
 GENERATOR_LINSPACE = LinspaceInfo(0.0, 100.0, 100)
 
@@ -94,5 +97,134 @@ def test_generate_schedule():
         )
 
 
+@pytest.mark.parametrize("stable_parameters", [True, False])
+def test_generate_schedule_batch(stable_parameters):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        scheduler = Scheduler(
+            num_steps=100,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            stable_parameters=stable_parameters,
+            rng=np.random.default_rng(0),
+        )
+        schedule_batch = scheduler.generate_schedule_batch(
+            8, rng=np.random.default_rng(1)
+        )
+        assert schedule_batch.num_series == 8
+        for i in range(schedule_batch.num_series):
+            segments = range(
+                schedule_batch.series_offsets[i], schedule_batch.series_offsets[i + 1]
+            )
+            lengths = schedule_batch.segment_lengths[segments]
+            assert lengths.sum() == 100
+            np.testing.assert_array_equal(
+                schedule_batch.segment_starts[segments], np.cumsum(lengths) - lengths
+            )
+        metadata = [
+            schedule_batch.get_metadata(i) for i in range(schedule_batch.num_series)
+        ]
+        restored = ScheduleBatch.from_metadata(
+            metadata, process_list.get_process_names()
+        )
+        assert restored.get_segment_records() == schedule_batch.get_segment_records()
+        assert (
+            sum(len(indexes) for indexes in schedule_batch.group_by_layout().values())
+            == 8
+        )
+
+
+def test_schedule_template():
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        scheduler = Scheduler(
+            num_steps=100,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            stable_parameters=True,
+            rng=np.random.default_rng(0),
+        )
+        template = scheduler.template
+        assert scheduler.template is template
+        assert template.is_stable
+        assert template.segment_lengths.sum() == 100
+        assert [process.name for process in template.processes] == [
+            process_name for _, process_name in scheduler.process_order
+        ]
+        scheduler.set_process_order([(100, "white_noise")])
+        assert scheduler.template is not template
+        assert scheduler.template.num_segments == 1
+
+
+@pytest.mark.parametrize("stable_parameters", [True, False])
+def test_scheduler_storage_schedule_batch(stable_parameters):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.scheduler.stable_parameters = stable_parameters
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        rng = np.random.default_rng(0)
+        scheduler_storage = SchedulerStorage(
+            num_steps=100,
+            cfg_scheduler=cfg.scheduler,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            source_points=rng.uniform(1.0, 10.0, (10, 3)),
+            clusters=np.array([0, 1, 2, 0, 1, 2, 2, 0, 1, 0]),
+            rng=rng,
+        )
+        point_indexes = np.arange(2, 10)
+        source_points, clusters = scheduler_storage.get_points(2, 10)
+        batches = []
+        series_indexes = []
+        for cluster, indexes in group_clusters(clusters).items():
+            batches.append(
+                scheduler_storage.get_scheduler(cluster).generate_schedule_batch(
+                    len(indexes), source_data=source_points[indexes], rng=rng
+                )
+            )
+            series_indexes.append(indexes)
+        schedule_batch = ScheduleBatch.scatter(
+            batches, series_indexes, process_list.get_process_names()
+        )
+        assert schedule_batch.num_series == len(point_indexes)
+        for i, point_index in enumerate(point_indexes):
+            scheduler = scheduler_storage.get_scheduler(
+                scheduler_storage.get_cluster(point_index)
+            )
+            layout = schedule_batch.get_layout(i)
+            if stable_parameters:
+                assert layout == tuple(
+                    (process_name, steps)
+                    for steps, process_name in scheduler.process_order
+                )
+            assert sum(steps for _, steps in layout) == 100
+        reversed_batch = ScheduleBatch.scatter(
+            [schedule_batch],
+            [np.arange(schedule_batch.num_series)[::-1]],
+            process_list.get_process_names(),
+        )
+        assert (
+            reversed_batch.get_segment_records()
+            == schedule_batch.get_segment_records()[::-1]
+        )
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,120 @@
+import os
+
+import hydra
+import numpy as np
+import pytest
+from hydra import compose, initialize
+from scipy.sparse.csgraph import connected_components
+
+from tsg.process.process_storage import ProcessStorage
+from tsg.scheduler.scheduler_storage import SchedulerStorage
+from tsg.source_data_sampling.graph_sampling_method import GraphSamplingMethod
+from tsg.source_data_sampling.point_clustering import cluster_points
+from tsg.source_data_sampling.source_point_stream import SourcePointStream
+from tsg.source_data_sampling.surface_sampling_method import SurfaceSamplingMethod
+from tsg.time_series_generator import TimeSeriesGenerator
+from tsg.utils.rng import create_rng
+
+
+def test_sample_graph():
+    graph = GraphSamplingMethod.sample_graph(100, 150, rng=np.random.default_rng(0))
+    assert graph.shape == (100, 100)
+    assert (graph != graph.T).nnz == 0
+    assert graph.diagonal().sum() == 0
+    assert 100 <= graph.nnz // 2 <= 150
+    assert connected_components(graph, directed=False)[0] == 1
+
+
+def test_get_nodes_coordinates():
+    graph = GraphSamplingMethod.sample_graph(500, 750, rng=np.random.default_rng(0))
+    coordinates = GraphSamplingMethod.get_nodes_coordinates(500, graph, seed=1)
+    assert coordinates.shape == (500, 3)
+    assert np.abs(coordinates).max() == 1.0
+    rows, columns = graph.nonzero()
+    edge_distances = np.linalg.norm(coordinates[rows] - coordinates[columns], axis=1)
+    random_distances = np.linalg.norm(
+        coordinates - coordinates[np.random.default_rng(2).permutation(500)], axis=1
+    )
+    assert edge_distances.mean() < random_distances.mean()
+
+
+def test_sample_source_data():
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        sampling_method = GraphSamplingMethod(cfg.linspace_info)
+        source_data, _ = sampling_method.sample_source_data(
+            50, rng=np.random.default_rng(0)
+        )
+        assert source_data.data_characteristics.shape == (50, 3)
+        assert source_data.data_graph.shape == (50, 50)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+def test_generate_from_graph_source_data(seed):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(
+            config_name="config",
+            overrides=["generation.ts_number=60", f"generation.seed={seed}"],
+        )
+        rng = create_rng(seed)
+        source_data, linspace_info = GraphSamplingMethod(
+            cfg.linspace_info
+        ).sample_source_data(cfg.generation.ts_number, rng=rng)
+        coordinates = source_data.data_characteristics
+        assert coordinates.min() >= 0.0
+        assert (linspace_info.start, linspace_info.stop) == (
+            coordinates.min(),
+            coordinates.max(),
+        )
+        process_storage = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=linspace_info,
+            generation_method=hydra.utils.instantiate(
+                cfg.parameters_generation_method.aggregation_method,
+                linspace_info=linspace_info,
+            ),
+        )
+        scheduler_storage = SchedulerStorage(
+            num_steps=cfg.generation.ts_size,
+            cfg_scheduler=cfg.scheduler,
+            linspace_info=linspace_info,
+            process_storage=process_storage,
+            source_points=coordinates,
+            clusters=cluster_points(coordinates, cfg.clustering.clusters, rng=rng),
+            rng=rng,
+        )
+        ts_array, ts_list = TimeSeriesGenerator(
+            cfg=cfg,
+            linspace_info=linspace_info,
+            process_storage=process_storage,
+            scheduler_storage=scheduler_storage,
+            rng=rng,
+        ).generate_all()
+        assert ts_array.shape == (cfg.generation.ts_number, cfg.generation.ts_size)
+        assert len(ts_list) == cfg.generation.ts_number
+        assert np.all(np.isfinite(ts_array))
+
+
+def test_source_point_stream():
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        point_stream = SourcePointStream(
+            sampling_method=SurfaceSamplingMethod(cfg.linspace_info),
+            num_points=1000,
+            n_clusters=3,
+            rng=np.random.default_rng(0),
+            sample_size=100,
+            chunk_size=64,
+        )
+        points, clusters = point_stream.get_points(0, 1000)
+        assert points.shape == (1000, 3)
+        assert set(np.unique(clusters)) <= set(point_stream.cluster_ids)
+        assert points.min() >= point_stream.border_values[0]
+        assert points.max() <= point_stream.border_values[1]
+        np.testing.assert_array_equal(points[:100], point_stream.sample_points)
+        np.testing.assert_array_equal(clusters[:100], point_stream.sample_clusters)
+        for start, stop in [(10, 20), (60, 70), (500, 1000), (999, 1000)]:
+            chunk_points, chunk_clusters = point_stream.get_points(start, stop)
+            np.testing.assert_array_equal(chunk_points, points[start:stop])
+            np.testing.assert_array_equal(chunk_clusters, clusters[start:stop])
@@ -1,5 +1,5 @@
 import pytest
-from numpy import array
+from numpy import array, zeros
 from numpy.testing import assert_array_equal
 
 from tsg.time_series import TimeSeries
@@ -20,5 +20,17 @@ def test_get_values():
     assert_array_equal(ts.get_values(0, 3), array([1.0, 2.0, 3.0]))
 
 
+def test_time_series_view():
+    values = zeros(shape=(2, 4))
+    ts = TimeSeries(4, values=values[1])
+    ts.get_segment(3)[...] = array([1.0, 2.0, 3.0])
+    ts.add_segment(("", (3, array([]))))
+    ts.add_values(array([4.0]), ("", (1, array([]))))
+    assert_array_equal(values[1], array([1.0, 2.0, 3.0, 4.0]))
+    assert ts.last_index == 4
+    assert len(ts.metadata) == 2
+    assert not hasattr(ts, "__dict__")
+
+
 if __name__ == "__main__":
     pytest.main()
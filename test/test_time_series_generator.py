@@ -7,6 +7,10 @@ from hydra import compose, initialize
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.random_method import RandomMethod
 from tsg.process.process_storage import ProcessStorage
+from tsg.scheduler.schedule_batch import ScheduleBatch
+from tsg.scheduler.scheduler_storage import LazySchedulerStorage, SchedulerStorage
+from tsg.source_data_sampling.source_point_stream import SourcePointStream
+from tsg.source_data_sampling.surface_sampling_method import SurfaceSamplingMethod
 from tsg.time_series_generator import TimeSeriesGenerator
 
 GENERATOR_LINSPACE = LinspaceInfo(0.0, 100.0, 100)
@@ -29,5 +33,217 @@ def test_generate_all():
         assert ts_array.shape == (cfg.generation.ts_number, cfg.generation.ts_size)
 
 
+@pytest.mark.parametrize("batched", [True, False])
+def test_generate_all_modes(batched):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.batched = batched
+        cfg.scheduler.single_schedule = True
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        ts_generator = TimeSeriesGenerator(
+            cfg=cfg, linspace_info=GENERATOR_LINSPACE, process_storage=process_list
+        )
+        ts_array, ts_list = ts_generator.generate_all()
+        assert ts_array.shape == (cfg.generation.ts_number, cfg.generation.ts_size)
+        for i, ts in enumerate(ts_list):
+            np.testing.assert_array_equal(ts.get_values(), ts_array[i])
+            assert sum(steps for _, (steps, _) in ts.metadata) == cfg.generation.ts_size
+
+
+def test_generate_all_parallel():
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.parallel = True
+        cfg.generation.seed = 42
+        cfg.generation.shard_size = 2
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        results = []
+        for num_workers in (1, 3):
+            cfg.generation.num_workers = num_workers
+            ts_generator = TimeSeriesGenerator(
+                cfg=cfg, linspace_info=GENERATOR_LINSPACE, process_storage=process_list
+            )
+            results.append(ts_generator.generate_all())
+        (first_array, first_list), (second_array, second_list) = results
+        assert first_array.shape == (cfg.generation.ts_number, cfg.generation.ts_size)
+        np.testing.assert_array_equal(first_array, second_array)
+        assert len(first_list) == len(second_list) == cfg.generation.ts_number
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_generate_chunks_independent_of_chunk_size(parallel):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.ts_number = 23
+        cfg.generation.seed = 42
+        cfg.generation.shard_size = 5
+        cfg.generation.parallel = parallel
+        cfg.generation.num_workers = 2
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+
+        def get_generator():
+            return TimeSeriesGenerator(
+                cfg=cfg, linspace_info=GENERATOR_LINSPACE, process_storage=process_list
+            )
+
+        ts_array, ts_list = get_generator().generate_all()
+        records = ScheduleBatch.from_time_series(
+            ts_list, process_list.get_process_names()
+        ).get_segment_records()
+        for chunk_size, start_index in [
+            (1, 0),
+            (3, 0),
+            (5, 0),
+            (7, 0),
+            (30, 0),
+            (4, 8),
+        ]:
+            chunks = list(
+                get_generator().generate_chunks(
+                    chunk_size=chunk_size, start_index=start_index
+                )
+            )
+            assert [start for start, _, _ in chunks] == list(
+                range(start_index, 23, chunk_size)
+            )
+            np.testing.assert_array_equal(
+                np.vstack([chunk_array for _, chunk_array, _ in chunks]),
+                ts_array[start_index:],
+            )
+            assert [
+                record
+                for _, _, schedule_batch in chunks
+                for record in schedule_batch.get_segment_records()
+            ] == records[start_index:]
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_generate_all_float32(batched):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.batched = batched
+        cfg.generation.seed = 42
+        cfg.scheduler.single_schedule = True
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        results = []
+        for dtype in ("float64", "float32"):
+            cfg.generation.dtype = dtype
+            ts_generator = TimeSeriesGenerator(
+                cfg=cfg, linspace_info=GENERATOR_LINSPACE, process_storage=process_list
+            )
+            results.append(ts_generator.generate_all())
+        (double_array, _), (single_array, single_list) = results
+        assert single_array.dtype == np.float32
+        assert all(ts.values.dtype == np.float32 for ts in single_list)
+        np.testing.assert_allclose(single_array, double_array, rtol=1e-4, atol=1e-4)
+
+
+def test_generate_all_clustered():
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.chunk_size = 5
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        rng = np.random.default_rng(0)
+        scheduler_storage = SchedulerStorage(
+            num_steps=cfg.generation.ts_size,
+            cfg_scheduler=cfg.scheduler,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            source_points=rng.uniform(1.0, 10.0, (12, 3)),
+            clusters=rng.integers(0, 3, 12),
+            rng=rng,
+        )
+        ts_generator = TimeSeriesGenerator(
+            cfg=cfg,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            scheduler_storage=scheduler_storage,
+            rng=rng,
+        )
+        ts_array, ts_list = ts_generator.generate_all()
+        assert ts_array.shape == (12, cfg.generation.ts_size)
+        for i, ts in enumerate(ts_list):
+            np.testing.assert_array_equal(ts.get_values(), ts_array[i])
+            process_order = scheduler_storage.get_scheduler(
+                scheduler_storage.get_cluster(i)
+            ).process_order
+            assert [(steps, name) for name, (steps, _) in ts.metadata] == [
+                (steps, name) for steps, name in process_order
+            ]
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_generate_chunks_lazy(batched):
+    with initialize(version_base="1.2", config_path=os.path.join("..", "config")):
+        cfg = compose(config_name="config")
+        cfg.generation.batched = batched
+        process_list = ProcessStorage(
+            process_list=cfg.scheduler.process_list,
+            cfg_process=cfg.process,
+            linspace_info=GENERATOR_LINSPACE,
+            generation_method=RandomMethod(GENERATOR_LINSPACE),
+        )
+        rng = np.random.default_rng(0)
+        point_stream = SourcePointStream(
+            sampling_method=SurfaceSamplingMethod(cfg.linspace_info),
+            num_points=30,
+            n_clusters=3,
+            rng=rng,
+            sample_size=10,
+            chunk_size=8,
+        )
+        scheduler_storage = LazySchedulerStorage(
+            num_steps=cfg.generation.ts_size,
+            cfg_scheduler=cfg.scheduler,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            point_stream=point_stream,
+            rng=rng,
+        )
+        ts_generator = TimeSeriesGenerator(
+            cfg=cfg,
+            linspace_info=GENERATOR_LINSPACE,
+            process_storage=process_list,
+            scheduler_storage=scheduler_storage,
+            rng=rng,
+        )
+        assert ts_generator.get_iterations() == 30
+        chunks = list(ts_generator.generate_chunks(chunk_size=7))
+        assert [start for start, _, _ in chunks] == [0, 7, 14, 21, 28]
+        for start, chunk_array, schedule_batch in chunks:
+            for i in range(schedule_batch.num_series):
+                process_order = scheduler_storage.get_scheduler(
+                    scheduler_storage.get_cluster(start + i)
+                ).process_order
+                assert [
+                    (steps, name) for name, steps in schedule_batch.get_layout(i)
+                ] == [(steps, name) for steps, name in process_order]
+
+
 if __name__ == "__main__":
     pytest.main()
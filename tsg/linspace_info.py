@@ -1,5 +1,6 @@
 import numpy as np
 
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 
 
@@ -21,14 +22,24 @@ class LinspaceInfo:
         self.step_coeff = step_coeff
         self.use_k = use_k
 
-    def generate_values(self, num_values=1, is_normal=True) -> NDArrayFloat64T:
+    def generate_values(
+        self,
+        num_values=1,
+        is_normal=True,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        rng = get_rng(rng)
         if is_normal:
             center = (self.start + self.stop) / 2
-            return np.random.normal(self.center_shift * center, self.step, num_values)
-        return np.random.uniform(self.start, self.stop, num_values)
+            return rng.normal(self.center_shift * center, self.step, num_values)
+        return rng.uniform(self.start, self.stop, num_values)
 
-    def generate_std(self, source_value: float | None = None) -> float:
-        k = np.random.normal(0, self.step * self.step_coeff)
+    def generate_std(
+        self,
+        source_value: float | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        k = get_rng(rng).normal(0, self.step * self.step_coeff)
         if k <= -self.step:
             k = 0.0
         if source_value is None:
@@ -37,3 +48,15 @@ class LinspaceInfo:
             use_k = self.use_k
             std = self.step * (1 + source_value) + k * use_k
         return std
+
+    def generate_batch_std(
+        self,
+        num_values: int,
+        source_values: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        k = get_rng(rng).normal(0, self.step * self.step_coeff, num_values)
+        k[k <= -self.step] = 0.0
+        if source_values is None:
+            return self.step + k
+        return self.step * (1 + source_values) + k * self.use_k
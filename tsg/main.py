@@ -1,21 +1,53 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import hydra
-from omegaconf import DictConfig
+import numpy as np
+from omegaconf import DictConfig, OmegaConf, open_dict
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
 from tsg.process.process_storage import ProcessStorage
-from tsg.scheduler.scheduler_storage import SchedulerStorage
+from tsg.scheduler.scheduler_storage import LazySchedulerStorage, SchedulerStorage
 from tsg.source_data_sampling.point_clustering import cluster_points
+from tsg.source_data_sampling.source_point_stream import SourcePointStream
 from tsg.time_series import TimeSeries
 from tsg.time_series_generator import TimeSeriesGenerator
-from tsg.utils.result_writer import save_parameters, save_plot, save_values
+from tsg.utils.checkpoint import Checkpoint
+from tsg.utils.plotting import NUM_PLOT_SERIES, save_plot, save_plot_data
+from tsg.utils.profiling import (
+    Profiler,
+    add_written_bytes,
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    profile_stage,
+)
+from tsg.utils.result_writer import (
+    get_chunk_writer,
+    get_parameters_path,
+    get_parameters_writer,
+    get_values_path,
+    get_values_writer,
+    load_values_head,
+    save_parameters,
+    save_values,
+)
+from tsg.utils.rng import create_rng
 from tsg.utils.typing import NDArrayFloat64T, NDArrayIntT
 from tsg.utils.utils import get_config_path
 
+EXECUTION_KEYS = (
+    "parallel",
+    "num_workers",
+    "chunk_size",
+    "write_queue_size",
+    "profile",
+    "profile_name",
+)
+
 
 @hydra.main(
     version_base="1.2",
@@ -23,22 +55,57 @@ from tsg.utils.utils import get_config_path
     config_name="config",
 )
 def main(cfg: DictConfig) -> None:
-    if cfg.generation.sample_points:
-        coordinates, clusters, border_values, shift = generate_source_data(cfg)
-        plot_data = [coordinates, clusters, border_values, shift]
+    if cfg.generation.profile:
+        enable_profiling()
+    checkpoint = get_checkpoint(cfg)
+    seed = (
+        checkpoint.get_seed(cfg.generation.seed)
+        if checkpoint is not None
+        else cfg.generation.seed
+    )
+    rng = create_rng(seed, cfg.generation.bit_generator)
+    scheduler_storage: SchedulerStorage | None
+    if cfg.generation.sample_points and cfg.generation.lazy_points:
+        point_stream = generate_point_stream(cfg, rng)
+        border_values = point_stream.border_values
+        plot_data = [
+            point_stream.sample_points,
+            point_stream.sample_clusters,
+            border_values,
+            point_stream.shift,
+        ]
         linspace_info = get_linspace_info(
             cfg=cfg, start=border_values[0], stop=border_values[1]
         )
         generation_method = get_generation_method(cfg, linspace_info=linspace_info)
         process_storage = get_process_storage(cfg, linspace_info, generation_method)
-        scheduler_storage = SchedulerStorage(
-            num_steps=cfg.generation.ts_size,
-            cfg_scheduler=cfg.scheduler,
-            linspace_info=linspace_info,
-            process_storage=process_storage,
-            source_points=coordinates,
-            clusters=clusters,
+        with profile_stage("scheduler_storage"):
+            scheduler_storage = LazySchedulerStorage(
+                num_steps=cfg.generation.ts_size,
+                cfg_scheduler=cfg.scheduler,
+                linspace_info=linspace_info,
+                process_storage=process_storage,
+                point_stream=point_stream,
+                rng=rng,
+            )
+    elif cfg.generation.sample_points:
+        coordinates, clusters, border_values, shift = generate_source_data(cfg, rng)
+        plot_data = [coordinates, clusters, border_values, shift]
+        linspace_info = get_linspace_info(
+            cfg=cfg, start=border_values[0], stop=border_values[1]
         )
+        generation_method = get_generation_method(cfg, linspace_info=linspace_info)
+        process_storage = get_process_storage(cfg, linspace_info, generation_method)
+        with profile_stage("scheduler_storage"):
+            scheduler_storage = SchedulerStorage(
+                num_steps=cfg.generation.ts_size,
+                cfg_scheduler=cfg.scheduler,
+                linspace_info=linspace_info,
+                process_storage=process_storage,
+                source_points=coordinates,
+                clusters=clusters,
+                rng=rng,
+            )
     else:
         plot_data = None
         linspace_info = get_linspace_info(
@@ -55,16 +122,60 @@ def main(cfg: DictConfig) -> None:
         linspace_info=linspace_info,
         process_storage=process_storage,
         scheduler_storage=scheduler_storage,
+        rng=rng,
     )
-    time_series_array, time_series_list = ts_generator.generate_all()
-    save_results(
-        cfg=cfg,
-        ts_array=time_series_array,
-        ts_list=time_series_list,
-        plot_data=plot_data,
+    if checkpoint is not None:
+        checkpoint.set_run_info(get_run_info(cfg, scheduler_storage))
+    if cfg.generation.chunk_size is not None or checkpoint is not None:
+        save_results_streaming(
+            cfg=cfg,
+            ts_generator=ts_generator,
+            plot_data=plot_data,
+            checkpoint=checkpoint,
+        )
+        if checkpoint is not None:
+            checkpoint.remove()
+    else:
+        time_series_array, time_series_list = ts_generator.generate_all()
+        save_results(
+            cfg=cfg,
+            ts_array=time_series_array,
+            ts_list=time_series_list,
+            plot_data=plot_data,
+            process_names=process_storage.get_process_names(),
+        )
+    profiler = get_profiler()
+    if profiler is not None:
+        save_profile(cfg, profiler)
+        disable_profiling()
+
+
+def get_checkpoint(cfg: DictConfig) -> Checkpoint | None:
+    if not cfg.generation.checkpoint:
+        return None
+    return Checkpoint(
+        os.path.join(cfg.generation.save_data_folder, cfg.generation.checkpoint_name)
     )
 
 
+def get_run_info(
+    cfg: DictConfig, scheduler_storage: SchedulerStorage | None = None
+) -> dict:
+    cfg = cfg.copy()
+    with open_dict(cfg):
+        for key in EXECUTION_KEYS:
+            cfg.generation.pop(key, None)
+    process_orders = (
+        scheduler_storage.get_process_orders()
+        if scheduler_storage is not None
+        else None
+    )
+    return {
+        "config": OmegaConf.to_container(cfg, resolve=True),
+        "process_orders": process_orders,
+    }
+
+
 def get_generation_method(
     cfg: DictConfig, linspace_info: LinspaceInfo
 ) -> ParametersGenerationMethod:
@@ -84,22 +195,55 @@ def get_generation_method(
 
 def generate_source_data(
     cfg: DictConfig,
+    rng: np.random.Generator | None = None,
 ) -> tuple[NDArrayFloat64T, NDArrayIntT, tuple[float, float], float]:
     sampling_method_name = cfg.generation.sampling_method
     sampling_method = hydra.utils.instantiate(
         cfg.source_data_sampling_method[sampling_method_name],
         linspace_info_cfg=cfg.linspace_info,
     )
-    source_data, linspace_info = sampling_method.sample_source_data(
-        cfg.generation.ts_number
-    )
-    clusters = cluster_points(
-        points=source_data.data_characteristics, n_clusters=cfg.clustering.clusters
-    )
+    with profile_stage("source_sampling", items=cfg.generation.ts_number):
+        source_data, linspace_info = sampling_method.sample_source_data(
+            cfg.generation.ts_number, rng=rng
+        )
+    with profile_stage("clustering", items=cfg.generation.ts_number):
+        clusters = cluster_points(
+            points=source_data.data_characteristics,
+            n_clusters=cfg.clustering.clusters,
+            rng=rng,
+            method=cfg.clustering.method,
+            n_init=cfg.clustering.n_init,
+            sample_size=cfg.clustering.sample_size,
+            batch_size=cfg.clustering.batch_size,
+            chunk_size=cfg.clustering.chunk_size,
+        )
     border_values = (linspace_info.start, linspace_info.stop)
     return source_data.data_characteristics, clusters, border_values, source_data.shift
 
 
+def generate_point_stream(
+    cfg: DictConfig,
+    rng: np.random.Generator | None = None,
+) -> SourcePointStream:
+    sampling_method_name = cfg.generation.sampling_method
+    sampling_method = hydra.utils.instantiate(
+        cfg.source_data_sampling_method[sampling_method_name],
+        linspace_info_cfg=cfg.linspace_info,
+    )
+    with profile_stage("source_sampling", items=cfg.clustering.sample_size):
+        return SourcePointStream(
+            sampling_method=sampling_method,
+            num_points=cfg.generation.ts_number,
+            n_clusters=cfg.clustering.clusters,
+            rng=rng,
+            method=cfg.clustering.method,
+            n_init=cfg.clustering.n_init,
+            sample_size=cfg.clustering.sample_size,
+            batch_size=cfg.clustering.batch_size,
+            chunk_size=cfg.clustering.chunk_size,
+        )
+
+
 def get_linspace_info(cfg: DictConfig, start: float, stop: float) -> LinspaceInfo:
     return LinspaceInfo(
         start=start,
@@ -129,18 +273,118 @@ def save_results(
     ts_array: NDArrayFloat64T,
     ts_list: list[TimeSeries],
     plot_data: list | None = None,
+    process_names: list[str] | None = None,
+) -> None:
+    folder = cfg.generation.save_data_folder
+    os.makedirs(folder, exist_ok=True)
+    save_data_path = get_parameters_path(
+        folder, cfg.generation.json_name, cfg.generation.metadata_format
+    )
+    save_values_path = get_values_path(
+        folder, cfg.generation.csv_name, cfg.generation.values_format
+    )
+
+    def write_parameters() -> None:
+        with profile_stage("write_parameters", items=len(ts_list)):
+            save_parameters(
+                ts_list, save_data_path, cfg.generation.metadata_format, process_names
+            )
+
+    def write_values() -> None:
+        with profile_stage("write_values", items=len(ts_array)):
+            save_values(ts_array, save_values_path, cfg.generation.values_format)
+
+    if cfg.generation.write_queue_size > 0:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parameters_future = executor.submit(write_parameters)
+            write_values()
+            parameters_future.result()
+    else:
+        write_parameters()
+        write_values()
+    add_written_bytes("write_parameters", save_data_path)
+    add_written_bytes("write_values", save_values_path)
+    if plot_data is not None:
+        save_plot_results(cfg, plot_data, ts_array)
+
+
+def save_results_streaming(
+    cfg: DictConfig,
+    ts_generator: TimeSeriesGenerator,
+    plot_data: list | None = None,
+    checkpoint: Checkpoint | None = None,
 ) -> None:
     folder = cfg.generation.save_data_folder
     os.makedirs(folder, exist_ok=True)
-    save_data_path = os.path.join(folder, cfg.generation.json_name)
-    save_values_path = os.path.join(folder, cfg.generation.csv_name)
-    save_plot_path = os.path.join(folder, cfg.generation.plot_name)
-    save_parameters(ts_list, save_data_path)
-    save_values(ts_array, save_values_path)
+    save_data_path = get_parameters_path(
+        folder, cfg.generation.json_name, cfg.generation.metadata_format
+    )
+    save_values_path = get_values_path(
+        folder, cfg.generation.csv_name, cfg.generation.values_format
+    )
+    positions = checkpoint.positions if checkpoint is not None else None
+    start_index = checkpoint.start_index if checkpoint is not None else 0
+    parameters_writer = get_parameters_writer(
+        save_data_path,
+        cfg.generation.metadata_format,
+        ts_generator.process_storage.get_process_names(),
+        positions["parameters"] if positions is not None else None,
+    )
+    values_writer = get_values_writer(
+        save_values_path,
+        cfg.generation.values_format,
+        (ts_generator.get_iterations(), ts_generator.ts_size),
+        ts_generator.dtype,
+        positions["values"] if positions is not None else None,
+    )
+    with get_chunk_writer(
+        parameters_writer,
+        values_writer,
+        cfg.generation.write_queue_size,
+        checkpoint.save if checkpoint is not None else None,
+    ) as writer:
+        for start, ts_array, schedule_batch in ts_generator.generate_chunks(
+            start_index=start_index
+        ):
+            writer.write(ts_array, schedule_batch, start)
+    add_written_bytes("write_parameters", save_data_path)
+    add_written_bytes("write_values", save_values_path)
     if plot_data is not None:
-        plot_data.append(ts_array)
-        plot_data.append(save_plot_path)
-        save_plot(*plot_data)
+        plot_values = load_values_head(
+            save_values_path, cfg.generation.values_format, NUM_PLOT_SERIES
+        )
+        save_plot_results(cfg, plot_data, plot_values)
+
+
+def save_plot_results(
+    cfg: DictConfig, plot_data: list, ts_array: NDArrayFloat64T
+) -> None:
+    folder = cfg.generation.save_data_folder
+    coordinates, clusters, border_values, shift = plot_data
+    save_plot_data(
+        os.path.join(folder, cfg.generation.plot_data_name),
+        coordinates,
+        clusters,
+        border_values,
+        shift,
+        ts_array,
+    )
+    if cfg.generation.plot:
+        with profile_stage("plot"):
+            save_plot(
+                coordinates,
+                clusters,
+                border_values,
+                shift,
+                ts_array,
+                os.path.join(folder, cfg.generation.plot_name),
+            )
+
+
+def save_profile(cfg: DictConfig, profiler: Profiler) -> None:
+    folder = cfg.generation.save_data_folder
+    os.makedirs(folder, exist_ok=True)
+    profiler.save_report(os.path.join(folder, cfg.generation.profile_name))
 
 
 if __name__ == "__main__":
@@ -1,16 +1,11 @@
 import numpy as np
 
 from tsg.linspace_info import LinspaceInfo
-from tsg.parameters_generation.parameter_types import (
-    CoefficientType,
-    MeanType,
-    ParameterType,
-    StdType,
-)
+from tsg.parameters_generation.parameter_types import MEAN_KIND
 from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.utils.typing import NDArrayFloat64T, ParameterSpecsT
 
 
 class AggregationMethod(ParametersGenerationMethod):
@@ -32,30 +27,87 @@ class AggregationMethod(ParametersGenerationMethod):
     def change_source_data(
         self,
         source_data: NDArrayFloat64T,
-        parameters_required: list[ParameterType],
+        parameter_specs: ParameterSpecsT,
     ) -> NDArrayFloat64T:
-        new_source_data = np.zeros(shape=(1, len(parameters_required)))[0]
         mean_value = self.get_mean_value(source_data, self.weighted_values)
         fraction = (
             mean_value / np.max(source_data)
             if self.use_max
             else mean_value / source_data.sum()
         )
-        for i in range(len(new_source_data)):
-            if parameters_required[i].name in ("std_type", "coefficient_type"):
-                new_source_data[i] = fraction
-            else:
-                new_source_data[i] = mean_value
-        return new_source_data
-
-    def generate_std(self, std_type: StdType) -> float:
-        return self.linspace_info.generate_std(source_value=std_type.source_value)
-
-    def generate_mean(self, mean_type: MeanType) -> float:
-        return mean_type.source_value
-
-    def generate_coefficient(self, coefficient_type: CoefficientType) -> float:
-        coefficient = coefficient_type.constraints[1] * coefficient_type.source_value
-        if coefficient < coefficient_type.constraints[0]:
-            coefficient = coefficient_type.constraints[1] - coefficient
+        return np.where(parameter_specs["kind"] == MEAN_KIND, mean_value, fraction)
+
+    def generate_std(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        return self.linspace_info.generate_std(source_value=source_value, rng=rng)
+
+    def generate_mean(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        return source_value
+
+    def generate_coefficient(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        coefficient = spec["high"] * source_value
+        if coefficient < spec["low"]:
+            coefficient = spec["high"] - coefficient
         return coefficient
+
+    def change_batch_source_data(
+        self,
+        source_data: NDArrayFloat64T,
+        parameter_specs: ParameterSpecsT,
+    ) -> NDArrayFloat64T:
+        mean_values = self.get_batch_mean_values(
+            source_data, len(source_data), self.weighted_values
+        )
+        fractions = (
+            mean_values / np.max(source_data, axis=1)
+            if self.use_max
+            else mean_values / source_data.sum(axis=1)
+        )
+        return np.where(
+            parameter_specs["kind"] == MEAN_KIND,
+            mean_values[:, None],
+            fractions[:, None],
+        )
+
+    def generate_batch_std(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return self.linspace_info.generate_batch_std(
+            len(source_values), source_values=source_values, rng=rng
+        )
+
+    def generate_batch_mean(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return source_values.copy()
+
+    def generate_batch_coefficient(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        coefficients = spec["high"] * source_values
+        return np.where(
+            coefficients < spec["low"], spec["high"] - coefficients, coefficients
+        )
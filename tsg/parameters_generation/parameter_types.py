@@ -2,57 +2,65 @@ from abc import ABC
 
 import numpy as np
 
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.utils.typing import NDArrayFloat64T, ParameterSpecsT
+
+STD_KIND = 0
+MEAN_KIND = 1
+COEFFICIENT_KIND = 2
+PARAMETER_SPEC_DTYPE = np.dtype(
+    [("kind", np.int8), ("low", np.float64), ("high", np.float64)]
+)
 
 
 class ParameterType(ABC):
     name = ""
+    kind = -1
 
     def __init__(
         self,
         constraints: NDArrayFloat64T = np.array([0.0, 1.0]),
-        source_value: float = 0.0,
     ) -> None:
-        self._source_value = source_value
         self._constraints = constraints
 
-    @property
-    def source_value(self) -> float:
-        return self._source_value
-
-    @source_value.setter
-    def source_value(self, source_value: float) -> None:
-        self._source_value = source_value
-
     @property
     def constraints(self) -> NDArrayFloat64T:
         return self._constraints
 
-    @constraints.setter
-    def constraints(self, constraints: NDArrayFloat64T) -> None:
-        self._constraints = constraints
-
 
 class StdType(ParameterType):
     name = "std_type"
+    kind = STD_KIND
 
-    def __init__(self, source_value: float = 0.0) -> None:
-        super().__init__(source_value=source_value)
+    def __init__(self) -> None:
+        super().__init__()
 
 
 class MeanType(ParameterType):
     name = "mean_type"
+    kind = MEAN_KIND
 
-    def __init__(self, source_value: float = 0.0) -> None:
-        super().__init__(source_value=source_value)
+    def __init__(self) -> None:
+        super().__init__()
 
 
 class CoefficientType(ParameterType):
     name = "coefficient_type"
+    kind = COEFFICIENT_KIND
 
     def __init__(
         self,
         constraints: NDArrayFloat64T = np.array([0.0, 1.0]),
-        source_value: float = 0.0,
     ) -> None:
-        super().__init__(constraints=constraints, source_value=source_value)
+        super().__init__(constraints=constraints)
+
+
+def get_parameter_specs(parameters: list[ParameterType]) -> ParameterSpecsT:
+    specs = np.array(
+        [
+            (parameter.kind, parameter.constraints[0], parameter.constraints[1])
+            for parameter in parameters
+        ],
+        dtype=PARAMETER_SPEC_DTYPE,
+    )
+    specs.flags.writeable = False
+    return specs
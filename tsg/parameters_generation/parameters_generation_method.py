@@ -5,12 +5,12 @@ import numpy as np
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.parameter_types import (
-    CoefficientType,
-    MeanType,
-    ParameterType,
-    StdType,
+    COEFFICIENT_KIND,
+    MEAN_KIND,
+    STD_KIND,
 )
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.utils.rng import get_rng
+from tsg.utils.typing import NDArrayFloat64T, ParameterSpecsT
 
 
 class ParametersGenerationMethod(ABC):
@@ -21,22 +21,51 @@ class ParametersGenerationMethod(ABC):
         linspace_info: LinspaceInfo,
     ) -> None:
         self.linspace_info = linspace_info
+        self.generation_functions: dict[int, Callable] = {
+            STD_KIND: self.generate_std,
+            MEAN_KIND: self.generate_mean,
+            COEFFICIENT_KIND: self.generate_coefficient,
+        }
+        self.batch_generation_functions: dict[int, Callable] = {
+            STD_KIND: self.generate_batch_std,
+            MEAN_KIND: self.generate_batch_mean,
+            COEFFICIENT_KIND: self.generate_batch_coefficient,
+        }
 
     def generate_all_parameters(
         self,
-        parameters_required: list[ParameterType],
+        parameter_specs: ParameterSpecsT,
         source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
-        parameters = np.zeros(shape=(1, len(parameters_required)))[0]
-        new_source_data = parameters.copy()
-        if source_data is not None:
-            new_source_data = self.change_source_data(source_data, parameters_required)
-        for i in range(len(parameters_required)):
-            parameter_type = parameters_required[i]
-            if source_data is not None:
-                parameter_type.source_value = new_source_data[i]
-            parameters[i] = self.generation_functions[parameter_type.name](
-                parameter_type
+        parameters = np.zeros(len(parameter_specs))
+        source_values = (
+            self.change_source_data(source_data, parameter_specs)
+            if source_data is not None
+            else np.zeros(len(parameter_specs))
+        )
+        for i, spec in enumerate(parameter_specs):
+            parameters[i] = self.generation_functions[spec["kind"]](
+                spec, source_values[i], rng
+            )
+        return parameters
+
+    def generate_batch_parameters(
+        self,
+        parameter_specs: ParameterSpecsT,
+        num_values: int,
+        source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        parameters = np.empty(shape=(num_values, len(parameter_specs)))
+        source_values = (
+            self.change_batch_source_data(source_data, parameter_specs)
+            if source_data is not None
+            else np.zeros(shape=(num_values, len(parameter_specs)))
+        )
+        for i, spec in enumerate(parameter_specs):
+            parameters[:, i] = self.batch_generation_functions[spec["kind"]](
+                spec, source_values[:, i], rng
             )
         return parameters
 
@@ -44,42 +73,101 @@ class ParametersGenerationMethod(ABC):
     def change_source_data(
         self,
         source_data: NDArrayFloat64T,
-        parameters_required: list[ParameterType],
+        parameter_specs: ParameterSpecsT,
     ) -> NDArrayFloat64T:
         pass
 
     @abstractmethod
-    def generate_std(self, std_type: StdType) -> float:
+    def generate_std(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        pass
+
+    @abstractmethod
+    def generate_mean(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
         pass
 
     @abstractmethod
-    def generate_mean(self, mean_type: MeanType) -> float:
+    def generate_coefficient(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
         pass
 
     @abstractmethod
-    def generate_coefficient(self, coefficient_type: CoefficientType) -> float:
+    def change_batch_source_data(
+        self,
+        source_data: NDArrayFloat64T,
+        parameter_specs: ParameterSpecsT,
+    ) -> NDArrayFloat64T:
         pass
 
-    @property
-    def generation_functions(self) -> dict[str, Callable]:
-        return {
-            "std_type": self.generate_std,
-            "mean_type": self.generate_mean,
-            "coefficient_type": self.generate_coefficient,
-        }
+    @abstractmethod
+    def generate_batch_std(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        pass
+
+    @abstractmethod
+    def generate_batch_mean(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        pass
+
+    @abstractmethod
+    def generate_batch_coefficient(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        pass
 
     def get_mean_value(
-        self, source_data: NDArrayFloat64T | None, weighted: bool = True
+        self,
+        source_data: NDArrayFloat64T | None,
+        weighted: bool = True,
+        rng: np.random.Generator | None = None,
     ) -> float:
         if source_data is not None:
             weights = self.calculate_weights(len(source_data)) if weighted else None
             mean_value = float(np.average(source_data, weights=weights))
         else:
-            mean_value = np.random.uniform(
+            mean_value = get_rng(rng).uniform(
                 self.linspace_info.start, self.linspace_info.stop
             )
         return mean_value
 
+    def get_batch_mean_values(
+        self,
+        source_data: NDArrayFloat64T | None,
+        num_values: int,
+        weighted: bool = True,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        if source_data is not None:
+            weights = self.calculate_weights(source_data.shape[1]) if weighted else None
+            return np.average(source_data, axis=1, weights=weights)
+        return get_rng(rng).uniform(
+            self.linspace_info.start, self.linspace_info.stop, num_values
+        )
+
     @staticmethod
     def generate_value_in_range(
         source_value: float, start: float, stop: float
@@ -90,6 +178,14 @@ class ParametersGenerationMethod(ABC):
             value = stop - value
         return value
 
+    @staticmethod
+    def generate_batch_values_in_range(
+        source_values: NDArrayFloat64T, start: float, stop: float
+    ) -> NDArrayFloat64T:
+        high_border = 10 ** (np.log10(np.abs(source_values)) + 1)
+        values = stop * (source_values / high_border)
+        return np.where(values < start, stop - values, values)
+
     @staticmethod
     def calculate_weights(num_values: int) -> NDArrayFloat64T:
         progression_sum = (1 + num_values) * num_values / 2
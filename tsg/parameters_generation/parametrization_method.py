@@ -1,16 +1,10 @@
 import numpy as np
 
 from tsg.linspace_info import LinspaceInfo
-from tsg.parameters_generation.parameter_types import (
-    CoefficientType,
-    MeanType,
-    ParameterType,
-    StdType,
-)
 from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.utils.typing import NDArrayFloat64T, ParameterSpecsT
 
 
 class ParametrizationMethod(ParametersGenerationMethod):
@@ -27,29 +21,85 @@ class ParametrizationMethod(ParametersGenerationMethod):
     def change_source_data(
         self,
         source_data: NDArrayFloat64T,
-        parameters_required: list[ParameterType],
+        parameter_specs: ParameterSpecsT,
     ) -> NDArrayFloat64T:
-        return self.match_parameters_number(source_data, len(parameters_required))
+        return self.match_parameters_number(source_data, len(parameter_specs))
 
-    def generate_std(self, std_type: StdType) -> float:
-        source_value = std_type.source_value
+    def generate_std(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
         high_border = 10 ** (np.log10(abs(source_value)) + 1)
         return self.linspace_info.generate_std(
-            source_value=(source_value / high_border)
+            source_value=(source_value / high_border), rng=rng
         )
 
-    def generate_mean(self, mean_type: MeanType) -> float:
+    def generate_mean(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
         return self.generate_value_in_range(
-            source_value=mean_type.source_value,
+            source_value=source_value,
             start=self.linspace_info.start,
             stop=self.linspace_info.stop,
         )
 
-    def generate_coefficient(self, coefficient_type: CoefficientType) -> float:
+    def generate_coefficient(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
         return self.generate_value_in_range(
-            source_value=coefficient_type.source_value,
-            start=coefficient_type.constraints[0],
-            stop=coefficient_type.constraints[1],
+            source_value=source_value,
+            start=spec["low"],
+            stop=spec["high"],
+        )
+
+    def change_batch_source_data(
+        self,
+        source_data: NDArrayFloat64T,
+        parameter_specs: ParameterSpecsT,
+    ) -> NDArrayFloat64T:
+        return self.match_batch_parameters_number(source_data, len(parameter_specs))
+
+    def generate_batch_std(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        high_border = 10 ** (np.log10(np.abs(source_values)) + 1)
+        return self.linspace_info.generate_batch_std(
+            len(source_values), source_values=source_values / high_border, rng=rng
+        )
+
+    def generate_batch_mean(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return self.generate_batch_values_in_range(
+            source_values=source_values,
+            start=self.linspace_info.start,
+            stop=self.linspace_info.stop,
+        )
+
+    def generate_batch_coefficient(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return self.generate_batch_values_in_range(
+            source_values=source_values,
+            start=spec["low"],
+            stop=spec["high"],
         )
 
     @staticmethod
@@ -70,3 +120,20 @@ class ParametrizationMethod(ParametersGenerationMethod):
             for j in range(new_size, old_size):
                 new_source_data[(j - new_size) % new_size] += source_data[j]
         return new_source_data
+
+    @staticmethod
+    def match_batch_parameters_number(
+        source_data: NDArrayFloat64T, new_size: int
+    ) -> NDArrayFloat64T:
+        old_size = source_data.shape[1]
+        if old_size == new_size:
+            return source_data
+        new_source_data = np.zeros(shape=(len(source_data), new_size))
+        new_source_data[:, : min(old_size, new_size)] = source_data[:, :new_size]
+        if old_size < new_size:
+            for j in range(old_size, new_size):
+                new_source_data[:, j] = new_source_data[:, :j].mean(axis=1)
+        else:
+            for j in range(new_size, old_size):
+                new_source_data[:, (j - new_size) % new_size] += source_data[:, j]
+        return new_source_data
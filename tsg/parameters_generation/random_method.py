@@ -1,16 +1,11 @@
 import numpy as np
 
 from tsg.linspace_info import LinspaceInfo
-from tsg.parameters_generation.parameter_types import (
-    CoefficientType,
-    MeanType,
-    ParameterType,
-    StdType,
-)
 from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.utils.rng import get_rng
+from tsg.utils.typing import NDArrayFloat64T, ParameterSpecsT
 
 
 class RandomMethod(ParametersGenerationMethod):
@@ -27,16 +22,63 @@ class RandomMethod(ParametersGenerationMethod):
     def change_source_data(
         self,
         source_data: NDArrayFloat64T,
-        parameters_required: list[ParameterType],
+        parameter_specs: ParameterSpecsT,
+    ) -> NDArrayFloat64T:
+        return np.zeros(len(parameter_specs))
+
+    def generate_std(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        return self.linspace_info.generate_std(rng=rng)
+
+    def generate_mean(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        return self.linspace_info.generate_values(is_normal=False, rng=rng)[0]
+
+    def generate_coefficient(
+        self,
+        spec: np.void,
+        source_value: float,
+        rng: np.random.Generator | None = None,
+    ) -> float:
+        return get_rng(rng).uniform(spec["low"], spec["high"])
+
+    def change_batch_source_data(
+        self,
+        source_data: NDArrayFloat64T,
+        parameter_specs: ParameterSpecsT,
     ) -> NDArrayFloat64T:
-        return np.zeros(shape=(1, len(parameters_required)))[0]
+        return np.zeros(shape=(len(source_data), len(parameter_specs)))
 
-    def generate_std(self, std_type: StdType) -> float:
-        return self.linspace_info.generate_std()
+    def generate_batch_std(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return self.linspace_info.generate_batch_std(len(source_values), rng=rng)
 
-    def generate_mean(self, mean_type: MeanType) -> float:
-        return self.linspace_info.generate_values(is_normal=False)[0]
+    def generate_batch_mean(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return self.linspace_info.generate_values(
+            len(source_values), is_normal=False, rng=rng
+        )
 
-    def generate_coefficient(self, coefficient_type: CoefficientType) -> float:
-        constraints = coefficient_type.constraints
-        return np.random.uniform(constraints[0], constraints[1])
+    def generate_batch_coefficient(
+        self,
+        spec: np.void,
+        source_values: NDArrayFloat64T,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return get_rng(rng).uniform(spec["low"], spec["high"], len(source_values))
@@ -0,0 +1,22 @@
+import os
+
+import hydra
+from omegaconf import DictConfig
+
+from tsg.utils.plotting import load_plot_data, save_plot
+from tsg.utils.utils import get_config_path
+
+
+@hydra.main(
+    version_base="1.2",
+    config_path=get_config_path(),
+    config_name="config",
+)
+def main(cfg: DictConfig) -> None:
+    folder = cfg.generation.save_data_folder
+    plot_data = load_plot_data(os.path.join(folder, cfg.generation.plot_data_name))
+    save_plot(*plot_data, os.path.join(folder, cfg.generation.plot_name))
+
+
+if __name__ == "__main__":
+    main()
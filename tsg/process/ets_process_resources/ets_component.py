@@ -1,4 +1,4 @@
-from numpy import array, transpose
+from numpy import asarray, cumsum, empty_like, zeros
 
 from tsg.utils.typing import NDArrayFloat64T
 
@@ -15,14 +15,16 @@ class ETSComponent:
         and the value that participates in the calculation of the current
         (for trend: b_t = b_(t-1) + parameter*e_t, lag=1,
          for seasonality: s_t = s_(t-12) + parameter*e_t, lag=12);
-    init_values : array(size=lag)
+    init_values : array(shape=(lag,) or (batch_size, lag))
         list of values needed for calculation;
-    parameter : float
+    parameter : float or array(shape=(batch_size,))
         coefficient of error;
-    error : array
+    error : array(shape=(samples_count,) or (batch_size, samples_count))
         list of error component values;
-    additional_values : ndarray(shape=(arrays_count, samples_count))
+    additional_values : ndarray(shape=(arrays_count, *error.shape))
         required if calculation of component depends on other components;
+    out : array(shape=error.shape)
+        optional buffer the component values are written into;
 
     Methods
     -------
@@ -34,26 +36,52 @@ class ETSComponent:
         self,
         lag: int,
         init_values: NDArrayFloat64T,
-        parameter: float,
+        parameter: float | NDArrayFloat64T,
         error: NDArrayFloat64T,
         additional_values: NDArrayFloat64T | None = None,
+        out: NDArrayFloat64T | None = None,
     ) -> None:
-        self.num_samples = len(error)
+        self.num_samples = error.shape[-1]
         self.lag = lag
-        self.init_values = init_values
-        self.parameter = parameter
+        self.init_values = asarray(init_values, dtype=float)
+        self.parameter = asarray(parameter, dtype=float)[..., None]
         self.error = error
-        self.values = self.set_values(additional_values)
-
-    def set_values(self, additional_values=None) -> NDArrayFloat64T:
-        component_values = array([0.0 for _ in range(self.num_samples + self.lag)])
-        for i in range(self.lag):
-            component_values[i] = self.init_values[i]
-        for i in range(self.num_samples):
-            component_value = self.parameter * self.error[i]
-            if self.lag != 0:
-                component_value += component_values[i]
-            if additional_values is not None:
-                component_value += transpose(additional_values[:, i])
-            component_values[self.lag + i] = component_value
-        return component_values[self.lag :]
+        self.values = self.set_values(additional_values, out)
+
+    def set_values(self, additional_values=None, out=None) -> NDArrayFloat64T:
+        increments = self.parameter * self.error
+        if additional_values is not None:
+            increments += additional_values.sum(axis=0)
+        return lag_filter(increments, self.init_values, self.lag, out)
+
+
+def lag_filter(
+    increments: NDArrayFloat64T,
+    init_values: NDArrayFloat64T,
+    lag: int,
+    out: NDArrayFloat64T | None = None,
+) -> NDArrayFloat64T:
+    """
+    Solves the recurrence v_t = v_(t-lag) + increments_t over the last axis,
+    where v_(t-lag) is taken from init_values for t < lag.
+    The lag-m recurrence splits into m independent prefix sums,
+    one per position in the period.
+    """
+    if out is None:
+        out = empty_like(increments)
+    if lag == 0:
+        out[...] = increments
+        return out
+    if lag == 1:
+        cumsum(increments, axis=-1, out=out)
+        out += init_values[..., :1]
+        return out
+    batch_shape = increments.shape[:-1]
+    num_samples = increments.shape[-1]
+    num_periods = -(-num_samples // lag)
+    periods = zeros(shape=(*batch_shape, num_periods * lag))
+    periods[..., :num_samples] = increments
+    values = cumsum(periods.reshape(*batch_shape, num_periods, lag), axis=-2)
+    values += init_values[..., None, :lag]
+    out[...] = values.reshape(*batch_shape, num_periods * lag)[..., :num_samples]
+    return out
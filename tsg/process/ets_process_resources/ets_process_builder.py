@@ -1,91 +1,131 @@
-from numpy import array, vstack, zeros
-from numpy.random import normal, triangular, uniform
+from numpy import array, asarray, concatenate, zeros, zeros_like
+from numpy.random import Generator
+from numpy.typing import DTypeLike
 
 from tsg.process.ets_process_resources.ets_component import ETSComponent
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 
 NO_LAG = 0
 STABLE_PARAMETER = 1.0
+DEFAULT_NUM_COMPONENTS = 4
 
 
 class ETSProcessBuilder:
-    def __init__(self, samples_count: int) -> None:
+    def __init__(
+        self,
+        samples_count: int,
+        batch_size: int | None = None,
+        num_components: int = DEFAULT_NUM_COMPONENTS,
+        rng: Generator | None = None,
+        dtype: DTypeLike = float,
+    ) -> None:
         self.num_samples = samples_count
-        self.components = zeros(shape=(1, samples_count))
+        self.rng = get_rng(rng)
+        self.batch_size = batch_size
+        self.shape = (
+            (samples_count,) if batch_size is None else (batch_size, samples_count)
+        )
+        self.components = zeros(
+            shape=(max(num_components, 1), *self.shape), dtype=dtype
+        )
+        self.num_components = 1
         self.set_normal_error()
 
     def remove_component(self, index: int) -> None:
-        if index < self.components.shape[0]:
-            self.components[index] = array([0.0 for _ in range(self.num_samples)])
+        if index < self.num_components:
+            self.components[index] = 0.0
         else:
             raise ValueError("There is no component with this index")
 
     def set_normal_error(self, mean=0.0, std=1.0) -> None:
-        error = ETSComponent(
+        ETSComponent(
             lag=NO_LAG,
             init_values=array([]),
             parameter=STABLE_PARAMETER,
-            error=normal(mean, std, self.num_samples),
+            error=self.rng.normal(self.expand(mean), self.expand(std), self.shape),
+            out=self.components[0],
         )
-        self.components[0] = error.values
 
     def set_uniform_error(self, left=-1.0, right=1.0) -> None:
-        error = ETSComponent(
+        ETSComponent(
             lag=NO_LAG,
             init_values=array([]),
             parameter=STABLE_PARAMETER,
-            error=uniform(left, right, self.num_samples),
+            error=self.rng.uniform(self.expand(left), self.expand(right), self.shape),
+            out=self.components[0],
         )
-        self.components[0] = error.values
 
     def set_triangular_error(self, left=-1.0, right=1.0, mode=0.0) -> None:
-        error = ETSComponent(
+        ETSComponent(
             lag=NO_LAG,
             init_values=array([]),
             parameter=STABLE_PARAMETER,
-            error=triangular(left, mode, right, self.num_samples),
+            error=self.rng.triangular(
+                self.expand(left), self.expand(mode), self.expand(right), self.shape
+            ),
+            out=self.components[0],
         )
-        self.components[0] = error.values
 
     def set_long_term(
         self,
-        init_value: float,
-        parameter: float,
+        init_value: float | NDArrayFloat64T,
+        parameter: float | NDArrayFloat64T,
         add_component_indexes: list[int] | None = None,
     ) -> int:
-        long_term = ETSComponent(
+        index = self.reserve_component()
+        ETSComponent(
             lag=1,
-            init_values=array([init_value]),
-            parameter=float(parameter),
+            init_values=self.expand(init_value),
+            parameter=parameter,
             error=self.components[0],
-            additional_values=self.components[add_component_indexes, :]
+            additional_values=self.components[add_component_indexes]
             if add_component_indexes is not None
             else None,
+            out=self.components[index],
         )
-        self.components = vstack([self.components, long_term.values])
-        return self.components.shape[0] - 1
+        return index
 
-    def set_trend(self, init_value: float, parameter: float) -> int:
-        trend = ETSComponent(
+    def set_trend(
+        self, init_value: float | NDArrayFloat64T, parameter: float | NDArrayFloat64T
+    ) -> int:
+        index = self.reserve_component()
+        ETSComponent(
             lag=1,
-            init_values=array([init_value]),
-            parameter=float(parameter),
+            init_values=self.expand(init_value),
+            parameter=parameter,
             error=self.components[0],
+            out=self.components[index],
         )
-        self.components = vstack([self.components, trend.values])
-        return self.components.shape[0] - 1
+        return index
 
     def set_seasonal(
-        self, lag: int, init_values: NDArrayFloat64T, parameter: float
+        self,
+        lag: int,
+        init_values: NDArrayFloat64T,
+        parameter: float | NDArrayFloat64T,
     ) -> int:
-        seasonal = ETSComponent(
+        index = self.reserve_component()
+        ETSComponent(
             lag=lag,
             init_values=init_values,
-            parameter=float(parameter),
+            parameter=parameter,
             error=self.components[0],
+            out=self.components[index],
         )
-        self.components = vstack([self.components, seasonal.values])
-        return self.components.shape[0] - 1
+        return index
+
+    def reserve_component(self) -> int:
+        if self.num_components == self.components.shape[0]:
+            self.components = concatenate(
+                [self.components, zeros_like(self.components)]
+            )
+        self.num_components += 1
+        return self.num_components - 1
+
+    def generate_values(self, out: NDArrayFloat64T | None = None) -> NDArrayFloat64T:
+        return self.components[: self.num_components].sum(axis=0, out=out)
 
-    def generate_values(self) -> NDArrayFloat64T:
-        return self.components.sum(axis=0)
+    @staticmethod
+    def expand(value: float | NDArrayFloat64T) -> NDArrayFloat64T:
+        return asarray(value, dtype=float)[..., None]
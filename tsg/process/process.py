@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
 
-from numpy.typing import NDArray
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
 
 from tsg.linspace_info import LinspaceInfo
-from tsg.parameters_generation.parameter_types import ParameterType
+from tsg.parameters_generation.parameter_types import ParameterType, get_parameter_specs
 from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
 from tsg.time_series import TimeSeries
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.utils.typing import NDArrayFloat64T, ParameterSpecsT
 
 
 class ParametersGenerator(ABC):
@@ -22,7 +23,7 @@ class ParametersGenerator(ABC):
         self.lag = lag
         self.linspace_info = linspace_info
         self._parameters_generation_method = parameters_generation_method
-        self.parameters_required = parameters_required
+        self.parameter_specs = get_parameter_specs(parameters_required)
 
     @property
     def parameters_generation_method(self) -> ParametersGenerationMethod:
@@ -36,16 +37,49 @@ class ParametersGenerator(ABC):
 
     @abstractmethod
     def generate_parameters(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         pass
 
     @abstractmethod
     def generate_init_values(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         pass
 
+    def generate_batch_parameters(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return self.parameters_generation_method.generate_batch_parameters(
+            parameter_specs=self.parameter_specs,
+            num_values=batch_size,
+            source_data=source_data,
+            rng=rng,
+        )
+
+    def generate_batch_init_values(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return np.array(
+            [
+                self.generate_init_values(
+                    source_data=source_data[i] if source_data is not None else None,
+                    rng=rng,
+                )
+                for i in range(batch_size)
+            ]
+        )
+
 
 class Process(ABC):
     def __init__(
@@ -76,6 +110,14 @@ class Process(ABC):
     def parameters_generator(self) -> ParametersGenerator:
         pass
 
+    @property
+    def parameter_specs(self) -> ParameterSpecsT:
+        return self.parameters_generator.parameter_specs
+
+    @property
+    def state_size(self) -> int:
+        return max(self.lag, 1)
+
     @property
     def linspace_info(self) -> LinspaceInfo:
         return self._linspace_info
@@ -98,13 +140,67 @@ class Process(ABC):
         self._parameters_generation_method = parameters_generation_method
 
     @abstractmethod
+    def fill_values(
+        self,
+        out: NDArrayFloat64T,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T | None:
+        """
+        Writes a segment with the given parameters into out.
+
+        Only the last state_size previous values are used, so callers pass
+        just that tail of the series. The returned initial values of the
+        segment are informational and are only used for get_info.
+        """
+        pass
+
     def generate_time_series(
         self,
         data: tuple[int, NDArrayFloat64T],
         previous_values: NDArrayFloat64T | None = None,
         source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        out: NDArrayFloat64T | None = None,
     ) -> tuple[TimeSeries, dict]:
-        pass
+        time_series = TimeSeries(data[0], values=out)
+        init_values = self.fill_values(
+            time_series.get_segment(data[0]),
+            data[1],
+            previous_values=previous_values,
+            source_data=source_data,
+            rng=rng,
+        )
+        time_series.add_segment((self.name, data))
+        return time_series, self.get_info(data, init_values)
+
+    def generate_batch(
+        self,
+        num_steps: int,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
+        batch_size = parameters.shape[0]
+        batch_values = (
+            np.empty(shape=(batch_size, num_steps), dtype=dtype) if out is None else out
+        )
+        for i in range(batch_size):
+            self.fill_values(
+                batch_values[i],
+                parameters[i],
+                previous_values=(
+                    previous_values[i] if previous_values is not None else None
+                ),
+                source_data=source_data[i] if source_data is not None else None,
+                rng=rng,
+            )
+        return batch_values
 
     def get_info(
         self,
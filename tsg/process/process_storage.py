@@ -1,5 +1,4 @@
-from random import choice
-
+import numpy as np
 from hydra.utils import instantiate
 from omegaconf import DictConfig
 
@@ -14,6 +13,7 @@ from tsg.process.simple_exponential_smoothing import SimpleExponentialSmoothing
 from tsg.process.simple_random_walk import SimpleRandomWalk
 from tsg.process.triple_exponential_smoothing import TripleExponentialSmoothing
 from tsg.process.white_noise import WhiteNoise
+from tsg.utils.rng import get_rng
 
 ALL_PROCESSES = {
     "white_noise": WhiteNoise,
@@ -77,9 +77,15 @@ class ProcessStorage:
                 print(f"Process {process_name} not found in process list.")
         return processes
 
-    def get_random_processes(self, num_processes: int) -> list[Process]:
+    def get_random_processes(
+        self, num_processes: int, rng: np.random.Generator | None = None
+    ) -> list[Process]:
         processes: list[Process] = list(self.processes.values())
-        return [choice(processes) for _ in range(num_processes)]
+        indexes = get_rng(rng).integers(0, len(processes), num_processes)
+        return [processes[i] for i in indexes]
+
+    def get_process_names(self) -> list[str]:
+        return list(self.processes.keys())
 
     def contains(self, process_name: str) -> bool:
         return process_name in self.processes.keys()
@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.aggregation_method import AggregationMethod
@@ -8,7 +8,7 @@ from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
 from tsg.process.process import ParametersGenerator, Process
-from tsg.time_series import TimeSeries
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 from tsg.utils.utils import draw_process_plot
 
@@ -31,23 +31,41 @@ class RWParametersGenerator(ParametersGenerator):
         self.init_values_coeff = init_values_coeff
 
     def generate_parameters(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return self.parameters_generation_method.generate_all_parameters(
-            parameters_required=self.parameters_required,
+            parameter_specs=self.parameter_specs,
             source_data=source_data,
+            rng=rng,
         )
 
     def generate_init_values(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return np.array(
             [
-                self.parameters_generation_method.get_mean_value(source_data)
+                self.parameters_generation_method.get_mean_value(source_data, rng=rng)
                 * self.init_values_coeff
             ]
         )
 
+    def generate_batch_init_values(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return (
+            self.parameters_generation_method.get_batch_mean_values(
+                source_data, batch_size, rng=rng
+            )
+            * self.init_values_coeff
+        )[:, None]
+
 
 class RandomWalk(Process):
     def __init__(
@@ -60,11 +78,12 @@ class RandomWalk(Process):
             linspace_info=linspace_info,
             parameters_generation_method=parameters_generation_method,
         )
+        self._parameters: list[ParameterType] = [StdType()]
         self._parameters_generator = RWParametersGenerator(
             lag=self.lag,
             linspace_info=self.linspace_info,
             parameters_generation_method=parameters_generation_method,
-            parameters_required=self.parameters,
+            parameters_required=self._parameters,
             init_values_coeff=init_values_coeff,
         )
 
@@ -74,7 +93,7 @@ class RandomWalk(Process):
 
     @property
     def parameters(self) -> list[ParameterType]:
-        return [StdType()]
+        return self._parameters
 
     @property
     def lag(self) -> int:
@@ -84,33 +103,78 @@ class RandomWalk(Process):
     def parameters_generator(self) -> ParametersGenerator:
         return self._parameters_generator
 
-    def generate_time_series(
+    def fill_values(
         self,
-        data: tuple[int, NDArrayFloat64T],
+        out: NDArrayFloat64T,
+        parameters: NDArrayFloat64T,
         previous_values: NDArrayFloat64T | None = None,
         source_data: NDArrayFloat64T | None = None,
-    ) -> tuple[TimeSeries, dict]:
-        values = np.array([0.0 for _ in range(0, data[0])])
-        values_to_add = data[0]
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T | None:
         if previous_values is None:
-            values[0] = self.parameters_generator.generate_init_values(
-                source_data=source_data
+            start_value = self.parameters_generator.generate_init_values(
+                source_data=source_data, rng=rng
             )[0]
-            previous_value = values[0]
-            values_to_add -= 1
         else:
-            previous_value = previous_values[-1]
-        for i in range(data[0] - values_to_add, data[0]):
-            previous_value += np.random.normal(0.0, data[1][0])
-            values[i] = previous_value
-        rw_time_series = TimeSeries(data[0])
-        rw_time_series.add_values(values, (self.name, data))
+            start_value = previous_values[-1]
+        self.walk(
+            start_values=np.array([start_value]),
+            std=parameters[:1],
+            num_steps=len(out),
+            include_start=previous_values is None,
+            out=out[None, :],
+            rng=rng,
+        )
+        return np.array([start_value])
+
+    def generate_batch(
+        self,
+        num_steps: int,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
         if previous_values is None:
-            return rw_time_series, self.get_info(
-                data, np.array(values[0 : data[0] - values_to_add])
-            )
+            start_values = self.parameters_generator.generate_batch_init_values(
+                batch_size=parameters.shape[0], source_data=source_data, rng=rng
+            )[:, 0]
         else:
-            return rw_time_series, self.get_info(data, np.array([previous_values[-1]]))
+            start_values = previous_values[:, -1]
+        return self.walk(
+            start_values=start_values,
+            std=parameters[:, 0],
+            num_steps=num_steps,
+            include_start=previous_values is None,
+            out=out,
+            rng=rng,
+            dtype=dtype,
+        )
+
+    @staticmethod
+    def walk(
+        start_values: NDArrayFloat64T,
+        std: NDArrayFloat64T,
+        num_steps: int,
+        include_start: bool = True,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
+        batch_size = start_values.shape[0]
+        start_index = 1 if include_start else 0
+        increments = get_rng(rng).normal(
+            0.0, std[:, None], size=(batch_size, num_steps - start_index)
+        )
+        values = (
+            np.empty(shape=(batch_size, num_steps), dtype=dtype) if out is None else out
+        )
+        values[:, :start_index] = start_values[:, None]
+        np.cumsum(increments, axis=1, out=values[:, start_index:])
+        values[:, start_index:] += start_values[:, None]
+        return values
 
 
 def show_plot() -> None:
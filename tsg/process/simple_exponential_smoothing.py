@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.aggregation_method import AggregationMethod
@@ -13,7 +13,6 @@ from tsg.parameters_generation.parameters_generation_method import (
 )
 from tsg.process.ets_process_resources.ets_process_builder import ETSProcessBuilder
 from tsg.process.process import ParametersGenerator, Process
-from tsg.time_series import TimeSeries
 from tsg.utils.typing import NDArrayFloat64T
 from tsg.utils.utils import draw_process_plot
 
@@ -38,23 +37,41 @@ class SESParametersGenerator(ParametersGenerator):
         self.long_term_coeff_range = long_term_coeff_range
 
     def generate_parameters(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return self.parameters_generation_method.generate_all_parameters(
-            parameters_required=self.parameters_required,
+            parameter_specs=self.parameter_specs,
             source_data=source_data,
+            rng=rng,
         )
 
     def generate_init_values(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return np.array(
             [
-                self.parameters_generation_method.get_mean_value(source_data)
+                self.parameters_generation_method.get_mean_value(source_data, rng=rng)
                 * self.init_values_coeff
             ]
         )
 
+    def generate_batch_init_values(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return (
+            self.parameters_generation_method.get_batch_mean_values(
+                source_data, batch_size, rng=rng
+            )
+            * self.init_values_coeff
+        )[:, None]
+
 
 class SimpleExponentialSmoothing(Process):
     def __init__(
@@ -69,11 +86,15 @@ class SimpleExponentialSmoothing(Process):
             linspace_info=linspace_info,
             parameters_generation_method=parameters_generation_method,
         )
+        self._parameters: list[ParameterType] = [
+            StdType(),
+            CoefficientType(constraints=np.array(self.long_term_coeff_range)),
+        ]
         self._parameters_generator = SESParametersGenerator(
             lag=self.lag,
             linspace_info=self.linspace_info,
             parameters_generation_method=parameters_generation_method,
-            parameters_required=self.parameters,
+            parameters_required=self._parameters,
             init_values_coeff=init_values_coeff,
             long_term_coeff_range=long_term_coeff_range,
         )
@@ -84,10 +105,7 @@ class SimpleExponentialSmoothing(Process):
 
     @property
     def parameters(self) -> list[ParameterType]:
-        return [
-            StdType(),
-            CoefficientType(constraints=np.array(self.long_term_coeff_range)),
-        ]
+        return self._parameters
 
     @property
     def lag(self) -> int:
@@ -97,24 +115,55 @@ class SimpleExponentialSmoothing(Process):
     def parameters_generator(self) -> ParametersGenerator:
         return self._parameters_generator
 
-    def generate_time_series(
+    def fill_values(
         self,
-        data: tuple[int, NDArrayFloat64T],
+        out: NDArrayFloat64T,
+        parameters: NDArrayFloat64T,
         previous_values: NDArrayFloat64T | None = None,
         source_data: NDArrayFloat64T | None = None,
-    ) -> tuple[TimeSeries, dict]:
-        ets_values = ETSProcessBuilder(data[0])
-        ets_values.set_normal_error(mean=0.0, std=data[1][1])
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T | None:
+        ets_values = ETSProcessBuilder(
+            len(out), num_components=2, rng=rng, dtype=out.dtype
+        )
+        ets_values.set_normal_error(mean=0.0, std=parameters[1])
         if previous_values is None:
             init_value = self.parameters_generator.generate_init_values(
-                source_data=source_data
+                source_data=source_data, rng=rng
             )[0]
         else:
             init_value = previous_values[-1]
-        ets_values.set_long_term(init_value=init_value, parameter=data[1][0])
-        exp_time_series = TimeSeries(data[0])
-        exp_time_series.add_values(ets_values.generate_values(), (self.name, data))
-        return exp_time_series, self.get_info(data, init_value)
+        ets_values.set_long_term(init_value=init_value, parameter=parameters[0])
+        ets_values.generate_values(out)
+        return np.array([init_value])
+
+    def generate_batch(
+        self,
+        num_steps: int,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
+        batch_size = parameters.shape[0]
+        ets_values = ETSProcessBuilder(
+            num_steps,
+            batch_size=batch_size,
+            num_components=2,
+            rng=rng,
+            dtype=out.dtype if out is not None else dtype,
+        )
+        ets_values.set_normal_error(mean=0.0, std=parameters[:, 1])
+        if previous_values is None:
+            init_values = self.parameters_generator.generate_batch_init_values(
+                batch_size=batch_size, source_data=source_data, rng=rng
+            )[:, 0]
+        else:
+            init_values = previous_values[:, -1]
+        ets_values.set_long_term(init_value=init_values, parameter=parameters[:, 0])
+        return ets_values.generate_values(out=out)
 
 
 def show_plot() -> None:
@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.aggregation_method import AggregationMethod
@@ -12,7 +12,7 @@ from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
 from tsg.process.process import ParametersGenerator, Process
-from tsg.time_series import TimeSeries
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 from tsg.utils.utils import draw_process_plot
 
@@ -43,26 +43,55 @@ class SRWParametersGenerator(ParametersGenerator):
         )
 
     def generate_parameters(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         parameters = self.parameters_generation_method.generate_all_parameters(
-            parameters_required=self.parameters_required,
+            parameter_specs=self.parameter_specs,
             source_data=source_data,
+            rng=rng,
         )
         if self.fixed_walk is not None:
             parameters[1] = self.fixed_walk
         return parameters
 
+    def generate_batch_parameters(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        parameters = super().generate_batch_parameters(batch_size, source_data, rng)
+        if self.fixed_walk is not None:
+            parameters[:, 1] = self.fixed_walk
+        return parameters
+
     def generate_init_values(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return np.array(
             [
-                self.parameters_generation_method.get_mean_value(source_data)
+                self.parameters_generation_method.get_mean_value(source_data, rng=rng)
                 * self.init_values_coeff
             ]
         )
 
+    def generate_batch_init_values(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return (
+            self.parameters_generation_method.get_batch_mean_values(
+                source_data, batch_size, rng=rng
+            )
+            * self.init_values_coeff
+        )[:, None]
+
 
 class SimpleRandomWalk(Process):
     def __init__(
@@ -77,11 +106,12 @@ class SimpleRandomWalk(Process):
             linspace_info=linspace_info,
             parameters_generation_method=parameters_generation_method,
         )
+        self._parameters: list[ParameterType] = [CoefficientType(), StdType()]
         self._parameters_generator = SRWParametersGenerator(
             lag=self.lag,
             linspace_info=self.linspace_info,
             parameters_generation_method=parameters_generation_method,
-            parameters_required=self.parameters,
+            parameters_required=self._parameters,
             init_values_coeff=init_values_coeff,
             fixed_walk=fixed_walk,
             fixed_up_probability=fixed_up_probability,
@@ -93,7 +123,7 @@ class SimpleRandomWalk(Process):
 
     @property
     def parameters(self) -> list[ParameterType]:
-        return [CoefficientType(), StdType()]
+        return self._parameters
 
     @property
     def lag(self) -> int:
@@ -103,38 +133,83 @@ class SimpleRandomWalk(Process):
     def parameters_generator(self) -> ParametersGenerator:
         return self._parameters_generator
 
-    def generate_time_series(
+    def fill_values(
         self,
-        data: tuple[int, NDArrayFloat64T],
+        out: NDArrayFloat64T,
+        parameters: NDArrayFloat64T,
         previous_values: NDArrayFloat64T | None = None,
         source_data: NDArrayFloat64T | None = None,
-    ) -> tuple[TimeSeries, dict]:
-        up_probability, walk = data[1]
-        values = np.array([0.0 for _ in range(0, data[0])])
-        values_to_add = data[0]
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T | None:
         if previous_values is None:
-            init_values = self.parameters_generator.generate_init_values(
-                source_data=source_data
-            )
-            values[0 : len(init_values)] = init_values
-            values_to_add -= len(init_values)
-            previous_value = init_values[-1]
+            start_value = self.parameters_generator.generate_init_values(
+                source_data=source_data, rng=rng
+            )[-1]
         else:
-            previous_value = previous_values[-1]
-        for i in range(data[0] - values_to_add, data[0]):
-            if np.random.uniform(0, 1) < up_probability:
-                previous_value += walk
-            else:
-                previous_value -= walk
-            values[i] = previous_value
-        rw_time_series = TimeSeries(data[0])
-        rw_time_series.add_values(values, (self.name, data))
+            start_value = previous_values[-1]
+        self.walk(
+            start_values=np.array([start_value]),
+            up_probability=parameters[:1],
+            walk=parameters[1:2],
+            num_steps=len(out),
+            include_start=previous_values is None,
+            out=out[None, :],
+            rng=rng,
+        )
+        return np.array([start_value])
+
+    def generate_batch(
+        self,
+        num_steps: int,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
         if previous_values is None:
-            return rw_time_series, self.get_info(
-                data, np.array(values[0 : data[0] - values_to_add])
-            )
+            start_values = self.parameters_generator.generate_batch_init_values(
+                batch_size=parameters.shape[0], source_data=source_data, rng=rng
+            )[:, -1]
         else:
-            return rw_time_series, self.get_info(data, np.array([previous_values[-1]]))
+            start_values = previous_values[:, -1]
+        return self.walk(
+            start_values=start_values,
+            up_probability=parameters[:, 0],
+            walk=parameters[:, 1],
+            num_steps=num_steps,
+            include_start=previous_values is None,
+            out=out,
+            rng=rng,
+            dtype=dtype,
+        )
+
+    @staticmethod
+    def walk(
+        start_values: NDArrayFloat64T,
+        up_probability: NDArrayFloat64T,
+        walk: NDArrayFloat64T,
+        num_steps: int,
+        include_start: bool = True,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
+        batch_size = start_values.shape[0]
+        start_index = 1 if include_start else 0
+        is_up = (
+            get_rng(rng).uniform(0, 1, size=(batch_size, num_steps - start_index))
+            < up_probability[:, None]
+        )
+        increments = np.where(is_up, walk[:, None], -walk[:, None])
+        values = (
+            np.empty(shape=(batch_size, num_steps), dtype=dtype) if out is None else out
+        )
+        values[:, :start_index] = start_values[:, None]
+        np.cumsum(increments, axis=1, out=values[:, start_index:])
+        values[:, start_index:] += start_values[:, None]
+        return values
 
 
 def show_plot() -> None:
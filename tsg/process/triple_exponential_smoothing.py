@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.aggregation_method import AggregationMethod
@@ -13,7 +13,7 @@ from tsg.parameters_generation.parameters_generation_method import (
 )
 from tsg.process.ets_process_resources.ets_process_builder import ETSProcessBuilder
 from tsg.process.process import ParametersGenerator, Process
-from tsg.time_series import TimeSeries
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 from tsg.utils.utils import draw_process_plot
 
@@ -41,23 +41,52 @@ class TESParametersGenerator(ParametersGenerator):
         self.seasonal_coeff_range = seasonal_coeff_range
 
     def generate_parameters(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return self.parameters_generation_method.generate_all_parameters(
-            parameters_required=self.parameters_required
+            parameter_specs=self.parameter_specs, rng=rng
         )
 
+    def generate_batch_parameters(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        return super().generate_batch_parameters(batch_size, rng=rng)
+
     def generate_init_values(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         init_values = np.zeros((3, self.lag))
         init_values[0][0] = self.parameters_generation_method.get_mean_value(
-            source_data
+            source_data, rng=rng
+        )
+        init_values[2][1:] = np.cumsum(
+            get_rng(rng).normal(0.0, self.linspace_info.step, self.lag - 1)
+        )
+        return init_values
+
+    def generate_batch_init_values(
+        self,
+        batch_size: int,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T:
+        init_values = np.zeros((batch_size, 3, self.lag))
+        init_values[:, 0, 0] = self.parameters_generation_method.get_batch_mean_values(
+            source_data, batch_size, rng=rng
+        )
+        init_values[:, 2, 1:] = np.cumsum(
+            get_rng(rng).normal(
+                0.0, self.linspace_info.step, (batch_size, self.lag - 1)
+            ),
+            axis=1,
         )
-        for i in range(1, self.lag):
-            init_values[2][i] = init_values[2][i - 1] + np.random.normal(
-                0.0, self.linspace_info.step
-            )
         return init_values
 
 
@@ -79,11 +108,17 @@ class TripleExponentialSmoothing(Process):
             linspace_info=linspace_info,
             parameters_generation_method=parameters_generation_method,
         )
+        self._parameters: list[ParameterType] = [
+            StdType(),
+            CoefficientType(constraints=np.array(self.long_term_coeff_range)),
+            CoefficientType(constraints=np.array(self.trend_coeff_range)),
+            CoefficientType(constraints=np.array(self.seasonal_coeff_range)),
+        ]
         self._parameters_generator = TESParametersGenerator(
             lag=self.lag,
             linspace_info=self.linspace_info,
             parameters_generation_method=parameters_generation_method,
-            parameters_required=self.parameters,
+            parameters_required=self._parameters,
             long_term_coeff_range=long_term_coeff_range,
             trend_coeff_range=trend_coeff_range,
             seasonal_coeff_range=seasonal_coeff_range,
@@ -95,12 +130,7 @@ class TripleExponentialSmoothing(Process):
 
     @property
     def parameters(self) -> list[ParameterType]:
-        return [
-            StdType(),
-            CoefficientType(constraints=np.array(self.long_term_coeff_range)),
-            CoefficientType(constraints=np.array(self.trend_coeff_range)),
-            CoefficientType(constraints=np.array(self.seasonal_coeff_range)),
-        ]
+        return self._parameters
 
     @property
     def lag(self) -> int:
@@ -110,33 +140,38 @@ class TripleExponentialSmoothing(Process):
     def parameters_generator(self) -> ParametersGenerator:
         return self._parameters_generator
 
-    def generate_time_series(
+    def fill_values(
         self,
-        data: tuple[int, NDArrayFloat64T],
+        out: NDArrayFloat64T,
+        parameters: NDArrayFloat64T,
         previous_values: NDArrayFloat64T | None = None,
         source_data: NDArrayFloat64T | None = None,
-    ) -> tuple[TimeSeries, dict]:
-        ets_values = ETSProcessBuilder(data[0])
-        ets_values.set_normal_error(mean=0.0, std=data[1][3])
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T | None:
+        ets_values = ETSProcessBuilder(
+            len(out), num_components=4, rng=rng, dtype=out.dtype
+        )
+        ets_values.set_normal_error(mean=0.0, std=parameters[3])
         if previous_values is None or len(previous_values) < 1:
             init_values = self.parameters_generator.generate_init_values(
-                source_data=source_data
+                source_data=source_data, rng=rng
             )
             long_term_init_value = init_values[0][0]
             trend_init_value = init_values[1][0]
             seasonality_init_values = init_values[2]
         elif len(previous_values) < self.lag:
             init_values = self.parameters_generator.generate_init_values(
-                source_data=source_data
+                source_data=source_data, rng=rng
             )
             long_term_init_value = previous_values[-1]
             trend_init_value = init_values[1][0]
             seasonality_init_values = np.array([0.0 for _ in range(self.lag)])
             seasonality_init_values[: len(previous_values)] = previous_values
-            for i in range(len(previous_values), self.lag):
-                seasonality_init_values[i] = np.random.normal(
-                    previous_values[-1], self.linspace_info.step
-                )
+            seasonality_init_values[len(previous_values) :] = get_rng(rng).normal(
+                previous_values[-1],
+                self.linspace_info.step,
+                self.lag - len(previous_values),
+            )
         else:
             long_term_init_value = previous_values[-1]
             trend_init_value = 0.0
@@ -144,21 +179,74 @@ class TripleExponentialSmoothing(Process):
         ets_values.set_seasonal(
             lag=self.lag,
             init_values=seasonality_init_values / sum(seasonality_init_values),
-            parameter=data[1][2],
+            parameter=parameters[2],
         )
         trend_index = ets_values.set_trend(
-            init_value=trend_init_value, parameter=data[1][1]
+            init_value=trend_init_value, parameter=parameters[1]
         )
         ets_values.set_long_term(
             init_value=long_term_init_value,
-            parameter=data[1][0],
+            parameter=parameters[0],
             add_component_indexes=[trend_index],
         )
-        trend_time_series = TimeSeries(data[0])
-        trend_time_series.add_values(ets_values.generate_values(), (self.name, data))
-        return trend_time_series, self.get_info(
-            data, np.array([long_term_init_value, trend_init_value])
+        ets_values.generate_values(out)
+        return np.array([long_term_init_value, trend_init_value])
+
+    def generate_batch(
+        self,
+        num_steps: int,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
+        batch_size = parameters.shape[0]
+        ets_values = ETSProcessBuilder(
+            num_steps,
+            batch_size=batch_size,
+            num_components=4,
+            rng=rng,
+            dtype=out.dtype if out is not None else dtype,
+        )
+        ets_values.set_normal_error(mean=0.0, std=parameters[:, 3])
+        if previous_values is None or previous_values.shape[1] < 1:
+            init_values = self.parameters_generator.generate_batch_init_values(
+                batch_size=batch_size, source_data=source_data, rng=rng
+            )
+            long_term_init_values = init_values[:, 0, 0]
+            trend_init_values = init_values[:, 1, 0]
+            seasonality_init_values = init_values[:, 2]
+        else:
+            num_previous = previous_values.shape[1]
+            long_term_init_values = previous_values[:, -1]
+            trend_init_values = np.zeros(batch_size)
+            if num_previous < self.lag:
+                seasonality_init_values = np.zeros(shape=(batch_size, self.lag))
+                seasonality_init_values[:, :num_previous] = previous_values
+                seasonality_init_values[:, num_previous:] = get_rng(rng).normal(
+                    previous_values[:, [-1]],
+                    self.linspace_info.step,
+                    size=(batch_size, self.lag - num_previous),
+                )
+            else:
+                seasonality_init_values = previous_values[:, -self.lag :]
+        ets_values.set_seasonal(
+            lag=self.lag,
+            init_values=seasonality_init_values
+            / seasonality_init_values.sum(axis=1, keepdims=True),
+            parameter=parameters[:, 2],
+        )
+        trend_index = ets_values.set_trend(
+            init_value=trend_init_values, parameter=parameters[:, 1]
+        )
+        ets_values.set_long_term(
+            init_value=long_term_init_values,
+            parameter=parameters[:, 0],
+            add_component_indexes=[trend_index],
         )
+        return ets_values.generate_values(out=out)
 
 
 def show_plot() -> None:
@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.parameters_generation.aggregation_method import AggregationMethod
@@ -8,7 +8,7 @@ from tsg.parameters_generation.parameters_generation_method import (
     ParametersGenerationMethod,
 )
 from tsg.process.process import ParametersGenerator, Process
-from tsg.time_series import TimeSeries
+from tsg.utils.rng import fill_standard_normal, get_rng
 from tsg.utils.typing import NDArrayFloat64T
 from tsg.utils.utils import draw_process_plot
 
@@ -29,15 +29,20 @@ class WNParametersGenerator(ParametersGenerator):
         )
 
     def generate_parameters(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return self.parameters_generation_method.generate_all_parameters(
-            parameters_required=self.parameters_required,
+            parameter_specs=self.parameter_specs,
             source_data=source_data,
+            rng=rng,
         )
 
     def generate_init_values(
-        self, source_data: NDArray | None = None
+        self,
+        source_data: NDArray | None = None,
+        rng: np.random.Generator | None = None,
     ) -> NDArrayFloat64T:
         return np.array([])
 
@@ -52,11 +57,12 @@ class WhiteNoise(Process):
             linspace_info=linspace_info,
             parameters_generation_method=parameters_generation_method,
         )
+        self._parameters: list[ParameterType] = [MeanType(), StdType()]
         self._parameters_generator = WNParametersGenerator(
             lag=self.lag,
             linspace_info=self.linspace_info,
             parameters_generation_method=parameters_generation_method,
-            parameters_required=self.parameters,
+            parameters_required=self._parameters,
         )
 
     @property
@@ -65,7 +71,7 @@ class WhiteNoise(Process):
 
     @property
     def parameters(self) -> list[ParameterType]:
-        return [MeanType(), StdType()]
+        return self._parameters
 
     @property
     def lag(self) -> int:
@@ -75,20 +81,50 @@ class WhiteNoise(Process):
     def parameters_generator(self) -> ParametersGenerator:
         return self._parameters_generator
 
-    def generate_time_series(
+    def fill_values(
+        self,
+        out: NDArrayFloat64T,
+        parameters: NDArrayFloat64T,
+        previous_values: NDArrayFloat64T | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> NDArrayFloat64T | None:
+        rng = get_rng(rng)
+        if previous_values is None:
+            mean, std = parameters[0], parameters[1]
+        else:
+            mean = previous_values[-1]
+            std = self.linspace_info.generate_std(rng=rng)
+        fill_standard_normal(rng, out)
+        out *= std
+        out += mean
+        return None
+
+    def generate_batch(
         self,
-        data: tuple[int, NDArrayFloat64T],
+        num_steps: int,
+        parameters: NDArrayFloat64T,
         previous_values: NDArrayFloat64T | None = None,
         source_data: NDArrayFloat64T | None = None,
-    ) -> tuple[TimeSeries, dict]:
+        out: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> NDArrayFloat64T:
+        rng = get_rng(rng)
+        batch_size = parameters.shape[0]
         if previous_values is None:
-            wn_values = np.random.normal(data[1][0], data[1][1], size=data[0])
+            mean = parameters[:, [0]]
+            std = parameters[:, [1]]
         else:
-            std = self.linspace_info.generate_std()
-            wn_values = np.random.normal(previous_values[-1], std, data[0])
-        wn_time_series = TimeSeries(data[0])
-        wn_time_series.add_values(wn_values, (self.name, data))
-        return wn_time_series, self.get_info(data)
+            mean = previous_values[:, [-1]]
+            std = self.linspace_info.generate_batch_std(batch_size, rng=rng)[:, None]
+        values = (
+            np.empty(shape=(batch_size, num_steps), dtype=dtype) if out is None else out
+        )
+        fill_standard_normal(rng, values)
+        values *= std
+        values += mean
+        return values
 
 
 if __name__ == "__main__":
@@ -0,0 +1,254 @@
+import numpy as np
+
+from tsg.time_series import TimeSeries
+from tsg.utils.typing import (
+    LayoutT,
+    NDArrayFloat64T,
+    NDArrayIntT,
+    ProcessConfigT,
+    ProcessDataT,
+)
+
+
+class ScheduleBatch:
+    """
+    Structure-of-arrays representation of the schedules of a batch of series.
+
+    Attributes
+    ----------
+    process_names : list[str]
+        names of the processes, process_ids index this list;
+    series_offsets : array(shape=(num_series + 1,))
+        segments of the i-th series are series_offsets[i]:series_offsets[i + 1];
+    segment_starts : array(shape=(num_segments,))
+        index of the first step of each segment within its series;
+    segment_lengths : array(shape=(num_segments,))
+        number of steps of each segment;
+    process_ids : array(shape=(num_segments,))
+        process of each segment;
+    parameters : ndarray(shape=(num_segments, max_num_parameters))
+        process parameters of each segment padded with nan;
+    num_parameters : array(shape=(num_segments,))
+        number of parameters of each segment.
+    """
+
+    def __init__(
+        self,
+        process_names: list[str],
+        series_offsets: NDArrayIntT,
+        segment_starts: NDArrayIntT,
+        segment_lengths: NDArrayIntT,
+        process_ids: NDArrayIntT,
+        parameters: NDArrayFloat64T,
+        num_parameters: NDArrayIntT,
+    ) -> None:
+        self.process_names = process_names
+        self.series_offsets = series_offsets
+        self.segment_starts = segment_starts
+        self.segment_lengths = segment_lengths
+        self.process_ids = process_ids
+        self.parameters = parameters
+        self.num_parameters = num_parameters
+
+    @property
+    def num_series(self) -> int:
+        return len(self.series_offsets) - 1
+
+    @property
+    def num_segments(self) -> int:
+        return len(self.segment_lengths)
+
+    @classmethod
+    def from_schedules(
+        cls, schedules: list[list[ProcessDataT]], process_names: list[str]
+    ) -> "ScheduleBatch":
+        return cls.from_metadata(
+            [
+                [
+                    (process_name, process_data)
+                    for process_name, process_schedule in schedule
+                    for process_data in process_schedule
+                ]
+                for schedule in schedules
+            ],
+            process_names,
+        )
+
+    @classmethod
+    def from_time_series(
+        cls, ts_list: list[TimeSeries], process_names: list[str]
+    ) -> "ScheduleBatch":
+        return cls.from_metadata([ts.metadata for ts in ts_list], process_names)
+
+    @classmethod
+    def from_metadata(
+        cls, metadata: list[list[ProcessConfigT]], process_names: list[str]
+    ) -> "ScheduleBatch":
+        process_ids = {name: i for i, name in enumerate(process_names)}
+        series_offsets = np.zeros(len(metadata) + 1, dtype=np.int_)
+        series_offsets[1:] = np.cumsum([len(segments) for segments in metadata])
+        num_segments = int(series_offsets[-1])
+        max_num_parameters = max(
+            (len(data[1]) for segments in metadata for _, data in segments), default=0
+        )
+        batch = cls.empty(process_names, num_segments, max_num_parameters)
+        batch.series_offsets = series_offsets
+        segment = 0
+        for segments in metadata:
+            start = 0
+            for process_name, (steps, parameters) in segments:
+                batch.segment_starts[segment] = start
+                batch.segment_lengths[segment] = steps
+                batch.process_ids[segment] = process_ids[process_name]
+                batch.num_parameters[segment] = len(parameters)
+                batch.parameters[segment, : len(parameters)] = parameters
+                start += steps
+                segment += 1
+        return batch
+
+    @classmethod
+    def scatter(
+        cls,
+        batches: list["ScheduleBatch"],
+        series_indexes: list[NDArrayIntT],
+        process_names: list[str],
+    ) -> "ScheduleBatch":
+        num_series = sum(batch.num_series for batch in batches)
+        counts = np.zeros(num_series, dtype=np.int_)
+        for batch, indexes in zip(batches, series_indexes):
+            counts[indexes] = np.diff(batch.series_offsets)
+        max_num_parameters = max(
+            (batch.parameters.shape[1] for batch in batches), default=0
+        )
+        result = cls.empty(process_names, int(counts.sum()), max_num_parameters)
+        result.series_offsets = np.zeros(num_series + 1, dtype=np.int_)
+        result.series_offsets[1:] = np.cumsum(counts)
+        for batch, indexes in zip(batches, series_indexes):
+            series = np.repeat(
+                np.arange(batch.num_series), np.diff(batch.series_offsets)
+            )
+            segments = (
+                result.series_offsets[indexes][series]
+                + np.arange(batch.num_segments)
+                - batch.series_offsets[series]
+            )
+            result.segment_starts[segments] = batch.segment_starts
+            result.segment_lengths[segments] = batch.segment_lengths
+            result.process_ids[segments] = batch.process_ids
+            result.num_parameters[segments] = batch.num_parameters
+            result.parameters[segments, : batch.parameters.shape[1]] = batch.parameters
+        return result
+
+    @classmethod
+    def concatenate(
+        cls, batches: list["ScheduleBatch"], process_names: list[str]
+    ) -> "ScheduleBatch":
+        offsets = np.cumsum([0] + [batch.num_series for batch in batches])
+        return cls.scatter(
+            batches,
+            [np.arange(offsets[i], offsets[i + 1]) for i in range(len(batches))],
+            process_names,
+        )
+
+    def slice_series(self, start: int, stop: int) -> "ScheduleBatch":
+        segments = slice(self.series_offsets[start], self.series_offsets[stop])
+        return ScheduleBatch(
+            process_names=self.process_names,
+            series_offsets=self.series_offsets[start : stop + 1]
+            - self.series_offsets[start],
+            segment_starts=self.segment_starts[segments],
+            segment_lengths=self.segment_lengths[segments],
+            process_ids=self.process_ids[segments],
+            parameters=self.parameters[segments],
+            num_parameters=self.num_parameters[segments],
+        )
+
+    @classmethod
+    def empty(
+        cls, process_names: list[str], num_segments: int, max_num_parameters: int
+    ) -> "ScheduleBatch":
+        return cls(
+            process_names=process_names,
+            series_offsets=np.zeros(1, dtype=np.int_),
+            segment_starts=np.zeros(num_segments, dtype=np.int_),
+            segment_lengths=np.zeros(num_segments, dtype=np.int_),
+            process_ids=np.zeros(num_segments, dtype=np.int_),
+            parameters=np.full((num_segments, max_num_parameters), np.nan),
+            num_parameters=np.zeros(num_segments, dtype=np.int_),
+        )
+
+    def get_metadata(self, series_index: int) -> list[ProcessConfigT]:
+        return [
+            (
+                self.process_names[self.process_ids[segment]],
+                (
+                    int(self.segment_lengths[segment]),
+                    self.parameters[segment, : self.num_parameters[segment]],
+                ),
+            )
+            for segment in range(
+                self.series_offsets[series_index], self.series_offsets[series_index + 1]
+            )
+        ]
+
+    def get_time_series(self, series_index: int, values: NDArrayFloat64T) -> TimeSeries:
+        return TimeSeries(
+            len(values), values=values, metadata=self.get_metadata(series_index)
+        )
+
+    def get_layout(self, series_index: int) -> LayoutT:
+        segments = slice(
+            self.series_offsets[series_index], self.series_offsets[series_index + 1]
+        )
+        return tuple(
+            (self.process_names[process_id], steps)
+            for process_id, steps in zip(
+                self.process_ids[segments].tolist(),
+                self.segment_lengths[segments].tolist(),
+            )
+        )
+
+    def group_by_layout(self) -> dict[LayoutT, list[int]]:
+        if self.num_series > 0 and self.has_single_layout():
+            return {self.get_layout(0): list(range(self.num_series))}
+        groups: dict[LayoutT, list[int]] = {}
+        for i in range(self.num_series):
+            groups.setdefault(self.get_layout(i), []).append(i)
+        return groups
+
+    def has_single_layout(self) -> bool:
+        num_segments = np.diff(self.series_offsets)
+        if np.any(num_segments != num_segments[0]):
+            return False
+        shape = (self.num_series, int(num_segments[0]))
+        lengths = self.segment_lengths.reshape(shape)
+        process_ids = self.process_ids.reshape(shape)
+        return bool(
+            np.all(lengths == lengths[0]) and np.all(process_ids == process_ids[0])
+        )
+
+    def get_segment_parameters(
+        self, series_indexes: NDArrayIntT, position: int
+    ) -> NDArrayFloat64T:
+        segments = self.series_offsets[series_indexes] + position
+        return self.parameters[segments, : self.num_parameters[segments[0]]]
+
+    def get_segment_records(self) -> list[list[list]]:
+        starts = self.segment_starts.tolist()
+        ends = (self.segment_starts + self.segment_lengths - 1).tolist()
+        process_ids = self.process_ids.tolist()
+        num_parameters = self.num_parameters.tolist()
+        parameters = self.parameters.tolist()
+        offsets = self.series_offsets.tolist()
+        return [
+            [
+                [
+                    process_ids[segment],
+                    starts[segment],
+                    ends[segment],
+                    parameters[segment][: num_parameters[segment]],
+                ]
+                for segment in range(offsets[i], offsets[i + 1])
+            ]
+            for i in range(self.num_series)
+        ]
@@ -0,0 +1,76 @@
+import numpy as np
+
+from tsg.process.process import Process
+from tsg.process.process_storage import ProcessStorage
+from tsg.scheduler.schedule_batch import ScheduleBatch
+from tsg.utils.typing import NDArrayIntT, ProcessOrderT
+
+
+class ScheduleTemplate:
+    """
+    Precompiled process order of a scheduler shared by all of its schedules.
+
+    Attributes
+    ----------
+    process_names : list[str]
+        names of the processes of the storage, process_ids index this list;
+    processes : list[Process]
+        resolved process of each segment of the process order;
+    segment_lengths : array(shape=(num_segments,))
+        number of steps of each segment;
+    segment_starts : array(shape=(num_segments,))
+        index of the first step of each segment;
+    process_ids : array(shape=(num_segments,))
+        process of each segment;
+    num_parameters : array(shape=(num_segments,))
+        number of parameters of each segment;
+    is_stable : bool
+        whether every schedule has exactly these segments, so that
+        only the parameters differ between schedules.
+    """
+
+    def __init__(
+        self,
+        process_order: ProcessOrderT,
+        process_storage: ProcessStorage,
+        stable_parameters: bool = False,
+    ) -> None:
+        self.process_names = process_storage.get_process_names()
+        self.processes: list[Process] = process_storage.get_processes(
+            [process_name for _, process_name in process_order]
+        )
+        process_ids = {name: i for i, name in enumerate(self.process_names)}
+        self.segment_lengths: NDArrayIntT = np.array(
+            [steps for steps, _ in process_order], dtype=np.int_
+        )
+        self.segment_starts: NDArrayIntT = (
+            np.cumsum(self.segment_lengths) - self.segment_lengths
+        )
+        self.process_ids: NDArrayIntT = np.array(
+            [process_ids[process_name] for _, process_name in process_order],
+            dtype=np.int_,
+        )
+        self.num_parameters: NDArrayIntT = np.array(
+            [len(process.parameter_specs) for process in self.processes],
+            dtype=np.int_,
+        )
+        self.is_stable = stable_parameters or bool(np.all(self.segment_lengths == 1))
+
+    @property
+    def num_segments(self) -> int:
+        return len(self.processes)
+
+    def create_batch(self, num_series: int) -> ScheduleBatch:
+        batch = ScheduleBatch.empty(
+            self.process_names,
+            num_series * self.num_segments,
+            int(self.num_parameters.max(initial=0)),
+        )
+        batch.series_offsets = np.arange(
+            0, (num_series + 1) * self.num_segments, self.num_segments
+        )
+        batch.segment_lengths[:] = np.tile(self.segment_lengths, num_series)
+        batch.segment_starts[:] = np.tile(self.segment_starts, num_series)
+        batch.process_ids[:] = np.tile(self.process_ids, num_series)
+        batch.num_parameters[:] = np.tile(self.num_parameters, num_series)
+        return batch
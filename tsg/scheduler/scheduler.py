@@ -4,6 +4,9 @@ import numpy as np
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.process.process_storage import ProcessStorage
+from tsg.scheduler.schedule_batch import ScheduleBatch
+from tsg.scheduler.schedule_template import ScheduleTemplate
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T, ProcessDataT, ProcessOrderT
 
 
@@ -16,37 +19,60 @@ class Scheduler:
         strict_num_parts: bool = True,
         stable_parameters: bool = False,
         process_order: ProcessOrderT | None = None,
+        rng: np.random.Generator | None = None,
     ) -> None:
         self.num_steps = num_steps
         self.linspace_info = linspace_info
         self.strict_num_parts = strict_num_parts
         self.stable_parameters = stable_parameters
         self.process_storage = process_storage
+        self._template: ScheduleTemplate | None = None
         self.process_order = (
             process_order
             if process_order is not None
-            else self.generate_process_order()
+            else self.generate_process_order(rng)
         )
 
+    @property
+    def process_order(self) -> ProcessOrderT:
+        return self._process_order
+
+    @process_order.setter
+    def process_order(self, process_order: ProcessOrderT) -> None:
+        self._process_order = process_order
+        self._template = None
+
+    @property
+    def template(self) -> ScheduleTemplate:
+        if self._template is None:
+            self._template = ScheduleTemplate(
+                self.process_order, self.process_storage, self.stable_parameters
+            )
+        return self._template
+
     def generate_schedule(
-        self, source_data: NDArrayFloat64T | None = None
+        self,
+        source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
     ) -> list[ProcessDataT]:
+        rng = get_rng(rng)
         schedule = []
-        for steps, process_name in self.process_order:
-            process = self.process_storage.get_processes([process_name])[0]
+        for (steps, process_name), process in zip(
+            self.process_order, self.template.processes
+        ):
             process_data: ProcessDataT = (process_name, [])
             if self.stable_parameters or steps == 1:
                 process_data[1].append(
                     (
                         steps,
                         process.parameters_generator.generate_parameters(
-                            source_data=source_data
+                            source_data=source_data, rng=rng
                         ),
                     )
                 )
             else:
                 parameters_steps = self.generate_steps_number(
-                    steps, np.random.randint(1, steps)
+                    steps, int(rng.integers(1, steps)), rng=rng
                 )
                 num_parts = len(parameters_steps)
                 for i in range(num_parts):
@@ -54,21 +80,54 @@ class Scheduler:
                         (
                             parameters_steps[i],
                             process.parameters_generator.generate_parameters(
-                                source_data=source_data
+                                source_data=source_data, rng=rng
                             ),
                         )
                     )
             schedule.append(process_data)
         return schedule
 
-    def generate_process_order(self) -> ProcessOrderT:
+    def generate_schedule_batch(
+        self,
+        num_series: int,
+        source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> ScheduleBatch:
+        rng = get_rng(rng)
+        template = self.template
+        if not template.is_stable:
+            return ScheduleBatch.from_schedules(
+                [
+                    self.generate_schedule(
+                        source_data=source_data[i] if source_data is not None else None,
+                        rng=rng,
+                    )
+                    for i in range(num_series)
+                ],
+                template.process_names,
+            )
+        batch = template.create_batch(num_series)
+        for j, process in enumerate(template.processes):
+            batch.parameters[
+                j :: template.num_segments, : template.num_parameters[j]
+            ] = process.parameters_generator.generate_batch_parameters(
+                num_series, source_data=source_data, rng=rng
+            )
+        return batch
+
+    def generate_process_order(
+        self, rng: np.random.Generator | None = None
+    ) -> ProcessOrderT:
+        rng = get_rng(rng)
         process_schedule = []
-        num_parts = np.random.randint(1, int(sqrt(self.num_steps)))
+        num_parts = int(rng.integers(1, int(sqrt(self.num_steps))))
         processes_steps = self.generate_steps_number(
-            self.num_steps, num_parts, self.strict_num_parts
+            self.num_steps, num_parts, self.strict_num_parts, rng
         )
         actual_num_parts = len(processes_steps)
-        random_processes = self.process_storage.get_random_processes(actual_num_parts)
+        random_processes = self.process_storage.get_random_processes(
+            actual_num_parts, rng
+        )
         for i in range(actual_num_parts):
             process_schedule.append((processes_steps[i], random_processes[i].name))
         return process_schedule
@@ -78,7 +137,10 @@ class Scheduler:
 
     @staticmethod
     def generate_steps_number(
-        num_max: int, num_parts: int, strict_num_parts: bool = False
+        num_max: int,
+        num_parts: int,
+        strict_num_parts: bool = False,
+        rng: np.random.Generator | None = None,
     ) -> list[int]:
         current_num_max = num_max
         if num_parts <= 1:
@@ -92,7 +154,7 @@ class Scheduler:
             if len(steps_list) == num_parts - 1:
                 steps = current_num_max
             else:
-                steps = np.random.randint(1, current_num_max)
+                steps = int(get_rng(rng).integers(1, current_num_max))
             current_num_max -= steps
             steps_list.append(steps)
         if sum(steps_list) < num_max:
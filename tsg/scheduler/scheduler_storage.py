@@ -1,3 +1,5 @@
+from typing import Iterable
+
 import numpy as np
 from numpy._typing import NDArray
 from omegaconf import DictConfig
@@ -5,7 +7,8 @@ from omegaconf import DictConfig
 from tsg.linspace_info import LinspaceInfo
 from tsg.process.process_storage import ProcessStorage
 from tsg.scheduler.scheduler import Scheduler
-from tsg.utils.typing import NDArrayFloat64T
+from tsg.source_data_sampling.source_point_stream import SourcePointStream
+from tsg.utils.typing import NDArrayFloat64T, NDArrayIntT, ProcessOrderT
 
 
 class SchedulerStorage:
@@ -17,6 +20,7 @@ class SchedulerStorage:
         process_storage: ProcessStorage,
         source_points: NDArrayFloat64T,
         clusters: NDArray[np.int_],
+        rng: np.random.Generator | None = None,
     ) -> None:
         self.num_steps = num_steps
         self.cfg_scheduler = cfg_scheduler
@@ -24,11 +28,17 @@ class SchedulerStorage:
         self.process_storage = process_storage
         self.source_points = source_points
         self.clusters = clusters
-        self.scheduler_storage = self.create_storage()
+        self.scheduler_storage = self.create_storage(clusters, rng)
+
+    @property
+    def num_points(self) -> int:
+        return len(self.source_points)
 
-    def create_storage(self) -> dict[int, Scheduler]:
+    def create_storage(
+        self, clusters: Iterable[int], rng: np.random.Generator | None = None
+    ) -> dict[int, Scheduler]:
         storage: dict[int, Scheduler] = {}
-        for cluster in self.clusters:
+        for cluster in clusters:
             if cluster not in storage.keys():
                 scheduler = Scheduler(
                     num_steps=self.num_steps,
@@ -37,12 +47,59 @@ class SchedulerStorage:
                     strict_num_parts=self.cfg_scheduler.strict_num_parts,
                     stable_parameters=self.cfg_scheduler.stable_parameters,
                     process_order=self.cfg_scheduler.process_order,
+                    rng=rng,
                 )
                 storage[cluster] = scheduler
         return storage
 
+    def get_points(self, start: int, stop: int) -> tuple[NDArrayFloat64T, NDArrayIntT]:
+        return self.source_points[start:stop], self.clusters[start:stop]
+
     def get_cluster(self, point_index: int) -> int:
         return self.clusters[point_index]
 
     def get_scheduler(self, cluster: int) -> Scheduler:
         return self.scheduler_storage[cluster]
+
+    def get_process_orders(self) -> dict[int, ProcessOrderT]:
+        return {
+            int(cluster): scheduler.process_order
+            for cluster, scheduler in self.scheduler_storage.items()
+        }
+
+
+class LazySchedulerStorage(SchedulerStorage):
+    def __init__(
+        self,
+        num_steps: int,
+        cfg_scheduler: DictConfig,
+        linspace_info: LinspaceInfo,
+        process_storage: ProcessStorage,
+        point_stream: SourcePointStream,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        self.num_steps = num_steps
+        self.cfg_scheduler = cfg_scheduler
+        self.linspace_info = linspace_info
+        self.process_storage = process_storage
+        self.point_stream = point_stream
+        self.source_points = point_stream.sample_points
+        self.clusters = point_stream.sample_clusters
+        self.scheduler_storage = self.create_storage(point_stream.cluster_ids, rng)
+
+    @property
+    def num_points(self) -> int:
+        return self.point_stream.num_points
+
+    def get_points(self, start: int, stop: int) -> tuple[NDArrayFloat64T, NDArrayIntT]:
+        return self.point_stream.get_points(start, stop)
+
+    def get_cluster(self, point_index: int) -> int:
+        return int(self.get_points(point_index, point_index + 1)[1][0])
+
+
+def group_clusters(clusters: NDArrayIntT) -> dict[int, NDArrayIntT]:
+    return {
+        int(cluster): np.flatnonzero(clusters == cluster)
+        for cluster in np.unique(clusters)
+    }
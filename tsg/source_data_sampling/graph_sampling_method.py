@@ -1,15 +1,18 @@
-import networkx as nx
 import numpy as np
-from networkx import Graph
 from omegaconf import DictConfig
+from scipy.sparse import coo_array, csr_array, diags_array
 
 from tsg.linspace_info import LinspaceInfo
+from tsg.source_data_sampling.point_clustering import get_border_value, move_points
 from tsg.source_data_sampling.source_data import SourceData
 from tsg.source_data_sampling.source_data_sampling_method import (
     SourceDataSamplingMethod,
 )
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 
+LAYOUT_ITERATIONS = 50
+
 
 class GraphSamplingMethod(SourceDataSamplingMethod):
     name = "graph_sampling_method"
@@ -18,25 +21,88 @@ class GraphSamplingMethod(SourceDataSamplingMethod):
         super().__init__(linspace_info_cfg=linspace_info_cfg)
 
     def sample_source_data(
-        self, num_samples: int, dim: int = 3
+        self,
+        num_samples: int,
+        rng: np.random.Generator | None = None,
+        dim: int = 3,
     ) -> tuple[SourceData, LinspaceInfo]:
-        num_edges = np.random.randint(num_samples, num_samples * 2)
-        graph = self.sample_graph(num_samples, num_edges)
-        coordinates = self.get_nodes_coordinates(num_samples, graph, dim)
-        source_data = SourceData(data_graph=graph, data_characteristics=coordinates)
-        linspace_info = self.get_linspace_info()
+        rng = get_rng(rng)
+        num_edges = int(rng.integers(num_samples, num_samples * 2))
+        graph = self.sample_graph(num_samples, num_edges, rng=rng)
+        coordinates = self.get_nodes_coordinates(
+            num_samples, graph, dim, seed=int(rng.integers(np.iinfo(np.int32).max))
+        )
+        shift = move_points(coordinates)
+        border_values = (
+            get_border_value(coordinates, is_min=True),
+            get_border_value(coordinates, is_min=False),
+        )
+        linspace_info = self.get_linspace_info(
+            start=border_values[0], stop=border_values[1]
+        )
+        source_data = SourceData(
+            data_graph=graph, data_characteristics=coordinates, shift=shift
+        )
         return source_data, linspace_info
 
     @staticmethod
-    def sample_graph(num_vertices: int, num_edges: int) -> Graph:
-        return nx.bull_graph()
+    def sample_graph(
+        num_vertices: int, num_edges: int, rng: np.random.Generator | None = None
+    ) -> csr_array:
+        """
+        Samples a connected undirected graph as a sparse adjacency matrix:
+        a ring over all vertices plus random edges up to num_edges.
+        """
+        rng = get_rng(rng)
+        ring = np.arange(num_vertices)
+        num_random_edges = max(num_edges - num_vertices, 0)
+        sources = np.concatenate(
+            [ring, rng.integers(0, num_vertices, num_random_edges)]
+        )
+        targets = np.concatenate(
+            [np.roll(ring, -1), rng.integers(0, num_vertices, num_random_edges)]
+        )
+        is_edge = sources != targets
+        sources, targets = sources[is_edge], targets[is_edge]
+        adjacency = coo_array(
+            (
+                np.ones(2 * len(sources)),
+                (
+                    np.concatenate([sources, targets]),
+                    np.concatenate([targets, sources]),
+                ),
+            ),
+            shape=(num_vertices, num_vertices),
+        ).tocsr()
+        adjacency.data[:] = 1.0
+        return adjacency
 
     @staticmethod
     def get_nodes_coordinates(
-        num_samples: int, graph: Graph, dim: int = 3
+        num_samples: int,
+        graph: csr_array,
+        dim: int = 3,
+        seed: int | None = None,
+        num_iterations: int = LAYOUT_ITERATIONS,
     ) -> NDArrayFloat64T:
-        coordinates: NDArrayFloat64T = np.ndarray(shape=(num_samples, dim))
-        pos = nx.spring_layout(graph, dim=dim)
-        for node in pos.keys():
-            coordinates[node] = pos[node]
+        """
+        Approximate spectral embedding by subspace iteration of the lazy
+        normalized adjacency, projected off its trivial eigenvector
+        and rescaled into [-1, 1] like networkx layouts.
+        """
+        degrees = np.maximum(np.asarray(graph.sum(axis=1)).ravel(), 1.0)
+        scale = diags_array(1.0 / np.sqrt(degrees))
+        normalized = scale @ graph @ scale
+        trivial = np.sqrt(degrees) / np.linalg.norm(np.sqrt(degrees))
+        vectors = np.random.default_rng(seed).standard_normal((num_samples, dim))
+        for _ in range(num_iterations):
+            vectors = 0.5 * (vectors + normalized @ vectors)
+            vectors -= trivial[:, None] * (trivial @ vectors)
+            vectors, _ = np.linalg.qr(vectors)
+        coordinates = np.zeros(shape=(num_samples, dim))
+        coordinates[:, : vectors.shape[1]] = vectors / np.sqrt(degrees)[:, None]
+        coordinates -= coordinates.mean(axis=0)
+        max_value = np.abs(coordinates).max()
+        if max_value > 0:
+            coordinates /= max_value
         return coordinates
@@ -1,15 +1,83 @@
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.datasets import make_blobs
 
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T, NDArrayIntT
 
+DEFAULT_N_INIT = "auto"
+DEFAULT_SAMPLE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_CHUNK_SIZE = 100000
 
-def cluster_points(points: NDArrayFloat64T, n_clusters: int) -> NDArrayIntT:
-    model = KMeans(n_clusters=n_clusters)
-    model.fit(points)
-    yhat = model.predict(points)
-    return np.array(yhat, dtype=np.int_)
+
+def cluster_points(
+    points: NDArrayFloat64T,
+    n_clusters: int,
+    rng: np.random.Generator | None = None,
+    method: str = "kmeans",
+    n_init: int | str = DEFAULT_N_INIT,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> NDArrayIntT:
+    rng = get_rng(rng)
+    if method == "sample":
+        sample = (
+            points
+            if len(points) <= sample_size
+            else points[rng.choice(len(points), sample_size, replace=False)]
+        )
+        centers = fit_cluster_centers(sample, n_clusters, rng, method, n_init)
+        return assign_points(points, centers, chunk_size)
+    model = get_clustering_model(n_clusters, rng, method, n_init, batch_size)
+    return np.array(model.fit(points).labels_, dtype=np.int_)
+
+
+def fit_cluster_centers(
+    points: NDArrayFloat64T,
+    n_clusters: int,
+    rng: np.random.Generator | None = None,
+    method: str = "kmeans",
+    n_init: int | str = DEFAULT_N_INIT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> NDArrayFloat64T:
+    model = get_clustering_model(n_clusters, rng, method, n_init, batch_size)
+    return model.fit(points).cluster_centers_
+
+
+def get_clustering_model(
+    n_clusters: int,
+    rng: np.random.Generator | None = None,
+    method: str = "kmeans",
+    n_init: int | str = DEFAULT_N_INIT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> KMeans | MiniBatchKMeans:
+    random_state = int(get_rng(rng).integers(np.iinfo(np.int32).max))
+    if method in ("kmeans", "sample"):
+        return KMeans(n_clusters=n_clusters, n_init=n_init, random_state=random_state)
+    if method == "minibatch":
+        return MiniBatchKMeans(
+            n_clusters=n_clusters,
+            n_init=n_init,
+            batch_size=batch_size,
+            random_state=random_state,
+        )
+    raise ValueError(f"Unknown clustering method: {method}")
+
+
+def assign_points(
+    points: NDArrayFloat64T,
+    centers: NDArrayFloat64T,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> NDArrayIntT:
+    labels = np.empty(len(points), dtype=np.int_)
+    squared_norms = np.einsum("ij,ij->i", centers, centers)
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start : start + chunk_size]
+        distances = squared_norms - 2.0 * chunk @ centers.T
+        labels[start : start + chunk_size] = np.argmin(distances, axis=1)
+    return labels
 
 
 def get_blobs(
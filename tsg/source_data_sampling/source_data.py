@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from networkx import Graph
+from scipy.sparse import csr_array
 
 from tsg.utils.typing import NDArrayFloat64T
 
@@ -10,7 +10,7 @@ class SourceData:
     def __init__(
         self,
         data_characteristics: NDArrayFloat64T | None = None,
-        data_graph: Graph | None = None,
+        data_graph: csr_array | None = None,
         shift: float = 0.0,
     ) -> None:
         self.data_characteristics = data_characteristics
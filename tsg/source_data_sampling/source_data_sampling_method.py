@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
 from omegaconf import DictConfig
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.source_data_sampling.source_data import SourceData
+from tsg.utils.typing import NDArrayFloat64T
 
 
 class SourceDataSamplingMethod(ABC):
@@ -13,9 +15,16 @@ class SourceDataSamplingMethod(ABC):
         self.linspace_info_cfg = linspace_info_cfg
 
     @abstractmethod
-    def sample_source_data(self, num_samples: int) -> tuple[SourceData, LinspaceInfo]:
+    def sample_source_data(
+        self, num_samples: int, rng: np.random.Generator | None = None
+    ) -> tuple[SourceData, LinspaceInfo]:
         pass
 
+    def sample_points(
+        self, num_samples: int, rng: np.random.Generator | None = None
+    ) -> NDArrayFloat64T:
+        raise ValueError(f"{self.name} does not support lazy point sampling")
+
     def get_linspace_info(
         self, start: float | None = None, stop: float | None = None
     ) -> LinspaceInfo:
@@ -0,0 +1,109 @@
+import numpy as np
+
+from tsg.source_data_sampling.point_clustering import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_N_INIT,
+    DEFAULT_SAMPLE_SIZE,
+    assign_points,
+    fit_cluster_centers,
+    get_border_value,
+    move_points,
+)
+from tsg.source_data_sampling.source_data_sampling_method import (
+    SourceDataSamplingMethod,
+)
+from tsg.utils.rng import get_rng
+from tsg.utils.typing import NDArrayFloat64T, NDArrayIntT
+
+
+class SourcePointStream:
+    """
+    Source points sampled on demand in fixed chunks.
+
+    Every chunk is sampled from its own generator keyed by the chunk index,
+    so any range of points can be regenerated without keeping the points.
+    The first sample_size points are sampled eagerly: the shift, the border
+    values and the cluster centers are calibrated on them, and later points
+    are clipped into the calibrated borders.
+
+    Attributes
+    ----------
+    num_points : int
+        total number of source points;
+    chunk_size : int
+        number of points sampled at once;
+    sample_points : ndarray(shape=(sample_size, dim))
+        shifted calibration sample, the first points of the stream;
+    sample_clusters : array(shape=(sample_size,))
+        clusters of the calibration sample;
+    shift : float
+        shift added to every point;
+    border_values : tuple[float, float]
+        minimum and maximum coordinate of the shifted calibration sample;
+    centers : ndarray(shape=(n_clusters, dim))
+        cluster centers fitted on the calibration sample.
+    """
+
+    def __init__(
+        self,
+        sampling_method: SourceDataSamplingMethod,
+        num_points: int,
+        n_clusters: int,
+        rng: np.random.Generator | None = None,
+        method: str = "kmeans",
+        n_init: int | str = DEFAULT_N_INIT,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        rng = get_rng(rng)
+        self.sampling_method = sampling_method
+        self.num_points = num_points
+        self.chunk_size = chunk_size
+        self.seed = int(rng.integers(np.iinfo(np.int64).max))
+        self.bit_generator = type(rng.bit_generator)
+        self.cached_chunk: tuple[int, NDArrayFloat64T] | None = None
+        sample = self.get_raw_points(0, min(sample_size, num_points))
+        self.shift = move_points(sample)
+        self.border_values = (
+            get_border_value(sample, is_min=True),
+            get_border_value(sample, is_min=False),
+        )
+        self.sample_points = sample
+        self.centers = fit_cluster_centers(
+            sample, min(n_clusters, len(sample)), rng, method, n_init, batch_size
+        )
+        self.sample_clusters = assign_points(sample, self.centers)
+
+    @property
+    def cluster_ids(self) -> list[int]:
+        return list(range(len(self.centers)))
+
+    def get_points(self, start: int, stop: int) -> tuple[NDArrayFloat64T, NDArrayIntT]:
+        points = np.clip(
+            self.get_raw_points(start, stop) + self.shift, *self.border_values
+        )
+        return points, assign_points(points, self.centers, self.chunk_size)
+
+    def get_raw_points(self, start: int, stop: int) -> NDArrayFloat64T:
+        first_chunk = start // self.chunk_size
+        last_chunk = max(first_chunk, (stop - 1) // self.chunk_size)
+        chunks = [self.get_chunk(i) for i in range(first_chunk, last_chunk + 1)]
+        offset = first_chunk * self.chunk_size
+        return np.concatenate(chunks)[start - offset : stop - offset]
+
+    def get_chunk(self, chunk_index: int) -> NDArrayFloat64T:
+        if self.cached_chunk is not None and self.cached_chunk[0] == chunk_index:
+            return self.cached_chunk[1]
+        num_samples = min(
+            self.chunk_size, self.num_points - chunk_index * self.chunk_size
+        )
+        rng = np.random.Generator(
+            self.bit_generator(
+                np.random.SeedSequence(self.seed, spawn_key=(chunk_index,))
+            )
+        )
+        chunk = self.sampling_method.sample_points(max(num_samples, 0), rng=rng)
+        self.cached_chunk = (chunk_index, chunk)
+        return chunk
@@ -7,6 +7,7 @@ from tsg.source_data_sampling.source_data import SourceData
 from tsg.source_data_sampling.source_data_sampling_method import (
     SourceDataSamplingMethod,
 )
+from tsg.utils.rng import get_rng
 from tsg.utils.typing import NDArrayFloat64T
 
 
@@ -16,8 +17,10 @@ class SurfaceSamplingMethod(SourceDataSamplingMethod):
     def __init__(self, linspace_info_cfg: DictConfig) -> None:
         super().__init__(linspace_info_cfg=linspace_info_cfg)
 
-    def sample_source_data(self, num_samples: int) -> tuple[SourceData, LinspaceInfo]:
-        coordinates = self.sample_spherical(num_samples)
+    def sample_source_data(
+        self, num_samples: int, rng: np.random.Generator | None = None
+    ) -> tuple[SourceData, LinspaceInfo]:
+        coordinates = self.sample_points(num_samples, rng=rng)
         shift = move_points(coordinates)
         border_values = (
             get_border_value(coordinates, is_min=True),
@@ -26,13 +29,18 @@ class SurfaceSamplingMethod(SourceDataSamplingMethod):
         linspace_info = self.get_linspace_info(
             start=border_values[0], stop=border_values[1]
         )
-        source_data = SourceData(
-            data_characteristics=np.transpose(coordinates), shift=shift
-        )
+        source_data = SourceData(data_characteristics=coordinates, shift=shift)
         return source_data, linspace_info
 
+    def sample_points(
+        self, num_samples: int, rng: np.random.Generator | None = None
+    ) -> NDArrayFloat64T:
+        return np.transpose(self.sample_spherical(num_samples, rng=rng))
+
     @staticmethod
-    def sample_spherical(num_points: int, ndim=3) -> NDArrayFloat64T:
-        vec = np.random.randn(ndim, num_points)
+    def sample_spherical(
+        num_points: int, ndim=3, rng: np.random.Generator | None = None
+    ) -> NDArrayFloat64T:
+        vec = get_rng(rng).standard_normal((ndim, num_points))
         vec /= np.linalg.norm(vec, axis=0)
         return vec
@@ -1,14 +1,26 @@
 import numpy as np
+from numpy.typing import DTypeLike
 
 from tsg.utils.typing import NDArrayFloat64T, ProcessConfigT
 
 
 class TimeSeries:
-    def __init__(self, num_steps: int) -> None:
+    __slots__ = ("num_steps", "last_index", "values", "metadata")
+
+    def __init__(
+        self,
+        num_steps: int,
+        values: NDArrayFloat64T | None = None,
+        metadata: list[ProcessConfigT] | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> None:
         self.num_steps = num_steps
         self.last_index = 0
-        self.values = np.zeros(shape=(1, num_steps))[0]
+        self.values = values if values is not None else np.zeros(num_steps, dtype=dtype)
         self.metadata: list[ProcessConfigT] = []
+        if metadata is not None:
+            for segment_metadata in metadata:
+                self.add_segment(segment_metadata)
 
     def add_values(
         self,
@@ -20,10 +32,19 @@ class TimeSeries:
                 f"Number of values to add in time series "
                 f"exceeds the number of steps: {len(new_values)} > {self.num_steps}"
             )
-        self.values[self.last_index : self.last_index + len(new_values)] = new_values
+        segment = self.values[self.last_index : self.last_index + len(new_values)]
+        if not is_same_buffer(segment, new_values):
+            segment[...] = new_values
         self.last_index += len(new_values)
         self.metadata.append(new_metadata)
 
+    def get_segment(self, num_steps: int) -> NDArrayFloat64T:
+        return self.values[self.last_index : self.last_index + num_steps]
+
+    def add_segment(self, new_metadata: ProcessConfigT) -> None:
+        self.last_index += new_metadata[1][0]
+        self.metadata.append(new_metadata)
+
     def get_values(
         self, start_index: int = 0, end_index: int | None = None
     ) -> NDArrayFloat64T:
@@ -31,3 +52,11 @@ class TimeSeries:
             return self.values[start_index : self.last_index]
         else:
             return self.values[start_index:end_index]
+
+
+def is_same_buffer(first: NDArrayFloat64T, second: NDArrayFloat64T) -> bool:
+    return (
+        first.__array_interface__["data"][0] == second.__array_interface__["data"][0]
+        and first.shape == second.shape
+        and first.strides == second.strides
+    )
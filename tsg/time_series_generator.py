@@ -1,12 +1,38 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator
+
 import numpy as np
 from omegaconf import DictConfig
 
 from tsg.linspace_info import LinspaceInfo
 from tsg.process.process_storage import ProcessStorage
+from tsg.scheduler.schedule_batch import ScheduleBatch
 from tsg.scheduler.scheduler import Scheduler
-from tsg.scheduler.scheduler_storage import SchedulerStorage
+from tsg.scheduler.scheduler_storage import SchedulerStorage, group_clusters
 from tsg.time_series import TimeSeries
-from tsg.utils.typing import NDArrayFloat64T, ProcessDataT
+from tsg.utils.profiling import (
+    enable_profiling,
+    get_profiler,
+    merge_profile_stages,
+    pop_profile_stages,
+    profile_process,
+    profile_stage,
+)
+from tsg.utils.rng import create_rng
+from tsg.utils.typing import (
+    LayoutT,
+    NDArrayFloat64T,
+    NDArrayIntT,
+    ProcessDataT,
+    get_float_dtype,
+)
+
+MAX_PENDING_SHARDS_PER_WORKER = 2
+
+_worker_generator: "TimeSeriesGenerator | None" = None
+_worker_profiling = False
 
 
 class TimeSeriesGenerator:
@@ -16,72 +42,321 @@ class TimeSeriesGenerator:
         linspace_info: LinspaceInfo,
         process_storage: ProcessStorage,
         scheduler_storage: SchedulerStorage | None = None,
+        rng: np.random.Generator | None = None,
     ) -> None:
         self.cfg = cfg
         self.ts_number = cfg.generation.ts_number
         self.ts_size = cfg.generation.ts_size
+        self.dtype = get_float_dtype(cfg.generation.dtype)
         self.linspace_info = linspace_info
         self.process_storage = process_storage
         self.scheduler_storage = scheduler_storage
         self.single_schedule = cfg.scheduler.single_schedule
+        self.batched = cfg.generation.batched
+        self.parallel = cfg.generation.parallel
+        self.num_workers = cfg.generation.num_workers
+        self.shard_size = cfg.generation.shard_size
+        self.chunk_size = cfg.generation.chunk_size or self.shard_size
+        self.rng = (
+            rng
+            if rng is not None
+            else create_rng(cfg.generation.seed, cfg.generation.bit_generator)
+        )
 
     def generate_all(
         self,
     ) -> tuple[NDArrayFloat64T, list[TimeSeries]]:
-        ts_array: NDArrayFloat64T = np.ndarray((self.ts_number, self.ts_size))
-        ts_list = []
-        scheduler = self.generate_new_scheduler()
-        iterations = (
-            self.ts_number
-            if self.scheduler_storage is None
-            else self.scheduler_storage.source_points.shape[0]
+        iterations = self.get_iterations()
+        ts_array: NDArrayFloat64T = np.ndarray(
+            (iterations, self.ts_size), dtype=self.dtype
         )
-        for i in range(iterations):
-            source_data = (
-                self.scheduler_storage.source_points[i]
-                if self.scheduler_storage is not None
-                else None
+        ts_list: list[TimeSeries] = []
+        for start, chunk_array, schedule_batch in self.generate_shards():
+            ts_array[start : start + schedule_batch.num_series] = chunk_array
+            ts_list.extend(
+                schedule_batch.get_time_series(i, ts_array[start + i])
+                for i in range(schedule_batch.num_series)
             )
-            schedule = self.get_point_schedule(i, scheduler)
-            ts = self.generate_time_series(
-                process_storage=self.process_storage,
-                schedule=schedule,
-                source_data=source_data,
-            )
-            ts_array[i] = ts.get_values()
-            ts_list.append(ts)
         return ts_array, ts_list
 
+    def generate_chunks(
+        self,
+        chunk_size: int | None = None,
+        start_index: int = 0,
+    ) -> Iterator[tuple[int, NDArrayFloat64T, ScheduleBatch]]:
+        chunk_size = chunk_size if chunk_size is not None else self.chunk_size
+        arrays: list[NDArrayFloat64T] = []
+        batches: list[ScheduleBatch] = []
+        num_buffered = 0
+        chunk_start = start_index
+        for shard_start, shard_array, shard_batch in self.generate_shards(start_index):
+            offset = max(start_index - shard_start, 0)
+            arrays.append(shard_array[offset:])
+            batches.append(shard_batch.slice_series(offset, shard_batch.num_series))
+            num_buffered += len(arrays[-1])
+            while num_buffered >= chunk_size:
+                buffered_array, buffered_batch = self.concatenate(arrays, batches)
+                yield chunk_start, buffered_array[
+                    :chunk_size
+                ], buffered_batch.slice_series(0, chunk_size)
+                arrays = [buffered_array[chunk_size:]]
+                batches = [buffered_batch.slice_series(chunk_size, num_buffered)]
+                num_buffered -= chunk_size
+                chunk_start += chunk_size
+        if num_buffered > 0:
+            yield chunk_start, *self.concatenate(arrays, batches)
+
+    def concatenate(
+        self, arrays: list[NDArrayFloat64T], batches: list[ScheduleBatch]
+    ) -> tuple[NDArrayFloat64T, ScheduleBatch]:
+        if len(arrays) == 1:
+            return arrays[0], batches[0]
+        return np.concatenate(arrays), ScheduleBatch.concatenate(
+            batches, self.process_storage.get_process_names()
+        )
+
+    def generate_shards(
+        self, start_index: int = 0
+    ) -> Iterator[tuple[int, NDArrayFloat64T, ScheduleBatch]]:
+        iterations = self.get_iterations()
+        shards = [
+            (start, min(start + self.shard_size, iterations))
+            for start in range(0, iterations, self.shard_size)
+        ]
+        shard_rngs = self.rng.spawn(len(shards) + 1)
+        scheduler = self.generate_new_scheduler(shard_rngs[0])
+        tasks = [
+            (start, stop, scheduler, shard_rng)
+            for (start, stop), shard_rng in zip(shards, shard_rngs[1:])
+            if stop > start_index
+        ]
+        if not self.parallel or self.num_workers <= 1:
+            init_worker(self)
+            for task in tasks:
+                ts_array, schedule_batch, _ = generate_shard(task)
+                yield task[0], ts_array, schedule_batch
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=get_mp_context(),
+            initializer=init_worker,
+            initargs=(self, get_profiler() is not None),
+        ) as executor:
+            pending: deque[tuple[int, Future]] = deque()
+            for task in tasks:
+                pending.append((task[0], executor.submit(generate_shard, task)))
+                if len(pending) >= MAX_PENDING_SHARDS_PER_WORKER * self.num_workers:
+                    yield self.get_shard_result(*pending.popleft())
+            while pending:
+                yield self.get_shard_result(*pending.popleft())
+
+    def get_shard_result(
+        self, start: int, future: Future
+    ) -> tuple[int, NDArrayFloat64T, ScheduleBatch]:
+        ts_array, schedule_batch, stages = future.result()
+        merge_profile_stages(stages)
+        return start, ts_array, schedule_batch
+
+    def generate_range(
+        self,
+        start: int,
+        stop: int,
+        scheduler: Scheduler,
+        rng: np.random.Generator,
+    ) -> tuple[NDArrayFloat64T, ScheduleBatch]:
+        with profile_stage("generation", items=stop - start):
+            if self.batched:
+                return self.generate_range_batched(start, stop, scheduler, rng)
+            ts_array: NDArrayFloat64T = np.ndarray(
+                (stop - start, self.ts_size), dtype=self.dtype
+            )
+            source_points, clusters = self.get_source_points(start, stop)
+            schedules = []
+            for i in range(stop - start):
+                source_data = source_points[i] if source_points is not None else None
+                with profile_stage("schedule", items=1):
+                    schedule = self.get_point_schedule(
+                        scheduler,
+                        rng,
+                        source_data=source_data,
+                        cluster=clusters[i] if clusters is not None else None,
+                    )
+                self.generate_time_series(
+                    process_storage=self.process_storage,
+                    schedule=schedule,
+                    source_data=source_data,
+                    rng=rng,
+                    out=ts_array[i],
+                )
+                schedules.append(schedule)
+            return ts_array, ScheduleBatch.from_schedules(
+                schedules, self.process_storage.get_process_names()
+            )
+
+    def generate_range_batched(
+        self,
+        start: int,
+        stop: int,
+        scheduler: Scheduler,
+        rng: np.random.Generator,
+    ) -> tuple[NDArrayFloat64T, ScheduleBatch]:
+        if self.scheduler_storage is not None:
+            return self.generate_range_clustered(start, stop, rng)
+        ts_array: NDArrayFloat64T = np.ndarray(
+            (stop - start, self.ts_size), dtype=self.dtype
+        )
+        with profile_stage("schedule", items=stop - start):
+            schedule_batch = self.generate_schedule_batch(start, stop, scheduler, rng)
+        self.generate_layouts(ts_array, schedule_batch, rng=rng)
+        return ts_array, schedule_batch
+
+    def generate_range_clustered(
+        self,
+        start: int,
+        stop: int,
+        rng: np.random.Generator,
+    ) -> tuple[NDArrayFloat64T, ScheduleBatch]:
+        if self.scheduler_storage is None:
+            raise ValueError("Clustered generation requires a scheduler storage")
+        ts_array: NDArrayFloat64T = np.ndarray(
+            (stop - start, self.ts_size), dtype=self.dtype
+        )
+        with profile_stage("source_points", items=stop - start):
+            source_points, clusters = self.scheduler_storage.get_points(start, stop)
+        schedule_batches = []
+        series_indexes = []
+        for cluster, indexes in group_clusters(clusters).items():
+            cluster_points = source_points[indexes]
+            with profile_stage("schedule", items=len(indexes)):
+                schedule_batch = self.scheduler_storage.get_scheduler(
+                    cluster
+                ).generate_schedule_batch(
+                    len(indexes), source_data=cluster_points, rng=rng
+                )
+            cluster_array: NDArrayFloat64T = np.ndarray(
+                (len(indexes), self.ts_size), dtype=self.dtype
+            )
+            self.generate_layouts(cluster_array, schedule_batch, cluster_points, rng)
+            ts_array[indexes] = cluster_array
+            schedule_batches.append(schedule_batch)
+            series_indexes.append(indexes)
+        return ts_array, ScheduleBatch.scatter(
+            schedule_batches, series_indexes, self.process_storage.get_process_names()
+        )
+
+    def generate_layouts(
+        self,
+        ts_array: NDArrayFloat64T,
+        schedule_batch: ScheduleBatch,
+        source_points: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        for layout, indexes in schedule_batch.group_by_layout().items():
+            self.generate_batch(
+                ts_array, layout, indexes, schedule_batch, source_points, rng
+            )
+
+    def generate_schedule_batch(
+        self,
+        start: int,
+        stop: int,
+        scheduler: Scheduler,
+        rng: np.random.Generator,
+    ) -> ScheduleBatch:
+        if self.single_schedule:
+            return scheduler.generate_schedule_batch(stop - start, rng=rng)
+        return ScheduleBatch.from_schedules(
+            [self.get_point_schedule(scheduler, rng) for _ in range(start, stop)],
+            self.process_storage.get_process_names(),
+        )
+
+    def get_iterations(self) -> int:
+        if self.scheduler_storage is None:
+            return self.ts_number
+        return self.scheduler_storage.num_points
+
+    def get_source_points(
+        self, start: int, stop: int
+    ) -> tuple[NDArrayFloat64T | None, NDArrayIntT | None]:
+        if self.scheduler_storage is None:
+            return None, None
+        with profile_stage("source_points", items=stop - start):
+            return self.scheduler_storage.get_points(start, stop)
+
+    def generate_batch(
+        self,
+        ts_array: NDArrayFloat64T,
+        layout: LayoutT,
+        indexes: list[int],
+        schedule_batch: ScheduleBatch,
+        source_points: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        rows = np.array(indexes)
+        source_data = source_points[rows] if source_points is not None else None
+        is_contiguous = rows[0] == 0 and rows[-1] == len(rows) - 1
+        batch_values = (
+            ts_array[: len(rows)]
+            if is_contiguous
+            else np.empty(shape=(len(rows), self.ts_size), dtype=self.dtype)
+        )
+        start_index = 0
+        for segment_index, (process_name, steps) in enumerate(layout):
+            process = self.process_storage.get_processes([process_name])[0]
+            with profile_process(process_name, items=len(rows)):
+                process.generate_batch(
+                    num_steps=steps,
+                    parameters=schedule_batch.get_segment_parameters(
+                        rows, segment_index
+                    ),
+                    previous_values=(
+                        batch_values[
+                            :, max(start_index - process.state_size, 0) : start_index
+                        ]
+                        if start_index > 0
+                        else None
+                    ),
+                    source_data=source_data,
+                    out=batch_values[:, start_index : start_index + steps],
+                    rng=rng,
+                )
+            start_index += steps
+        if not is_contiguous:
+            ts_array[rows] = batch_values
+
     def generate_time_series(
         self,
         process_storage: ProcessStorage,
         schedule: list[ProcessDataT],
         source_data: NDArrayFloat64T | None = None,
+        rng: np.random.Generator | None = None,
+        out: NDArrayFloat64T | None = None,
     ) -> TimeSeries:
-        current_time_series = TimeSeries(self.ts_size)
+        current_time_series = TimeSeries(self.ts_size, values=out)
         for process_name, process_schedule in schedule:
             process = process_storage.get_processes([process_name])[0]
             for process_data in process_schedule:
-                if current_time_series.last_index == 0:
-                    current_time_series.add_values(
-                        process.generate_time_series(
-                            data=process_data,
-                            source_data=source_data,
-                        )[0].get_values(),
-                        (process.name, process_data),
-                    )
-                else:
-                    current_time_series.add_values(
-                        process.generate_time_series(
-                            process_data,
-                            previous_values=current_time_series.get_values(),
-                            source_data=source_data,
-                        )[0].get_values(),
-                        (process.name, process_data),
+                last_index = current_time_series.last_index
+                with profile_process(process_name, items=1):
+                    process.fill_values(
+                        current_time_series.get_segment(process_data[0]),
+                        process_data[1],
+                        previous_values=(
+                            current_time_series.get_values(
+                                max(last_index - process.state_size, 0)
+                            )
+                            if last_index > 0
+                            else None
+                        ),
+                        source_data=source_data,
+                        rng=rng,
                     )
+                current_time_series.add_segment((process.name, process_data))
         return current_time_series
 
-    def generate_new_scheduler(self) -> Scheduler:
+    def generate_new_scheduler(
+        self, rng: np.random.Generator | None = None
+    ) -> Scheduler:
         return Scheduler(
             num_steps=self.ts_size,
             linspace_info=self.linspace_info,
@@ -89,21 +364,65 @@ class TimeSeriesGenerator:
             strict_num_parts=self.cfg.scheduler.strict_num_parts,
             stable_parameters=self.cfg.scheduler.stable_parameters,
             process_order=self.cfg.scheduler.process_order,
+            rng=rng,
         )
 
     def get_point_schedule(
-        self, point_index: int, general_scheduler: Scheduler
+        self,
+        general_scheduler: Scheduler,
+        rng: np.random.Generator | None = None,
+        source_data: NDArrayFloat64T | None = None,
+        cluster: int | None = None,
     ) -> list[ProcessDataT]:
-        if self.scheduler_storage is not None:
-            cluster = self.scheduler_storage.get_cluster(point_index)
+        if self.scheduler_storage is not None and cluster is not None:
             scheduler = self.scheduler_storage.get_scheduler(cluster=cluster)
-            schedule = scheduler.generate_schedule(
-                source_data=self.scheduler_storage.source_points[point_index]
-            )
+            schedule = scheduler.generate_schedule(source_data=source_data, rng=rng)
         else:
             if self.single_schedule:
                 scheduler = general_scheduler
             else:
-                scheduler = self.generate_new_scheduler()
-            schedule = scheduler.generate_schedule()
+                scheduler = self.generate_new_scheduler(rng)
+            schedule = scheduler.generate_schedule(rng=rng)
         return schedule
+
+
+def get_mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Returns a start method for pool workers that does not fork the parent:
+    background writer threads may run while the pool is created, and a
+    forked child would inherit the locks they hold.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def init_worker(generator: TimeSeriesGenerator, profile: bool = False) -> None:
+    """
+    Sets the generator used by generate_shard in the current process.
+
+    With profile a pool worker records its stage timings in its own profiler,
+    and generate_shard returns them with each shard, so that the parent
+    merges them into its report.
+    """
+    global _worker_generator, _worker_profiling
+    _worker_generator = generator
+    _worker_profiling = profile
+    if profile:
+        enable_profiling()
+
+
+def generate_shard(
+    task: tuple[int, int, Scheduler, np.random.Generator]
+) -> tuple[NDArrayFloat64T, ScheduleBatch, dict[str, dict] | None]:
+    start, stop, scheduler, rng = task
+    if _worker_generator is None:
+        raise RuntimeError("Worker generator is not initialized")
+    ts_array, schedule_batch = _worker_generator.generate_range(
+        start, stop, scheduler, rng
+    )
+    return (
+        ts_array,
+        schedule_batch,
+        pop_profile_stages() if _worker_profiling else None,
+    )
@@ -0,0 +1,81 @@
+import json
+import os
+
+import numpy as np
+
+
+class Checkpoint:
+    """
+    State of a streaming run needed to resume it after the last written chunk.
+
+    Generated data is not copied: the output writers are reopened at the
+    saved positions, and the chunks after them are regenerated from the seed,
+    since every shard of series has its own rng spawned from it.
+
+    Attributes
+    ----------
+    state_path : str
+        path of the json file with the state;
+    seed : int or None
+        seed of the run, kept so that a run without a configured seed
+        replays the same source data, clusters and schedulers on resume;
+    run_info : dict or None
+        configuration and scheduler process orders of the run;
+    start_index : int
+        number of series completely written by both writers;
+    positions : dict or None
+        positions of the parameters and values writers after start_index series.
+    """
+
+    def __init__(self, state_path: str) -> None:
+        self.state_path = state_path
+        self.seed: int | None = None
+        self.run_info: dict | None = None
+        self.start_index = 0
+        self.positions: dict | None = None
+        if os.path.exists(state_path):
+            with open(state_path, "r") as state_file:
+                state = json.load(state_file)
+            self.seed = state["seed"]
+            self.run_info = state["run_info"]
+            self.start_index = state["start_index"]
+            self.positions = state["positions"]
+
+    def get_seed(self, seed: int | None = None) -> int:
+        if self.seed is None:
+            self.seed = (
+                seed
+                if seed is not None
+                else int(np.random.default_rng().integers(np.iinfo(np.int64).max))
+            )
+        return self.seed
+
+    def set_run_info(self, run_info: dict) -> None:
+        run_info = json.loads(json.dumps(run_info))
+        if self.run_info is not None and self.run_info != run_info:
+            raise ValueError(
+                f"Checkpoint {self.state_path} was created by a different run, "
+                f"remove it to start a new run"
+            )
+        self.run_info = run_info
+
+    def save(self, start_index: int, positions: dict) -> None:
+        self.start_index = start_index
+        self.positions = positions
+        self.write_state()
+
+    def write_state(self) -> None:
+        state = {
+            "seed": self.seed,
+            "run_info": self.run_info,
+            "start_index": self.start_index,
+            "positions": self.positions,
+        }
+        temporary_path = self.state_path + ".tmp"
+        with open(temporary_path, "w") as state_file:
+            json.dump(state, state_file)
+        os.replace(temporary_path, self.state_path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
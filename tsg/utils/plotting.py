@@ -0,0 +1,93 @@
+import numpy as np
+from numpy._typing import NDArray
+
+from tsg.utils.typing import NDArrayFloat64T
+
+NUM_PLOT_SERIES = 5
+
+
+def save_plot_data(
+    plot_data_path: str,
+    coordinates: NDArrayFloat64T,
+    clusters: NDArray[np.int_],
+    border_values: tuple[float, float],
+    shift: float,
+    time_series_array: NDArrayFloat64T,
+) -> None:
+    num_series = min(NUM_PLOT_SERIES, len(time_series_array))
+    np.savez(
+        plot_data_path,
+        coordinates=coordinates[:num_series],
+        clusters=clusters[:num_series],
+        border_values=np.array(border_values),
+        shift=np.array(shift),
+        time_series_array=time_series_array[:num_series],
+    )
+
+
+def load_plot_data(
+    plot_data_path: str,
+) -> tuple[
+    NDArrayFloat64T, NDArray[np.int_], tuple[float, float], float, NDArrayFloat64T
+]:
+    with np.load(plot_data_path) as plot_data:
+        border_values = plot_data["border_values"]
+        return (
+            plot_data["coordinates"],
+            plot_data["clusters"],
+            (float(border_values[0]), float(border_values[1])),
+            float(plot_data["shift"]),
+            plot_data["time_series_array"],
+        )
+
+
+def save_plot(
+    coordinates: NDArrayFloat64T,
+    clusters: NDArray[np.int_],
+    border_values: tuple[float, float],
+    shift: float,
+    time_series_array: NDArrayFloat64T,
+    save_plot_path=None,
+) -> None:
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D
+
+    num_series = min(NUM_PLOT_SERIES, len(time_series_array))
+    fig = plt.figure(figsize=(12, 5))
+    fig.suptitle("Generated time series with parameters clustering")
+
+    ax_graph = fig.add_subplot(1, 2, 1)
+    colors = ["blue", "red", "green"]
+    for i in range(num_series):
+        time_series = time_series_array[i]
+        ax_graph.text(100, time_series[-1], f"TS {i}")
+        ax_graph.plot(time_series, color=colors[clusters[i]])
+    ax_graph.grid(True)
+    ax_graph.set_xlabel("time")
+    ax_graph.set_ylabel("values")
+
+    ax_sphere: Axes3D = fig.add_subplot(1, 2, 2, projection="3d")
+
+    phi = np.linspace(0, np.pi, 20)
+    theta = np.linspace(0, 2 * np.pi, 40)
+    x = np.outer(np.sin(theta), np.cos(phi))
+    y = np.outer(np.sin(theta), np.sin(phi))
+    z = np.outer(np.cos(theta), np.ones_like(phi))
+    x += shift
+    y += shift
+    z += shift
+
+    ax_sphere.plot_wireframe(x, y, z, color="grey", alpha=0.3)
+    for i in range(num_series):
+        ax_sphere.scatter(
+            coordinates[i][0],
+            coordinates[i][1],
+            coordinates[i][2],
+            color=colors[clusters[i]],
+        )
+    ax_sphere.set_zlim(border_values[0], border_values[1])
+    if save_plot_path is None:
+        plt.show()
+    else:
+        plt.savefig(save_plot_path)
+    plt.close(fig)
@@ -0,0 +1,119 @@
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator
+
+PROCESS_STAGE_PREFIX = "process/"
+
+_profiler: "Profiler | None" = None
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.start_time = time.perf_counter()
+        self.stages: dict[str, dict] = {}
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start, items=items)
+
+    def get_stats(self, name: str) -> dict:
+        if name not in self.stages:
+            self.stages[name] = {"wall_time": 0.0, "calls": 0, "items": 0, "bytes": 0}
+        return self.stages[name]
+
+    def add_time(
+        self, name: str, seconds: float, calls: int = 1, items: int = 0
+    ) -> None:
+        stats = self.get_stats(name)
+        stats["wall_time"] += seconds
+        stats["calls"] += calls
+        stats["items"] += items
+
+    def add_bytes(self, name: str, num_bytes: int) -> None:
+        self.get_stats(name)["bytes"] += num_bytes
+
+    def pop_stages(self) -> dict[str, dict]:
+        stages = self.stages
+        self.stages = {}
+        return stages
+
+    def merge_stages(self, stages: dict[str, dict]) -> None:
+        for name, stats in stages.items():
+            self.add_time(name, stats["wall_time"], stats["calls"], stats["items"])
+            self.add_bytes(name, stats["bytes"])
+
+    def get_report(self) -> dict:
+        return {
+            "total_time": time.perf_counter() - self.start_time,
+            "stages": {
+                name: stats
+                for name, stats in self.stages.items()
+                if not name.startswith(PROCESS_STAGE_PREFIX)
+            },
+            "processes": {
+                name[len(PROCESS_STAGE_PREFIX) :]: stats
+                for name, stats in self.stages.items()
+                if name.startswith(PROCESS_STAGE_PREFIX)
+            },
+        }
+
+    def save_report(self, report_path: str) -> None:
+        with open(report_path, "w") as report_file:
+            report_file.write(json.dumps(self.get_report(), indent=4))
+
+
+def enable_profiling() -> Profiler:
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def disable_profiling() -> None:
+    global _profiler
+    _profiler = None
+
+
+def get_profiler() -> Profiler | None:
+    return _profiler
+
+
+def pop_profile_stages() -> dict[str, dict] | None:
+    if _profiler is None:
+        return None
+    return _profiler.pop_stages()
+
+
+def merge_profile_stages(stages: dict[str, dict] | None) -> None:
+    if _profiler is not None and stages is not None:
+        _profiler.merge_stages(stages)
+
+
+def profile_stage(name: str, items: int = 0) -> ContextManager[None]:
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.stage(name, items)
+
+
+def profile_process(process_name: str, items: int = 0) -> ContextManager[None]:
+    return profile_stage(PROCESS_STAGE_PREFIX + process_name, items)
+
+
+def add_written_bytes(name: str, path: str) -> None:
+    if _profiler is not None:
+        _profiler.add_bytes(name, get_path_size(path))
+
+
+def get_path_size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(folder, file_name))
+        for folder, _, file_names in os.walk(path)
+        for file_name in file_names
+    )
@@ -1,100 +1,774 @@
 import json
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator
 
-import matplotlib.pyplot as plt
 import numpy as np
-from mpl_toolkits.mplot3d import Axes3D
-from numpy._typing import NDArray
+from numpy.typing import DTypeLike
 
+from tsg.scheduler.schedule_batch import ScheduleBatch
 from tsg.time_series import TimeSeries
+from tsg.utils.profiling import profile_stage
 from tsg.utils.typing import NDArrayFloat64T
 
+VALUES_EXTENSIONS = {"csv": ".csv", "npy": ".npy", "memmap": ".dat", "chunked": ""}
+HEADER_SUFFIX = ".json"
+CHUNKS_INDEX_NAME = "index.json"
+CHUNK_NAME_PREFIX = "chunk_"
+PARAMETERS_EXTENSIONS = {"json": ".json", "ndjson": ".ndjson"}
+OFFSETS_SUFFIX = ".offsets"
+CSV_VALUE_FORMATS = {"float32": "%.8e", "float64": "%.18e"}
+DEFAULT_WRITE_QUEUE_SIZE = 2
 
-def save_parameters(ts_list: list[TimeSeries], json_path: str) -> None:
-    with open(json_path, "w") as json_file:
-        json_data = get_json_data(ts_list)
-        json_file.write(json.dumps(json_data, indent=4))
+
+def save_parameters(
+    ts_list: list[TimeSeries] | ScheduleBatch,
+    parameters_path: str,
+    metadata_format: str = "json",
+    process_names: list[str] | None = None,
+) -> None:
+    if metadata_format == "json" and not isinstance(ts_list, ScheduleBatch):
+        with open(parameters_path, "w") as json_file:
+            json_data = get_json_data(ts_list)
+            json_file.write(json.dumps(json_data, indent=4))
+        return
+    if isinstance(ts_list, ScheduleBatch):
+        schedule_batch = ts_list
+    else:
+        schedule_batch = ScheduleBatch.from_time_series(
+            ts_list, process_names or get_process_names(ts_list)
+        )
+    with get_parameters_writer(
+        parameters_path, metadata_format, process_names or schedule_batch.process_names
+    ) as parameters_writer:
+        parameters_writer.write(schedule_batch, 0)
 
 
-def load_parameters(json_path: str) -> dict:
-    with open(json_path, "r") as json_file:
+def load_parameters(parameters_path: str, metadata_format: str = "json") -> dict:
+    if metadata_format == "ndjson":
+        return {
+            f"ts_{record['id'] + 1}": record["segments"]
+            for record in iter_parameters(parameters_path)
+        }
+    with open(parameters_path, "r") as json_file:
         json_data = json.load(json_file)
     return json_data
 
 
-def save_values(array: NDArrayFloat64T, csv_path: str) -> None:
-    with open(csv_path, "w") as csv_file:
-        np.savetxt(csv_file, array)
+def iter_parameters(parameters_path: str) -> Iterator[dict]:
+    with open(parameters_path, "r") as parameters_file:
+        process_names = json.loads(parameters_file.readline())["processes"]
+        for line in parameters_file:
+            yield decode_record(json.loads(line), process_names)
+
+
+def load_parameters_record(parameters_path: str, ts_index: int) -> dict:
+    offsets = np.memmap(parameters_path + OFFSETS_SUFFIX, dtype=np.int64, mode="r")
+    with open(parameters_path, "r") as parameters_file:
+        process_names = json.loads(parameters_file.readline())["processes"]
+        parameters_file.seek(int(offsets[ts_index]))
+        return decode_record(json.loads(parameters_file.readline()), process_names)
+
+
+def decode_record(record: dict, process_names: list[str]) -> dict:
+    return {
+        "id": record["id"],
+        "segments": [
+            {
+                "name": process_names[process_id],
+                "start": start,
+                "end": end,
+                "params": params,
+            }
+            for process_id, start, end, params in record["segments"]
+        ],
+    }
+
+
+def get_parameters_path(folder: str, parameters_name: str, metadata_format: str) -> str:
+    if metadata_format not in PARAMETERS_EXTENSIONS:
+        raise ValueError(f"Unknown metadata format: {metadata_format}")
+    return os.path.join(
+        folder,
+        os.path.splitext(parameters_name)[0] + PARAMETERS_EXTENSIONS[metadata_format],
+    )
+
+
+def get_parameters_writer(
+    parameters_path: str,
+    metadata_format: str,
+    process_names: list[str] | None = None,
+    position: dict | None = None,
+) -> "ParametersWriter":
+    if metadata_format == "json":
+        return JsonParametersWriter(parameters_path, position)
+    if metadata_format == "ndjson":
+        if process_names is None:
+            raise ValueError("Process names are required for ndjson metadata")
+        return NdjsonParametersWriter(parameters_path, process_names, position)
+    raise ValueError(f"Unknown metadata format: {metadata_format}")
+
+
+def save_values(
+    array: NDArrayFloat64T, values_path: str, values_format: str = "csv"
+) -> None:
+    with get_values_writer(
+        values_path, values_format, array.shape, array.dtype
+    ) as values_writer:
+        values_writer.write(array)
+
+
+def load_values(
+    values_path: str, values_format: str = "csv", concatenate: bool = False
+) -> NDArrayFloat64T | list[NDArrayFloat64T]:
+    """
+    Loads saved values, memory-mapped for the binary formats.
+
+    The chunked format is returned as the list of memory-mapped chunks.
+    With concatenate they are copied into a single in-memory array, so the
+    whole dataset has to fit in memory.
+    """
+    if values_format == "csv":
+        return np.genfromtxt(values_path)
+    if values_format == "npy":
+        return np.load(values_path, mmap_mode="r")
+    if values_format == "memmap":
+        header = load_header(values_path + HEADER_SUFFIX)
+        shape = tuple(header["shape"])
+        if shape[0] == 0:
+            return np.empty(shape=shape, dtype=header["dtype"])
+        return np.memmap(values_path, dtype=header["dtype"], mode="r", shape=shape)
+    if values_format == "chunked":
+        chunks = load_values_chunks(values_path)
+        if not concatenate:
+            return chunks
+        header = load_header(os.path.join(values_path, CHUNKS_INDEX_NAME))
+        if len(chunks) == 0:
+            return np.empty(shape=(0, header["num_columns"]), dtype=header["dtype"])
+        return np.concatenate(chunks)
+    raise ValueError(f"Unknown values format: {values_format}")
+
+
+def load_values_head(
+    values_path: str, values_format: str = "csv", num_rows: int = 1
+) -> NDArrayFloat64T:
+    if values_format == "csv":
+        return np.loadtxt(values_path, max_rows=num_rows, ndmin=2)
+    if values_format == "chunked":
+        head = []
+        num_loaded = 0
+        for chunk in load_values_chunks(values_path):
+            if num_loaded >= num_rows:
+                break
+            head.append(np.array(chunk[: num_rows - num_loaded]))
+            num_loaded += len(head[-1])
+        if len(head) > 0:
+            return np.concatenate(head)
+    return np.array(
+        load_values(values_path, values_format, concatenate=True)[:num_rows]
+    )
+
+
+def load_values_chunks(values_path: str) -> list[NDArrayFloat64T]:
+    header = load_header(os.path.join(values_path, CHUNKS_INDEX_NAME))
+    return [
+        np.load(os.path.join(values_path, chunk["file"]), mmap_mode="r")
+        for chunk in header["chunks"]
+    ]
+
+
+def load_header(header_path: str) -> dict:
+    with open(header_path, "r") as header_file:
+        return json.load(header_file)
+
+
+def get_values_path(folder: str, values_name: str, values_format: str) -> str:
+    if values_format not in VALUES_EXTENSIONS:
+        raise ValueError(f"Unknown values format: {values_format}")
+    return os.path.join(
+        folder, os.path.splitext(values_name)[0] + VALUES_EXTENSIONS[values_format]
+    )
+
+
+def get_values_writer(
+    values_path: str,
+    values_format: str,
+    shape: tuple[int, ...],
+    dtype: DTypeLike = np.float64,
+    position: dict | None = None,
+) -> "ValuesWriter":
+    if values_format == "csv":
+        return CsvValuesWriter(values_path, dtype, position)
+    if values_format == "npy":
+        return NpyValuesWriter(values_path, shape, dtype, position)
+    if values_format == "memmap":
+        return MemmapValuesWriter(values_path, dtype, position)
+    if values_format == "chunked":
+        return ChunkedValuesWriter(values_path, dtype, position)
+    raise ValueError(f"Unknown values format: {values_format}")
+
+
+class ValuesWriter(ABC):
+    """
+    Incremental writer of series values.
+
+    A writer created with a position returned by get_position reopens the
+    existing output, drops everything written after that position and
+    continues writing from it. Used as a context manager, the writer is
+    closed when the block succeeds and aborted when it raises, so that
+    an interrupted output is not finalized as if it were complete.
+    """
+
+    def __init__(
+        self,
+        values_path: str,
+        dtype: DTypeLike = np.float64,
+        position: dict | None = None,
+    ) -> None:
+        self.values_path = values_path
+        self.dtype = np.dtype(dtype)
+        self.num_rows = position["num_rows"] if position is not None else 0
+
+    @abstractmethod
+    def write(self, array: NDArrayFloat64T) -> None:
+        pass
+
+    def get_position(self) -> dict:
+        return {"num_rows": self.num_rows}
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        self.close()
+
+    def __enter__(self) -> "ValuesWriter":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class CsvValuesWriter(ValuesWriter):
+    def __init__(
+        self,
+        values_path: str,
+        dtype: DTypeLike = np.float64,
+        position: dict | None = None,
+    ) -> None:
+        super().__init__(values_path, dtype, position)
+        if position is not None:
+            os.truncate(values_path, position["offset"])
+        self.csv_file = open(values_path, "w" if position is None else "a")
+        self.value_format = CSV_VALUE_FORMATS[self.dtype.name]
+
+    def write(self, array: NDArrayFloat64T) -> None:
+        np.savetxt(self.csv_file, array, fmt=self.value_format)
+        self.num_rows += len(array)
+
+    def get_position(self) -> dict:
+        self.csv_file.flush()
+        return {"num_rows": self.num_rows, "offset": self.csv_file.tell()}
+
+    def close(self) -> None:
+        self.csv_file.close()
+
+
+class NpyValuesWriter(ValuesWriter):
+    def __init__(
+        self,
+        values_path: str,
+        shape: tuple[int, ...],
+        dtype: DTypeLike = np.float64,
+        position: dict | None = None,
+    ) -> None:
+        super().__init__(values_path, dtype, position)
+        if position is None:
+            self.values = np.lib.format.open_memmap(
+                values_path, mode="w+", dtype=self.dtype, shape=shape
+            )
+        else:
+            self.values = np.lib.format.open_memmap(values_path, mode="r+")
+
+    def write(self, array: NDArrayFloat64T) -> None:
+        self.values[self.num_rows : self.num_rows + len(array)] = array
+        self.num_rows += len(array)
+
+    def get_position(self) -> dict:
+        self.values.flush()
+        return super().get_position()
+
+    def close(self) -> None:
+        self.values.flush()
+
+
+class MemmapValuesWriter(ValuesWriter):
+    def __init__(
+        self,
+        values_path: str,
+        dtype: DTypeLike = np.float64,
+        position: dict | None = None,
+    ) -> None:
+        super().__init__(values_path, dtype, position)
+        self.num_columns = position["num_columns"] if position is not None else 0
+        if position is not None:
+            os.truncate(
+                values_path, self.num_rows * self.num_columns * self.dtype.itemsize
+            )
+        self.values_file = open(values_path, "wb" if position is None else "ab")
+
+    def write(self, array: NDArrayFloat64T) -> None:
+        self.values_file.write(np.ascontiguousarray(array, dtype=self.dtype).data)
+        self.num_rows += len(array)
+        self.num_columns = array.shape[1]
+
+    def get_position(self) -> dict:
+        self.values_file.flush()
+        return {"num_rows": self.num_rows, "num_columns": self.num_columns}
+
+    def write_header(self) -> None:
+        header = {
+            "dtype": self.dtype.str,
+            "shape": [self.num_rows, self.num_columns],
+        }
+        with open(self.values_path + HEADER_SUFFIX, "w") as header_file:
+            json.dump(header, header_file)
+
+    def close(self) -> None:
+        self.write_header()
+        self.values_file.close()
+
+    def abort(self) -> None:
+        self.values_file.close()
+
+
+class ChunkedValuesWriter(ValuesWriter):
+    def __init__(
+        self,
+        values_path: str,
+        dtype: DTypeLike = np.float64,
+        position: dict | None = None,
+    ) -> None:
+        super().__init__(values_path, dtype, position)
+        os.makedirs(values_path, exist_ok=True)
+        self.chunks: list[dict] = []
+        self.num_columns = 0
+        if position is not None:
+            index = load_header(os.path.join(values_path, CHUNKS_INDEX_NAME))
+            self.chunks = index["chunks"][: position["num_chunks"]]
+            self.num_columns = index["num_columns"]
+        self.remove_unindexed_chunks()
+
+    def write(self, array: NDArrayFloat64T) -> None:
+        chunk_name = f"{CHUNK_NAME_PREFIX}{len(self.chunks):06d}.npy"
+        np.save(
+            os.path.join(self.values_path, chunk_name),
+            np.asarray(array, dtype=self.dtype),
+        )
+        self.chunks.append(
+            {"file": chunk_name, "start": self.num_rows, "rows": len(array)}
+        )
+        self.num_rows += len(array)
+        self.num_columns = array.shape[1]
+        self.write_index()
+
+    def get_position(self) -> dict:
+        return {"num_rows": self.num_rows, "num_chunks": len(self.chunks)}
+
+    def remove_unindexed_chunks(self) -> None:
+        chunk_names = {chunk["file"] for chunk in self.chunks}
+        for file_name in os.listdir(self.values_path):
+            if file_name.startswith(CHUNK_NAME_PREFIX) and file_name not in chunk_names:
+                os.remove(os.path.join(self.values_path, file_name))
+
+    def write_index(self) -> None:
+        index = {
+            "dtype": self.dtype.str,
+            "num_columns": self.num_columns,
+            "num_rows": self.num_rows,
+            "chunks": self.chunks,
+        }
+        with open(os.path.join(self.values_path, CHUNKS_INDEX_NAME), "w") as index_file:
+            json.dump(index, index_file)
 
+    def close(self) -> None:
+        self.write_index()
 
-def load_values(csv_path: str) -> NDArrayFloat64T:
-    return np.genfromtxt(csv_path)
+    def abort(self) -> None:
+        pass
 
 
-def get_json_data(ts_list: list[TimeSeries]) -> dict:
+def get_json_data(ts_list: list[TimeSeries], start_index: int = 0) -> dict:
     json_data = {}
     for i in range(len(ts_list)):
-        last_steps = 0
-        time_series = ts_list[i]
-        ts_json_data = []
-        ts_name = f"ts_{i + 1}"
-        for j in range(len(time_series.metadata)):
-            current_metadata = time_series.metadata[j]
-            current_process_data = current_metadata[1]
-            current_process_name = current_metadata[0]
-            process_json_data = {
-                "name": current_process_name,
-                "start": last_steps,
-                "end": current_process_data[0] + last_steps - 1,
-                "params": current_process_data[1].tolist(),
-            }
-            ts_json_data.append(process_json_data)
-            last_steps = current_process_data[0] + last_steps
-        json_data[ts_name] = ts_json_data
+        ts_name = f"ts_{start_index + i + 1}"
+        json_data[ts_name] = get_ts_json_data(ts_list[i])
     return json_data
 
 
-def save_plot(
-    coordinates: NDArrayFloat64T,
-    clusters: NDArray[np.int_],
-    border_values: tuple[float, float],
-    shift: float,
-    time_series_array: NDArrayFloat64T,
-    save_plot_path=None,
-) -> None:
-    fig = plt.figure(figsize=(12, 5))
-    fig.suptitle("Generated time series with parameters clustering")
-
-    ax_graph = fig.add_subplot(1, 2, 1)
-    colors = ["blue", "red", "green"]
-    for i in range(5):
-        time_series = time_series_array[i]
-        ax_graph.text(100, time_series[-1], f"TS {i}")
-        ax_graph.plot(time_series, color=colors[clusters[i]])
-    ax_graph.grid(True)
-    ax_graph.set_xlabel("time")
-    ax_graph.set_ylabel("values")
-
-    ax_sphere: Axes3D = fig.add_subplot(1, 2, 2, projection="3d")
-
-    phi = np.linspace(0, np.pi, 20)
-    theta = np.linspace(0, 2 * np.pi, 40)
-    x = np.outer(np.sin(theta), np.cos(phi))
-    y = np.outer(np.sin(theta), np.sin(phi))
-    z = np.outer(np.cos(theta), np.ones_like(phi))
-    x += shift
-    y += shift
-    z += shift
-
-    ax_sphere.plot_wireframe(x, y, z, color="grey", alpha=0.3)
-    for i in range(5):
-        ax_sphere.scatter(
-            coordinates[i][0],
-            coordinates[i][1],
-            coordinates[i][2],
-            color=colors[clusters[i]],
+def get_schedule_json_data(schedule_batch: ScheduleBatch, start_index: int = 0) -> dict:
+    return {
+        f"ts_{start_index + i + 1}": [
+            {
+                "name": schedule_batch.process_names[process_id],
+                "start": start,
+                "end": end,
+                "params": parameters,
+            }
+            for process_id, start, end, parameters in segments
+        ]
+        for i, segments in enumerate(schedule_batch.get_segment_records())
+    }
+
+
+def get_process_names(ts_list: list[TimeSeries]) -> list[str]:
+    process_names: dict[str, None] = {}
+    for time_series in ts_list:
+        for process_name, _ in time_series.metadata:
+            process_names.setdefault(process_name)
+    return list(process_names)
+
+
+def get_ts_json_data(time_series: TimeSeries) -> list[dict]:
+    last_steps = 0
+    ts_json_data = []
+    for j in range(len(time_series.metadata)):
+        current_metadata = time_series.metadata[j]
+        current_process_data = current_metadata[1]
+        current_process_name = current_metadata[0]
+        process_json_data = {
+            "name": current_process_name,
+            "start": last_steps,
+            "end": current_process_data[0] + last_steps - 1,
+            "params": current_process_data[1].tolist(),
+        }
+        ts_json_data.append(process_json_data)
+        last_steps = current_process_data[0] + last_steps
+    return ts_json_data
+
+
+class ParametersWriter(ABC):
+    """
+    Incremental writer of series schedules, resumable from a position
+    returned by get_position and aborted on errors like ValuesWriter.
+    """
+
+    def __init__(self, parameters_path: str, position: dict | None = None) -> None:
+        self.parameters_path = parameters_path
+        self.num_written = position["num_written"] if position is not None else 0
+
+    @abstractmethod
+    def write(self, schedule_batch: ScheduleBatch, start_index: int) -> None:
+        pass
+
+    @abstractmethod
+    def get_position(self) -> dict:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        self.close()
+
+    def check_start_index(self, start_index: int) -> None:
+        if start_index != self.num_written:
+            raise ValueError(
+                f"Chunk starts at {start_index}, "
+                f"but {self.num_written} time series are written"
+            )
+
+    def __enter__(self) -> "ParametersWriter":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class JsonParametersWriter(ParametersWriter):
+    def __init__(self, parameters_path: str, position: dict | None = None) -> None:
+        super().__init__(parameters_path, position)
+        if position is None:
+            self.json_file = open(parameters_path, "w")
+            self.json_file.write("{")
+        else:
+            os.truncate(parameters_path, position["offset"])
+            self.json_file = open(parameters_path, "a")
+
+    def write(self, schedule_batch: ScheduleBatch, start_index: int) -> None:
+        self.check_start_index(start_index)
+        json_data = get_schedule_json_data(schedule_batch, start_index)
+        for ts_name, ts_json_data in json_data.items():
+            entry = json.dumps({ts_name: ts_json_data}, indent=4)[1:-2]
+            self.json_file.write(("," if self.num_written > 0 else "") + entry)
+            self.num_written += 1
+
+    def get_position(self) -> dict:
+        self.json_file.flush()
+        return {"num_written": self.num_written, "offset": self.json_file.tell()}
+
+    def close(self) -> None:
+        self.json_file.write("\n}" if self.num_written > 0 else "}")
+        self.json_file.close()
+
+    def abort(self) -> None:
+        self.json_file.close()
+
+
+class NdjsonParametersWriter(ParametersWriter):
+    def __init__(
+        self,
+        parameters_path: str,
+        process_names: list[str],
+        position: dict | None = None,
+    ) -> None:
+        super().__init__(parameters_path, position)
+        self.process_ids = {name: i for i, name in enumerate(process_names)}
+        offsets_path = parameters_path + OFFSETS_SUFFIX
+        if position is None:
+            self.parameters_file = open(parameters_path, "wb")
+            self.offsets_file = open(offsets_path, "wb")
+            header = json.dumps({"processes": process_names}, separators=(",", ":"))
+            self.parameters_file.write(header.encode() + b"\n")
+        else:
+            os.truncate(parameters_path, position["offset"])
+            os.truncate(offsets_path, self.num_written * np.dtype(np.int64).itemsize)
+            self.parameters_file = open(parameters_path, "ab")
+            self.offsets_file = open(offsets_path, "ab")
+
+    def write(self, schedule_batch: ScheduleBatch, start_index: int) -> None:
+        self.check_start_index(start_index)
+        process_ids = self.get_process_ids(schedule_batch.process_names)
+        offsets = np.zeros(schedule_batch.num_series, dtype=np.int64)
+        lines = []
+        offset = self.parameters_file.tell()
+        for i, segments in enumerate(schedule_batch.get_segment_records()):
+            for segment in segments:
+                segment[0] = process_ids[segment[0]]
+            record = {"id": start_index + i, "segments": segments}
+            line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+            offsets[i] = offset
+            offset += len(line)
+            lines.append(line)
+        self.parameters_file.write(b"".join(lines))
+        self.offsets_file.write(offsets.tobytes())
+        self.num_written += schedule_batch.num_series
+
+    def get_position(self) -> dict:
+        self.parameters_file.flush()
+        self.offsets_file.flush()
+        return {"num_written": self.num_written, "offset": self.parameters_file.tell()}
+
+    def get_process_ids(self, process_names: list[str]) -> list[int]:
+        process_ids = []
+        for process_name in process_names:
+            if process_name not in self.process_ids:
+                raise ValueError(f"Process {process_name} is not in process names")
+            process_ids.append(self.process_ids[process_name])
+        return process_ids
+
+    def close(self) -> None:
+        self.parameters_file.close()
+        self.offsets_file.close()
+
+
+class ChunkWriter:
+    """
+    Writes each chunk of values and schedules with a pair of writers.
+
+    on_written is called with the index after the last written series and
+    the writer positions once a chunk is completely written.
+    """
+
+    def __init__(
+        self,
+        parameters_writer: ParametersWriter,
+        values_writer: ValuesWriter,
+        on_written: Callable[[int, dict], None] | None = None,
+    ) -> None:
+        self.parameters_writer = parameters_writer
+        self.values_writer = values_writer
+        self.on_written = on_written
+
+    def write(
+        self,
+        ts_array: NDArrayFloat64T,
+        schedule_batch: ScheduleBatch,
+        start_index: int,
+    ) -> None:
+        self.write_parameters(schedule_batch, start_index)
+        self.write_values(ts_array)
+        if self.on_written is not None:
+            self.on_written(
+                start_index + len(ts_array),
+                {
+                    "parameters": self.parameters_writer.get_position(),
+                    "values": self.values_writer.get_position(),
+                },
+            )
+
+    def write_parameters(self, schedule_batch: ScheduleBatch, start_index: int) -> None:
+        with profile_stage("write_parameters", items=schedule_batch.num_series):
+            self.parameters_writer.write(schedule_batch, start_index)
+
+    def write_values(self, ts_array: NDArrayFloat64T) -> None:
+        with profile_stage("write_values", items=len(ts_array)):
+            self.values_writer.write(ts_array)
+
+    def close(self) -> None:
+        self.parameters_writer.close()
+        self.values_writer.close()
+
+    def abort(self) -> None:
+        self.parameters_writer.abort()
+        self.values_writer.abort()
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class BackgroundWriter:
+    """
+    Thread that calls a write function for queued arguments in order.
+
+    The queue is bounded, so put blocks while the thread is behind by
+    queue_size items. An error of the write function is raised by the next
+    put or by close; items queued after the error are dropped.
+    """
+
+    def __init__(
+        self,
+        write: Callable[..., None],
+        queue_size: int = DEFAULT_WRITE_QUEUE_SIZE,
+    ) -> None:
+        self.write = write
+        self.queue: queue.Queue[tuple | None] = queue.Queue(maxsize=queue_size)
+        self.error: BaseException | None = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        while True:
+            args = self.queue.get()
+            if args is None:
+                return
+            if self.error is None:
+                try:
+                    self.write(*args)
+                except BaseException as error:
+                    self.error = error
+
+    def put(self, *args) -> None:
+        self.check_error()
+        self.queue.put(args)
+
+    def join(self) -> None:
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def check_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+
+class AsyncChunkWriter(ChunkWriter):
+    """
+    Chunk writer that writes parameters and values in two background threads,
+    so a chunk is written while the next one is generated.
+
+    Each thread takes its writer position right after writing its part of a
+    chunk, and on_written is called when both parts of the chunk are written.
+    """
+
+    def __init__(
+        self,
+        parameters_writer: ParametersWriter,
+        values_writer: ValuesWriter,
+        queue_size: int = DEFAULT_WRITE_QUEUE_SIZE,
+        on_written: Callable[[int, dict], None] | None = None,
+    ) -> None:
+        super().__init__(parameters_writer, values_writer, on_written)
+        self.lock = threading.Lock()
+        self.written_positions: dict[int, dict] = {}
+        self.parameters_thread = BackgroundWriter(
+            self.write_parameters_part, queue_size
         )
-    ax_sphere.set_zlim(border_values[0], border_values[1])
-    if save_plot_path is None:
-        plt.show()
-    else:
-        plt.savefig(save_plot_path)
+        self.values_thread = BackgroundWriter(self.write_values_part, queue_size)
+
+    def write(
+        self,
+        ts_array: NDArrayFloat64T,
+        schedule_batch: ScheduleBatch,
+        start_index: int,
+    ) -> None:
+        stop_index = start_index + len(ts_array)
+        self.parameters_thread.put(schedule_batch, start_index, stop_index)
+        self.values_thread.put(ts_array, stop_index)
+
+    def write_parameters_part(
+        self, schedule_batch: ScheduleBatch, start_index: int, stop_index: int
+    ) -> None:
+        self.write_parameters(schedule_batch, start_index)
+        if self.on_written is not None:
+            self.add_position(
+                stop_index, "parameters", self.parameters_writer.get_position()
+            )
+
+    def write_values_part(self, ts_array: NDArrayFloat64T, stop_index: int) -> None:
+        self.write_values(ts_array)
+        if self.on_written is not None:
+            self.add_position(stop_index, "values", self.values_writer.get_position())
+
+    def add_position(self, stop_index: int, name: str, position: dict) -> None:
+        with self.lock:
+            positions = self.written_positions.setdefault(stop_index, {})
+            positions[name] = position
+            if len(positions) == 2 and self.on_written is not None:
+                del self.written_positions[stop_index]
+                self.on_written(stop_index, positions)
+
+    def close(self) -> None:
+        self.join()
+        try:
+            self.parameters_thread.check_error()
+            self.values_thread.check_error()
+        except BaseException:
+            super().abort()
+            raise
+        super().close()
+
+    def abort(self) -> None:
+        self.join()
+        super().abort()
+
+    def join(self) -> None:
+        self.parameters_thread.join()
+        self.values_thread.join()
+
+
+def get_chunk_writer(
+    parameters_writer: ParametersWriter,
+    values_writer: ValuesWriter,
+    queue_size: int = DEFAULT_WRITE_QUEUE_SIZE,
+    on_written: Callable[[int, dict], None] | None = None,
+) -> ChunkWriter:
+    if queue_size > 0:
+        return AsyncChunkWriter(
+            parameters_writer, values_writer, queue_size, on_written
+        )
+    return ChunkWriter(parameters_writer, values_writer, on_written)
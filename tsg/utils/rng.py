@@ -0,0 +1,40 @@
+import numpy as np
+
+from tsg.utils.typing import NDArrayFloat64T
+
+DEFAULT_BIT_GENERATOR = "PCG64"
+BIT_GENERATORS = {
+    "PCG64": np.random.PCG64,
+    "PCG64DXSM": np.random.PCG64DXSM,
+    "Philox": np.random.Philox,
+    "SFC64": np.random.SFC64,
+    "MT19937": np.random.MT19937,
+}
+
+
+def create_rng(
+    seed: int | None = None, bit_generator: str = DEFAULT_BIT_GENERATOR
+) -> np.random.Generator:
+    if bit_generator not in BIT_GENERATORS:
+        raise ValueError(f"Unknown bit generator: {bit_generator}")
+    return np.random.Generator(
+        BIT_GENERATORS[bit_generator](np.random.SeedSequence(seed))
+    )
+
+
+def get_rng(rng: np.random.Generator | None = None) -> np.random.Generator:
+    """
+    Returns rng, or a new generator seeded from the legacy global numpy
+    state when it is None, so that np.random.seed still makes callers that
+    do not pass an rng reproducible.
+    """
+    if rng is not None:
+        return rng
+    return np.random.default_rng(np.random.randint(np.iinfo(np.int64).max))
+
+
+def fill_standard_normal(rng: np.random.Generator, out: NDArrayFloat64T) -> None:
+    if out.flags.c_contiguous and out.dtype == np.float64:
+        rng.standard_normal(out=out)
+    else:
+        out[...] = rng.standard_normal(out.shape)
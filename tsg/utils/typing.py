@@ -8,3 +8,13 @@ ProcessParametersT = list[ParametersStepsT]
 ProcessOrderT = list[tuple[int, str]]
 ProcessDataT = tuple[str, ProcessParametersT]
 ProcessConfigT = tuple[str, ParametersStepsT]
+LayoutT = tuple[tuple[str, int], ...]
+ParameterSpecsT = NDArray[np.void]
+
+FLOAT_DTYPES = {"float32": np.float32, "float64": np.float64}
+
+
+def get_float_dtype(dtype_name: str) -> np.dtype:
+    if dtype_name not in FLOAT_DTYPES:
+        raise ValueError(f"Unknown dtype: {dtype_name}")
+    return np.dtype(FLOAT_DTYPES[dtype_name])
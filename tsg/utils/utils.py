@@ -1,12 +1,6 @@
 import os
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-import numpy as np
-from networkx import Graph
-
-from tsg.utils.typing import NDArrayFloat64T
-
 
 def info_to_string(info: dict) -> str:
     line = ""
@@ -16,6 +10,8 @@ def info_to_string(info: dict) -> str:
 
 
 def draw_process_plot(values, info, path=None) -> None:
+    import matplotlib.pyplot as plt
+
     plt.plot(values)
     plt.title(info["name"])
     plt.xlabel("timestamp")